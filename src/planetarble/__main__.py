@@ -0,0 +1,7 @@
+"""Allow ``python -m planetarble`` to run the CLI."""
+
+import sys
+
+from planetarble.cli.main import main
+
+sys.exit(main())
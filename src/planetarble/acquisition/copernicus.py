@@ -606,6 +606,9 @@ def _format_bbox(minx: float, miny: float, maxx: float, maxy: float) -> str:
     return f"{minx:.6f},{miny:.6f},{maxx:.6f},{maxy:.6f}"
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slugify(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+    slug = _SLUG_RE.sub("_", value.lower()).strip("_")
     return slug or "layer"
@@ -50,6 +50,7 @@ def fetch_gsi_ortho_clip(
     gdal_translate: str = "gdal_translate",
     gdal_buildvrt: str = "gdalbuildvrt",
     gdal_warp: str = "gdalwarp",
+    num_threads: str | None = "ALL_CPUS",
     timeout: int = 30,
     dry_run: bool = False,
 ) -> Dict[str, object]:
@@ -109,6 +110,7 @@ def fetch_gsi_ortho_clip(
                 bbox=bbox,
                 destination=output_path,
                 gdal_warp=gdal_warp,
+                num_threads=num_threads,
             )
     else:
         cache_dir.mkdir(parents=True, exist_ok=True)
@@ -127,6 +129,7 @@ def fetch_gsi_ortho_clip(
             bbox=bbox,
             destination=output_path,
             gdal_warp=gdal_warp,
+            num_threads=num_threads,
         )
 
     LOGGER.info(
@@ -238,6 +241,7 @@ def _warp_to_output(
     bbox: Tuple[float, float, float, float],
     destination: Path,
     gdal_warp: str,
+    num_threads: str | None = None,
 ) -> None:
     min_lon, min_lat, max_lon, max_lat = bbox
     command = [
@@ -262,9 +266,10 @@ def _warp_to_output(
         "QUALITY=95",
         "-co",
         "BLOCKSIZE=512",
-        str(source_vrt),
-        str(destination),
     ]
+    if num_threads:
+        command.extend(["-multi", "-wo", f"NUM_THREADS={num_threads}", "-co", f"NUM_THREADS={num_threads}"])
+    command.extend([str(source_vrt), str(destination)])
     LOGGER.info("gsi warp command", extra={"command": " ".join(command)})
     _run(command, "warp GSI mosaic")
 
@@ -345,7 +350,9 @@ def _format_duration(seconds: float) -> str:
 def _run(command: Sequence[str], description: str) -> None:
     import subprocess
 
+    from planetarble.core.gdal_env import gdal_env
+
     try:
-        subprocess.run(command, check=True)
+        subprocess.run(command, check=True, env=gdal_env())
     except subprocess.CalledProcessError as exc:  # pragma: no cover - external deps
         raise GSIError(f"{description} failed: {exc}") from exc
@@ -0,0 +1,95 @@
+"""Seekable read-only file over HTTP ``Range`` requests."""
+
+from __future__ import annotations
+
+import io
+from typing import Optional
+
+import requests
+
+_DEFAULT_TIMEOUT = 60
+
+
+def is_url(value: object) -> bool:
+    return isinstance(value, str) and value.startswith(("http://", "https://"))
+
+
+class RangeHTTPFile(io.RawIOBase):
+    """Read a remote file lazily, one ``Range`` request per ``readinto``.
+
+    Wrap it in ``io.BufferedReader`` so small reads coalesce into large ranges.
+    ``zipfile.ZipFile`` only seeks to the central directory and the members it
+    opens, so archives can be extracted without downloading them first.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        session: Optional[requests.Session] = None,
+        timeout: float = _DEFAULT_TIMEOUT,
+    ) -> None:
+        super().__init__()
+        self._session = session or requests.Session()
+        self._timeout = timeout
+        response = self._session.head(url, allow_redirects=True, timeout=timeout)
+        response.raise_for_status()
+        length = response.headers.get("Content-Length")
+        if length is None:
+            raise OSError(f"server did not report a length for {url}")
+        self._url = response.url or url
+        self._size = int(length)
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        if self._position >= self._size or not len(buffer):
+            return 0
+        end = min(self._position + len(buffer), self._size) - 1
+        response = self._session.get(
+            self._url,
+            headers={"Range": f"bytes={self._position}-{end}"},
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise OSError(f"server ignored the range request for {self._url}")
+        expected = f"bytes {self._position}-{end}/"
+        content_range = response.headers.get("Content-Range", "")
+        if not content_range.startswith(expected):
+            raise OSError(
+                f"server answered {content_range or 'no Content-Range'} for bytes={self._position}-{end} of {self._url}"
+            )
+        data = response.content
+        count = len(data)
+        if count != end - self._position + 1:
+            raise OSError(f"short range response ({count} bytes) for bytes={self._position}-{end} of {self._url}")
+        buffer[:count] = data
+        self._position += count
+        return count
@@ -52,6 +52,7 @@ class AcquisitionManager(DataAcquisition):
         catalog: Optional[AssetCatalog] = None,
         manifest_path: Optional[Path] = None,
         use_aria2: bool = False,
+        aria2_extra_flags: Iterable[str] = (),
     ) -> None:
         self._data_directory = data_directory
         self._catalog = catalog or AssetCatalog.load_default()
@@ -59,6 +60,7 @@ class AcquisitionManager(DataAcquisition):
             data_directory,
             self._catalog,
             use_aria2=use_aria2,
+            aria2_extra_flags=aria2_extra_flags,
         )
         self._manifest_path = manifest_path
         _load_dotenv_if_present()
@@ -571,12 +573,10 @@ def _load_dotenv_if_present() -> None:
             stripped = line.strip()
             if not stripped or stripped.startswith("#"):
                 continue
-            if "=" not in stripped:
+            key, sep, value = stripped.partition("=")
+            if not sep:
                 continue
-            key, value = stripped.split("=", 1)
-            key = key.strip()
-            value = value.strip().strip('"')
-            os.environ.setdefault(key, value)
+            os.environ.setdefault(key.strip(), value.strip().strip('"'))
     except OSError as exc:  # pragma: no cover - filesystem errors
         LOGGER.warning("Failed to read .env file", extra={"path": str(env_path), "error": str(exc)})
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-from datetime import timezone
 from pathlib import Path
 from typing import Dict, Mapping
 
@@ -38,10 +37,9 @@ def build_manifest(
 
 
 def manifest_to_dict(manifest: AssetManifest) -> Dict[str, object]:
-    created_at = manifest.created_at.replace(tzinfo=timezone.utc).isoformat()
     return {
         "version": manifest.version,
-        "created_at": created_at,
+        "created_at": manifest.created_at.isoformat(),
         "generation_params": manifest.generation_params,
         "sources": {
             key: _asset_source_to_dict(value) for key, value in manifest.sources.items()
@@ -27,6 +27,7 @@ except Exception as exc:  # pragma: no cover
     _PYSTAC_IMPORT_ERROR = exc
     _PYSTAC_ERRORS = (Exception,)
 
+from planetarble.core.gdal_env import gdal_env
 from planetarble.logging import get_logger
 
 
@@ -64,6 +65,7 @@ def fetch_true_color_tile(
     start_datetime: Optional[str] = None,
     end_datetime: Optional[str] = None,
     gdal_translate: str = "gdal_translate",
+    num_threads: Optional[str] = "ALL_CPUS",
     timeout: int = 60,
     dry_run: bool = False,
 ) -> Dict[str, object]:
@@ -122,6 +124,7 @@ def fetch_true_color_tile(
         signed_url=signed_url,
         bbox=bbox,
         destination=output_path,
+        num_threads=num_threads,
     )
 
     LOGGER.info(
@@ -135,7 +138,7 @@ def fetch_true_color_tile(
     )
     if not dry_run:
         try:
-            subprocess.run(command, check=True)
+            subprocess.run(command, check=True, env=gdal_env())
         except subprocess.CalledProcessError as exc:  # pragma: no cover - requires GDAL runtime
             raise MPCError(f"gdal_translate failed: {exc}") from exc
         LOGGER.info(
@@ -258,9 +261,10 @@ def build_clip_command(
     signed_url: str,
     bbox: Iterable[float],
     destination: Path,
+    num_threads: Optional[str] = None,
 ) -> list[str]:
     minx, miny, maxx, maxy = bbox
-    return [
+    command = [
         gdal_translate,
         "-projwin",
         str(minx),
@@ -275,9 +279,11 @@ def build_clip_command(
         "COMPRESS=JPEG",
         "-co",
         "QUALITY=95",
-        signed_url,
-        str(destination),
     ]
+    if num_threads:
+        command.extend(["-co", f"NUM_THREADS={num_threads}"])
+    command.extend([signed_url, str(destination)])
+    return command
 
 
 def _bbox_from_point(*, lat: float, lon: float, width_m: float, height_m: float) -> tuple[float, float, float, float]:
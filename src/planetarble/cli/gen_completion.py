@@ -0,0 +1,81 @@
+"""Generate a static bash completion script for the Planetarble CLI.
+
+Usage::
+
+    python -m planetarble.cli.gen_completion > planetarble.bash
+
+The script is derived from the fully built argparse tree once, so completing
+``planetarble <TAB>`` never starts a Python interpreter.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Iterator
+
+from planetarble.cli.main import build_parser
+
+_TEMPLATE = """\
+# bash completion for planetarble (generated by planetarble.cli.gen_completion)
+_planetarble() {{
+    local cur path word
+    cur="${{COMP_WORDS[COMP_CWORD]}}"
+    path=""
+    for word in "${{COMP_WORDS[@]:1:COMP_CWORD-1}}"; do
+        case "$word" in
+            -*) ;;
+            *)
+                case "${{path:+$path }}$word" in
+{paths}
+                esac
+                ;;
+        esac
+    done
+    case "$path" in
+{cases}
+    esac
+}}
+complete -o default -F _planetarble planetarble
+"""
+
+
+def _subparsers(parser: argparse.ArgumentParser) -> dict[str, argparse.ArgumentParser]:
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return dict(action.choices)
+    return {}
+
+
+def _options(parser: argparse.ArgumentParser) -> list[str]:
+    return [flag for action in parser._actions for flag in action.option_strings if flag.startswith("--")]
+
+
+def _walk(parser: argparse.ArgumentParser, path: str = "") -> Iterator[tuple[str, list[str]]]:
+    children = _subparsers(parser)
+    yield path, sorted(children) + _options(parser)
+    for name, child in children.items():
+        yield from _walk(child, f"{path} {name}".strip())
+
+
+def render(parser: argparse.ArgumentParser | None = None) -> str:
+    """Return the bash completion script for ``parser`` (the full CLI by default)."""
+
+    entries = list(_walk(parser or build_parser()))
+    paths = "\n".join(
+        f'                    "{path}") path="{path}" ;;' for path, _ in entries if path
+    )
+    cases = "\n".join(
+        f'        "{path}") COMPREPLY=($(compgen -W "{" ".join(words)}" -- "$cur")) ;;'
+        for path, words in entries
+    )
+    return _TEMPLATE.format(paths=paths, cases=cases)
+
+
+def main() -> int:
+    sys.stdout.write(render())
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -3,543 +3,789 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
 import json
-import http.server
+import fnmatch
 import functools
+import logging
 import os
 import re
 import shutil
-import sqlite3
 import subprocess
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Optional
-
-from planetarble.acquisition import (
-    AcquisitionManager,
-    CopernicusAccessError,
-    CopernicusAuthError,
-    CopernicusCredentialsMissing,
-    GSIError,
-    MPCError,
-    fetch_gsi_ortho_clip,
-    fetch_true_color_tile,
-    get_available_layers,
-    split_plan_by_miniplanet,
-    verify_copernicus_connection,
-)
-from planetarble.config import PipelineConfig, load_config
-from planetarble.core.models import CopernicusLayerConfig, ProcessingConfig, TileMetadata
-from planetarble.logging import configure_logging, get_logger, log_skip
-from planetarble.packaging import PackagingManager
-from planetarble.processing import ProcessingManager
-from planetarble.tiling import PmtilesTilingManager, TilingManager
-from planetarble.tiling.mbtiles import merge_mbtiles, union_mbtiles
-
-LOGGER = get_logger(__name__)
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, Sequence
+
+if TYPE_CHECKING:
+    from planetarble.acquisition import AcquisitionManager
+    from planetarble.config import PipelineConfig
+    from planetarble.core.models import CopernicusLayerConfig, GSIOrthophotoConfig, HLSPlanRegion
+
+
+def _logger() -> logging.Logger:
+    """Return the CLI logger without importing the pipeline packages eagerly."""
+
+    from planetarble.logging import get_logger
+
+    return get_logger(__name__)
+
+
+_ENV_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"?([^"\r\n]*?)"?[ \t\r]*$', re.M)
 
 
 def _load_env() -> None:
     env_path = Path.cwd() / ".env"
-    if not env_path.exists():
-        return
     try:
-        for line in env_path.read_text(encoding="utf-8").splitlines():
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            if "=" not in stripped:
-                continue
-            key, value = stripped.split("=", 1)
-            key = key.strip()
-            value = value.strip().strip('"')
-            os.environ.setdefault(key, value)
+        text = env_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return
     except OSError as exc:  # pragma: no cover - filesystem errors
-        LOGGER.warning("Failed to load .env file", extra={"path": str(env_path), "error": str(exc)})
+        _logger().warning("Failed to load .env file", extra={"path": str(env_path), "error": str(exc)})
+        return
+    values = {match.group(1): match.group(2) for match in _ENV_RE.finditer(text)}
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
+# Subcommands that never read the environment (no credentials, no GDAL children);
+# every other command loads .env so credentials and GDAL_* overrides apply.
+_NO_ENV_COMMANDS = frozenset({"serve", "split-plan"})
+
+
+# (flags, add_argument keyword arguments)
+_ArgSpec = tuple[tuple[str, ...], dict[str, object]]
+
+_TILING_SUBCOMMANDS: dict[str, tuple[str, tuple[_ArgSpec, ...]]] = {
+    "pmtiles": (
+        "Convert a raster into PMTiles via XYZ and MBTiles",
+        (
+            (("--input",), {"type": Path, "required": True, "help": "Source raster path"}),
+            (
+                ("--out",),
+                {
+                    "type": Path,
+                    "required": True,
+                    "help": "Destination directory for PMTiles and intermediate artifacts",
+                },
+            ),
+            (("--min-zoom",), {"type": int, "default": None, "help": "Minimum zoom level (default: config or 0)"}),
+            (("--max-zoom",), {"type": int, "default": None, "help": "Maximum zoom level"}),
+            (("--format",), {"choices": ["png", "jpg", "webp"], "default": None, "help": "Tile image format"}),
+            (("--quality",), {"type": int, "default": None, "help": "Compression quality for JPEG/WEBP tiles"}),
+            (
+                ("--resampling",),
+                {
+                    "default": None,
+                    "help": "Resampling kernel for gdal raster tile (default: config value)",
+                },
+            ),
+            (("--name",), {"default": None, "help": "Human-readable tileset name"}),
+            (("--attribution",), {"default": None, "help": "Attribution string embedded into MBTiles metadata"}),
+            (
+                ("--bounds-mode",),
+                {
+                    "choices": ["auto", "global"],
+                    "default": "auto",
+                    "help": "Strategy to derive bounds metadata",
+                },
+            ),
+            (
+                ("--no-deduplication",),
+                {
+                    "action": "store_true",
+                    "help": "Disable PMTiles deduplication during conversion",
+                },
+            ),
+            (("--cluster",), {"action": "store_true", "help": "Run pmtiles cluster after conversion"}),
+            (
+                ("--temp-dir",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Temporary workspace directory (defaults to <out>/tmp)",
+                },
+            ),
+            (
+                ("--drop-mbtiles",),
+                {
+                    "action": "store_true",
+                    "help": "Pack the intermediate MBTiles on scratch space and delete it after conversion",
+                },
+            ),
+            (
+                ("--scratch-dir",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": (
+                        "Scratch directory for --drop-mbtiles "
+                        "(default: /dev/shm when it has room, else the temp dir)"
+                    ),
+                },
+            ),
+            (("--dry-run",), {"action": "store_true", "help": "Print commands without executing them"}),
+        ),
+    ),
+    "merge-mbtiles": (
+        "Overlay tiles from one MBTiles archive onto another",
+        (
+            (("--base",), {"type": Path, "required": True, "help": "Base MBTiles archive"}),
+            (("--overlay",), {"type": Path, "required": True, "help": "Overlay MBTiles archive"}),
+            (("--out",), {"type": Path, "required": True, "help": "Output MBTiles archive"}),
+        ),
+    ),
+    "union-mbtiles": (
+        "Union several MBTiles into one in a single pass (for disjoint Quadrans pieces)",
+        (
+            (
+                ("--inputs",),
+                {
+                    "type": Path,
+                    "nargs": "+",
+                    "required": True,
+                    "help": "Input MBTiles archives (pass the LARGEST first — it becomes the copy base)",
+                },
+            ),
+            (("--out",), {"type": Path, "required": True, "help": "Output MBTiles archive"}),
+            (
+                ("--chunk-size",),
+                {
+                    "type": int,
+                    "default": 50000,
+                    "help": "Rows per commit when appending non-base inputs (bounds journal growth)",
+                },
+            ),
+        ),
+    ),
+    "stitch-512": (
+        "Build a 512px pyramid from a 256px source (output zoom z <- source zoom z+1)",
+        (
+            (("--source",), {"type": Path, "required": True, "help": "256px source MBTiles"}),
+            (("--out",), {"type": Path, "required": True, "help": "Output 512px MBTiles"}),
+            (("--format",), {"default": "jpg", "help": "Output tile format (default jpg)"}),
+            (("--quality",), {"type": int, "default": 90, "help": "JPEG/WebP quality (default 90)"}),
+            (
+                ("--workers",),
+                {
+                    "type": int,
+                    "default": 1,
+                    "help": "Parallel processes (CPU-bound; shards are unioned at the end)",
+                },
+            ),
+            (
+                ("--shard-dir",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Dir for worker shards (default: next to --out; put on a separate disk to split shards/output)",
+                },
+            ),
+        ),
+    ),
+}
+
+
+_SUBCOMMANDS: dict[str, tuple[str, tuple[_ArgSpec, ...]]] = {
+    "acquire": (
+        "Download source datasets and emit manifest",
+        (
+            (
+                ("--config",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Path to pipeline configuration file (YAML or JSON)",
+                },
+            ),
+            (
+                ("--manifest",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Explicit manifest output path (defaults to output_dir/MANIFEST.json)",
+                },
+            ),
+            (
+                ("--plan-region",),
+                {
+                    "default": None,
+                    "help": "Named HLS/Sentinel-2 plan region to generate (matches hls.plan_regions entries)",
+                },
+            ),
+            (
+                ("--bmng-resolution",),
+                {
+                    "choices": ["500m", "2km"],
+                    "default": "500m",
+                    "help": "Preferred BMNG resolution (default: 500m)",
+                },
+            ),
+            (("--force",), {"action": "store_true", "help": "Force re-download even if files already exist"}),
+            (
+                ("--no-aria2",),
+                {
+                    "action": "store_true",
+                    "help": "Disable aria2c integration and use built-in downloader",
+                },
+            ),
+        ),
+    ),
+    "process": (
+        "Run raster preprocessing pipeline",
+        (
+            (
+                ("--config",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Path to pipeline configuration file (YAML or JSON)",
+                },
+            ),
+            (
+                ("--plan-region",),
+                {
+                    "default": None,
+                    "help": "Named HLS/Sentinel-2 plan region to process (matches plan_regions entries)",
+                },
+            ),
+            (
+                ("--natural-earth-url",),
+                {
+                    "default": None,
+                    "help": "Read the Natural Earth archive over HTTP instead of <data_dir>/natural_earth",
+                },
+            ),
+            (("--dry-run",), {"action": "store_true", "help": "Print commands without executing them"}),
+            (("--force",), {"action": "store_true", "help": "Regenerate processing outputs even if cached"}),
+        ),
+    ),
+    "tile": (
+        "Generate MBTiles output",
+        (
+            (
+                ("--config",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Path to pipeline configuration file (YAML or JSON)",
+                },
+            ),
+            (
+                ("--plan-region",),
+                {
+                    "default": None,
+                    "help": "Named plan region to tile when tile_source is hls or sentinel2",
+                },
+            ),
+            (("--dry-run",), {"action": "store_true", "help": "Print tiling commands without executing"}),
+            (("--min-zoom",), {"type": int, "default": None, "help": "Override minimum zoom level"}),
+            (("--max-zoom",), {"type": int, "default": None, "help": "Override maximum zoom level"}),
+            (
+                ("--tile-format",),
+                {
+                    "choices": ["PNG", "JPEG", "WEBP"],
+                    "default": None,
+                    "help": "Override tile image format",
+                },
+            ),
+            (("--quality",), {"type": int, "default": None, "help": "Override tile encoding quality"}),
+            (
+                ("--shards",),
+                {
+                    "type": int,
+                    "default": None,
+                    "help": "Tile the raster as N parallel row bands and union them (default: one gdal_translate)",
+                },
+            ),
+            (("--force",), {"action": "store_true", "help": "Regenerate tiles even if output exists"}),
+        ),
+    ),
+    "tiling": (
+        "Advanced tiling utilities",
+        (),
+    ),
+    "build": (
+        "Build a custom planet from an AOI overlay spec (ADR 0001)",
+        (
+            (("--spec",), {"type": Path, "required": True, "help": "AOI overlay pipeline spec (YAML)"}),
+            (
+                ("--config",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Base pipeline config (defaults to configs/base/pipeline.yaml)",
+                },
+            ),
+            (("--base-mbtiles",), {"type": Path, "required": True, "help": "Prebuilt global base MBTiles (the floor)"}),
+            (
+                ("--work-dir",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Scratch dir for intermediates (default: output/build)",
+                },
+            ),
+            (("--tile-size",), {"type": int, "default": 512}),
+            (("--no-strict",), {"action": "store_true", "help": "Warn instead of failing on zoom-ceiling violations"}),
+        ),
+    ),
+    "prefetch": (
+        "Download-only: warm the Sentinel-2 asset cache for a spec's AOIs (no tiling)",
+        (
+            (("--spec",), {"type": Path, "required": True, "help": "AOI overlay pipeline spec (YAML)"}),
+            (
+                ("--config",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Base pipeline config (defaults to configs/base/pipeline.yaml)",
+                },
+            ),
+            (("--work-dir",), {"type": Path, "default": None, "help": "Scratch dir (default: output/build)"}),
+            (
+                ("--pace-min",),
+                {
+                    "type": float,
+                    "default": 60.0,
+                    "help": "Min inter-tile wait (s) when throughput was healthy",
+                },
+            ),
+            (
+                ("--pace-max",),
+                {
+                    "type": float,
+                    "default": 300.0,
+                    "help": "Max inter-tile wait (s) when throughput was healthy",
+                },
+            ),
+            (
+                ("--throttle-floor",),
+                {
+                    "type": float,
+                    "default": 150.0,
+                    "help": "KiB/s below which the last tile counts as throttled",
+                },
+            ),
+            (("--cooldown-min",), {"type": float, "default": 600.0, "help": "Min cooldown (s) after a throttled tile"}),
+            (("--cooldown-max",), {"type": float, "default": 900.0, "help": "Max cooldown (s) after a throttled tile"}),
+            (
+                ("--recovery-wait",),
+                {
+                    "type": float,
+                    "default": 1800.0,
+                    "help": "Seconds to wait between recovery rounds during a broad MPC outage",
+                },
+            ),
+            (
+                ("--max-recovery-rounds",),
+                {
+                    "type": int,
+                    "default": 6,
+                    "help": "Max rounds re-attempting failed overlays (1 = no recovery wait); rides out an MPC STAC outage",
+                },
+            ),
+            (
+                ("--dry-run",),
+                {
+                    "action": "store_true",
+                    "help": "List the Sentinel-2 overlays that would be prefetched and exit",
+                },
+            ),
+        ),
+    ),
+    "split-plan": (
+        "Split a global HLS plan into one ndjson shard per miniplanet",
+        (
+            (
+                ("--config",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Path to pipeline configuration file (YAML or JSON)",
+                },
+            ),
+            (
+                ("--plan",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Explicit plan ndjson to split (defaults to the global HLS plan)",
+                },
+            ),
+            (
+                ("--out",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Output directory for shards (defaults to data_dir/plans/shards)",
+                },
+            ),
+        ),
+    ),
+    "mpc-fetch": (
+        "Download a Sentinel-2 true color clip via Microsoft Planetary Computer",
+        (
+            (("--lat",), {"type": float, "required": True, "help": "Latitude of the target point"}),
+            (("--lon",), {"type": float, "required": True, "help": "Longitude of the target point"}),
+            (("--width-m",), {"type": float, "default": 500.0, "help": "Clip width in meters (default: 500)"}),
+            (("--height-m",), {"type": float, "default": 500.0, "help": "Clip height in meters (default: 500)"}),
+            (("--max-cloud",), {"type": float, "default": None, "help": "Maximum acceptable cloud cover percentage"}),
+            (
+                ("--start",),
+                {
+                    "dest": "start_datetime",
+                    "default": None,
+                    "help": "ISO8601 start datetime filter (inclusive)",
+                },
+            ),
+            (("--end",), {"dest": "end_datetime", "default": None, "help": "ISO8601 end datetime filter (inclusive)"}),
+            (
+                ("--output",),
+                {
+                    "type": Path,
+                    "default": Path("mpc_true_color.tif"),
+                    "help": "Output GeoTIFF path (default: mpc_true_color.tif)",
+                },
+            ),
+            (
+                ("--gdal-translate",),
+                {
+                    "default": "gdal_translate",
+                    "help": "gdal_translate executable name (default: gdal_translate)",
+                },
+            ),
+            (
+                ("--num-threads",),
+                {
+                    "default": "ALL_CPUS",
+                    "help": "GDAL NUM_THREADS value for the COG write (default: ALL_CPUS)",
+                },
+            ),
+            (("--dry-run",), {"action": "store_true", "help": "Print commands without executing GDAL"}),
+        ),
+    ),
+    "gsi-fetch": (
+        "Download a GSI high-resolution orthophoto clip via the XYZ tile service",
+        (
+            (("--lat",), {"type": float, "required": True, "help": "Latitude of the target point"}),
+            (("--lon",), {"type": float, "required": True, "help": "Longitude of the target point"}),
+            (("--width-m",), {"type": float, "default": 400.0, "help": "Clip width in meters (default: 400)"}),
+            (("--height-m",), {"type": float, "default": 400.0, "help": "Clip height in meters (default: 400)"}),
+            (("--zoom",), {"type": int, "default": 18, "help": "Tile zoom level (default: 18)"}),
+            (
+                ("--tile-template",),
+                {
+                    "default": "https://cyberjapandata.gsi.go.jp/xyz/ortho/{z}/{x}/{y}.jpg",
+                    "help": "XYZ tile template URL (default: GSI ortho)",
+                },
+            ),
+            (
+                ("--output",),
+                {
+                    "type": Path,
+                    "default": Path("gsi_ortho.tif"),
+                    "help": "Output GeoTIFF path (default: gsi_ortho.tif)",
+                },
+            ),
+            (
+                ("--gdal-translate",),
+                {
+                    "default": "gdal_translate",
+                    "help": "gdal_translate executable name (default: gdal_translate)",
+                },
+            ),
+            (
+                ("--gdal-buildvrt",),
+                {
+                    "default": "gdalbuildvrt",
+                    "help": "gdalbuildvrt executable name (default: gdalbuildvrt)",
+                },
+            ),
+            (("--gdal-warp",), {"default": "gdalwarp", "help": "gdalwarp executable name (default: gdalwarp)"}),
+            (
+                ("--num-threads",),
+                {
+                    "default": "ALL_CPUS",
+                    "help": "GDAL NUM_THREADS value for the warp and COG write (default: ALL_CPUS)",
+                },
+            ),
+            (("--dry-run",), {"action": "store_true", "help": "Print commands without executing GDAL"}),
+        ),
+    ),
+    "gsi-collect": (
+        "Collect a GSI XYZ layer (e.g. seamlessphoto) nationwide into a zxy dir, mokuroku-driven",
+        (
+            (("--layer",), {"default": "seamlessphoto", "help": "GSI layer id (default: seamlessphoto)"}),
+            (("--zoom-min",), {"type": int, "default": 8}),
+            (("--zoom-max",), {"type": int, "default": 16}),
+            (
+                ("--out",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Output zxy tile directory (omit when using --mbtiles)",
+                },
+            ),
+            (
+                ("--mbtiles",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Write tiles directly into this MBTiles (no intermediate z/x/y files; resumable)",
+                },
+            ),
+            (("--attribution",), {"default": None, "help": "metadata attribution (when --mbtiles)"}),
+            (("--name",), {"default": None, "help": "metadata name (when --mbtiles)"}),
+            (
+                ("--workers",),
+                {
+                    "type": int,
+                    "default": 10,
+                    "help": "Concurrent downloads (be polite; 403/429 trigger cool-down)",
+                },
+            ),
+            (("--ext",), {"default": "jpg"}),
+            (
+                ("--quadrans",),
+                {
+                    "choices": ["north", "east", "south", "west"],
+                    "default": None,
+                    "help": "Only collect tiles in this Quadrans region (UNopenGIS/7#909) — for splitting work",
+                },
+            ),
+            (
+                ("--mokuroku",),
+                {
+                    "default": None,
+                    "help": "mokuroku.csv.gz URL or local path (default: GSI URL for the layer)",
+                },
+            ),
+            (("--config",), {"type": Path, "default": None, "help": "Pipeline config (for cache dir defaults)"}),
+            (("--dry-run",), {"action": "store_true", "help": "Report tile counts per zoom from mokuroku and exit"}),
+        ),
+    ),
+    "gsi-pack": (
+        "Pack a z/x/y tile directory into an MBTiles archive (create or append; faster than mb-util)",
+        (
+            (("--tiles",), {"type": Path, "required": True, "help": "Source z/x/y tile directory"}),
+            (("--out",), {"type": Path, "required": True, "help": "Destination MBTiles (created or appended)"}),
+            (("--format",), {"default": "jpg", "help": "Tile image format stored in metadata (default: jpg)"}),
+            (("--name",), {"default": None, "help": "metadata name"}),
+            (("--attribution",), {"default": None, "help": "metadata attribution"}),
+            (("--bounds",), {"default": None, "help": "metadata bounds 'minlon,minlat,maxlon,maxlat'"}),
+            (("--batch-size",), {"type": int, "default": 10000, "help": "Insert batch size (default: 10000)"}),
+        ),
+    ),
+    "package": (
+        "Create PMTiles distribution",
+        (
+            (
+                ("--config",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Path to pipeline configuration file (YAML or JSON)",
+                },
+            ),
+            (
+                ("--pmtiles-name",),
+                {
+                    "type": str,
+                    "default": None,
+                    "help": "Filename for the PMTiles archive (defaults to planet_<year>_<max_zoom_level>z.pmtiles)",
+                },
+            ),
+            (
+                ("--input",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Path to an MBTiles archive to package (defaults to the latest tiling output)",
+                },
+            ),
+            (("--dry-run",), {"action": "store_true", "help": "Print packaging commands without executing"}),
+            (("--force",), {"action": "store_true", "help": "Regenerate PMTiles even if output exists"}),
+        ),
+    ),
+    "serve": (
+        "Serve PMTiles with a simple web viewer",
+        (
+            (("--pmtiles",), {"type": Path, "default": None, "help": "Path to the PMTiles archive"}),
+            (("--region",), {"type": str, "default": None, "help": "Region name to resolve PMTiles from distribution"}),
+            (
+                ("--config",),
+                {
+                    "type": Path,
+                    "default": None,
+                    "help": "Path to pipeline configuration file (YAML or JSON) for region resolution",
+                },
+            ),
+            (("--host",), {"default": "0.0.0.0", "help": "Host interface to bind (default: 0.0.0.0)"}),
+            (("--tiles-port",), {"type": int, "default": 8080, "help": "Port for pmtiles server"}),
+            (("--ui-port",), {"type": int, "default": 8081, "help": "Port for the viewer UI"}),
+            (
+                ("--viewer-root",),
+                {
+                    "type": Path,
+                    "default": Path("src/planetarble/viewer"),
+                    "help": "Directory containing viewer assets",
+                },
+            ),
+            (("--open",), {"action": "store_true", "help": "Open the viewer URL in a browser"}),
+        ),
+    ),
+    "copernicus-layers": (
+        "List available Copernicus WMS layers for the configured instance",
+        (
+            (("--instance-id",), {"default": None, "help": "Override COPERNICUS_INSTANCE_ID for listing layers"}),
+            (
+                ("--no-credentials",),
+                {
+                    "action": "store_true",
+                    "help": "Do not use client credentials when fetching capabilities",
+                },
+            ),
+        ),
+    ),
+}
+
+# Subcommands that carry their own nested subparsers: (dest, table).
+_NESTED_SUBCOMMANDS: dict[str, tuple[str, dict[str, tuple[str, tuple[_ArgSpec, ...]]]]] = {
+    "tiling": ("tiling_command", _TILING_SUBCOMMANDS),
+}
+
+
+def _add_subcommand(
+    subcommands: argparse._SubParsersAction,
+    name: str,
+    table: dict[str, tuple[str, tuple[_ArgSpec, ...]]],
+) -> None:
+    help_text, arg_specs = table[name]
+    parser = subcommands.add_parser(name, help=help_text)
+    for flags, kwargs in arg_specs:
+        parser.add_argument(*flags, **kwargs)
+    if table is _SUBCOMMANDS and name in _NESTED_SUBCOMMANDS:
+        dest, children = _NESTED_SUBCOMMANDS[name]
+        nested = parser.add_subparsers(dest=dest, required=True)
+        for child in children:
+            _add_subcommand(nested, child, children)
+
+
+def _package_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("planetarble")
+    except PackageNotFoundError:  # pragma: no cover - running from an uninstalled tree
+        return "unknown"
+
+
+class _LazyVersionAction(argparse.Action):
+    """``--version`` that resolves the package version only when the flag is used."""
+
+    def __init__(self, option_strings: Sequence[str], dest: str = argparse.SUPPRESS, **kwargs: object) -> None:
+        super().__init__(option_strings, dest=dest, nargs=0, default=argparse.SUPPRESS, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):  # type: ignore[no-untyped-def]
+        print(f"{parser.prog} {_package_version()}")
+        parser.exit()
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Planetarble command-line interface")
+def _sniff_subcommand(argv: Sequence[str]) -> str | None:
+    """Return the subcommand named in ``argv`` without running argparse."""
+
+    arguments = iter(argv)
+    for token in arguments:
+        if token == "--log-level":
+            next(arguments, None)
+            continue
+        if token.startswith("-"):
+            continue
+        return token if token in _SUBCOMMANDS else None
+    return None
+
+
+def _build_root_parser() -> tuple[argparse.ArgumentParser, argparse._SubParsersAction]:
+    """Return the top-level parser and its (still empty) subcommand action."""
+
+    parser = argparse.ArgumentParser(prog="planetarble", description="Planetarble command-line interface")
+    parser.add_argument("--version", action=_LazyVersionAction, help="show program's version number and exit")
     parser.add_argument("--log-json", action="store_true", help="Emit logs in JSON format")
     parser.add_argument("--log-level", default="INFO", help="Logging level (default: INFO)")
-    subcommands = parser.add_subparsers(dest="command", required=True)
-
-    acquire = subcommands.add_parser("acquire", help="Download source datasets and emit manifest")
-    acquire.add_argument(
-        "--config",
-        type=Path,
-        default=None,
-        help="Path to pipeline configuration file (YAML or JSON)",
-    )
-    acquire.add_argument(
-        "--manifest",
-        type=Path,
-        default=None,
-        help="Explicit manifest output path (defaults to output_dir/MANIFEST.json)",
-    )
-    acquire.add_argument(
-        "--plan-region",
-        default=None,
-        help="Named HLS/Sentinel-2 plan region to generate (matches hls.plan_regions entries)",
-    )
-    acquire.add_argument(
-        "--bmng-resolution",
-        choices=["500m", "2km"],
-        default="500m",
-        help="Preferred BMNG resolution (default: 500m)",
-    )
-    acquire.add_argument(
-        "--force",
-        action="store_true",
-        help="Force re-download even if files already exist",
-    )
-    acquire.add_argument(
-        "--no-aria2",
-        action="store_true",
-        help="Disable aria2c integration and use built-in downloader",
-    )
+    return parser, parser.add_subparsers(dest="command", required=True)
 
-    process = subcommands.add_parser("process", help="Run raster preprocessing pipeline")
-    process.add_argument(
-        "--config",
-        type=Path,
-        default=None,
-        help="Path to pipeline configuration file (YAML or JSON)",
-    )
-    process.add_argument(
-        "--plan-region",
-        default=None,
-        help="Named HLS/Sentinel-2 plan region to process (matches plan_regions entries)",
-    )
-    process.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Print commands without executing them",
-    )
-    process.add_argument(
-        "--force",
-        action="store_true",
-        help="Regenerate processing outputs even if cached",
-    )
 
-    tile = subcommands.add_parser("tile", help="Generate MBTiles output")
-    tile.add_argument(
-        "--config",
-        type=Path,
-        default=None,
-        help="Path to pipeline configuration file (YAML or JSON)",
-    )
-    tile.add_argument(
-        "--plan-region",
-        default=None,
-        help="Named plan region to tile when tile_source is hls or sentinel2",
-    )
-    tile.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Print tiling commands without executing",
-    )
-    tile.add_argument(
-        "--min-zoom",
-        type=int,
-        default=None,
-        help="Override minimum zoom level",
-    )
-    tile.add_argument(
-        "--max-zoom",
-        type=int,
-        default=None,
-        help="Override maximum zoom level",
-    )
-    tile.add_argument(
-        "--tile-format",
-        choices=["PNG", "JPEG", "WEBP"],
-        default=None,
-        help="Override tile image format",
-    )
-    tile.add_argument(
-        "--quality",
-        type=int,
-        default=None,
-        help="Override tile encoding quality",
-    )
-    tile.add_argument(
-        "--force",
-        action="store_true",
-        help="Regenerate tiles even if output exists",
-    )
+def build_parser(chosen: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
 
-    tiling = subcommands.add_parser("tiling", help="Advanced tiling utilities")
-    tiling_subcommands = tiling.add_subparsers(dest="tiling_command", required=True)
+    When ``chosen`` names a known subcommand only that subparser is registered;
+    otherwise (top-level ``--help``, unknown commands) every subcommand is built
+    so argparse's ``invalid choice`` error still lists them all.
+    """
 
-    tiling_pmtiles = tiling_subcommands.add_parser(
-        "pmtiles",
-        help="Convert a raster into PMTiles via XYZ and MBTiles",
-    )
-    tiling_pmtiles.add_argument("--input", type=Path, required=True, help="Source raster path")
-    tiling_pmtiles.add_argument(
-        "--out",
-        type=Path,
-        required=True,
-        help="Destination directory for PMTiles and intermediate artifacts",
-    )
-    tiling_pmtiles.add_argument(
-        "--min-zoom",
-        type=int,
-        default=None,
-        help="Minimum zoom level (default: config or 0)",
-    )
-    tiling_pmtiles.add_argument(
-        "--max-zoom",
-        type=int,
-        default=None,
-        help="Maximum zoom level",
-    )
-    tiling_pmtiles.add_argument(
-        "--format",
-        choices=["png", "jpg", "webp"],
-        default=None,
-        help="Tile image format",
-    )
-    tiling_pmtiles.add_argument(
-        "--quality",
-        type=int,
-        default=None,
-        help="Compression quality for JPEG/WEBP tiles",
-    )
-    tiling_pmtiles.add_argument(
-        "--resampling",
-        default=None,
-        help="Resampling kernel for gdal raster tile (default: config value)",
-    )
-    tiling_pmtiles.add_argument("--name", default=None, help="Human-readable tileset name")
-    tiling_pmtiles.add_argument(
-        "--attribution",
-        default=None,
-        help="Attribution string embedded into MBTiles metadata",
-    )
-    tiling_pmtiles.add_argument(
-        "--bounds-mode",
-        choices=["auto", "global"],
-        default="auto",
-        help="Strategy to derive bounds metadata",
-    )
-    tiling_pmtiles.add_argument(
-        "--no-deduplication",
-        action="store_true",
-        help="Disable PMTiles deduplication during conversion",
-    )
-    tiling_pmtiles.add_argument(
-        "--cluster",
-        action="store_true",
-        help="Run pmtiles cluster after conversion",
-    )
-    tiling_pmtiles.add_argument(
-        "--temp-dir",
-        type=Path,
-        default=None,
-        help="Temporary workspace directory (defaults to <out>/tmp)",
-    )
-    tiling_pmtiles.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Print commands without executing them",
-    )
+    parser, subcommands = _build_root_parser()
+    for name in (chosen,) if chosen in _SUBCOMMANDS else _SUBCOMMANDS:
+        _add_subcommand(subcommands, name, _SUBCOMMANDS)
+    return parser
 
-    tiling_merge = tiling_subcommands.add_parser(
-        "merge-mbtiles",
-        help="Overlay tiles from one MBTiles archive onto another",
-    )
-    tiling_merge.add_argument("--base", type=Path, required=True, help="Base MBTiles archive")
-    tiling_merge.add_argument("--overlay", type=Path, required=True, help="Overlay MBTiles archive")
-    tiling_merge.add_argument("--out", type=Path, required=True, help="Output MBTiles archive")
 
-    tiling_union = tiling_subcommands.add_parser(
-        "union-mbtiles",
-        help="Union several MBTiles into one in a single pass (for disjoint Quadrans pieces)",
-    )
-    tiling_union.add_argument("--inputs", type=Path, nargs="+", required=True,
-                              help="Input MBTiles archives (pass the LARGEST first — it becomes the copy base)")
-    tiling_union.add_argument("--out", type=Path, required=True, help="Output MBTiles archive")
-    tiling_union.add_argument("--chunk-size", type=int, default=50_000,
-                              help="Rows per commit when appending non-base inputs (bounds journal growth)")
-
-    tiling_stitch = tiling_subcommands.add_parser(
-        "stitch-512",
-        help="Build a 512px pyramid from a 256px source (output zoom z <- source zoom z+1)",
-    )
-    tiling_stitch.add_argument("--source", type=Path, required=True, help="256px source MBTiles")
-    tiling_stitch.add_argument("--out", type=Path, required=True, help="Output 512px MBTiles")
-    tiling_stitch.add_argument("--format", default="jpg", help="Output tile format (default jpg)")
-    tiling_stitch.add_argument("--quality", type=int, default=90, help="JPEG/WebP quality (default 90)")
-    tiling_stitch.add_argument("--workers", type=int, default=1,
-                               help="Parallel processes (CPU-bound; shards are unioned at the end)")
-    tiling_stitch.add_argument("--shard-dir", type=Path, default=None,
-                               help="Dir for worker shards (default: next to --out; put on a separate disk to split shards/output)")
-
-    build = subcommands.add_parser(
-        "build",
-        help="Build a custom planet from an AOI overlay spec (ADR 0001)",
-    )
-    build.add_argument("--spec", type=Path, required=True, help="AOI overlay pipeline spec (YAML)")
-    build.add_argument("--config", type=Path, default=None, help="Base pipeline config (defaults to configs/base/pipeline.yaml)")
-    build.add_argument("--base-mbtiles", type=Path, required=True, help="Prebuilt global base MBTiles (the floor)")
-    build.add_argument("--work-dir", type=Path, default=None, help="Scratch dir for intermediates (default: output/build)")
-    build.add_argument("--tile-size", type=int, default=512)
-    build.add_argument("--no-strict", action="store_true", help="Warn instead of failing on zoom-ceiling violations")
-
-    prefetch = subcommands.add_parser(
-        "prefetch",
-        help="Download-only: warm the Sentinel-2 asset cache for a spec's AOIs (no tiling)",
-    )
-    prefetch.add_argument("--spec", type=Path, required=True, help="AOI overlay pipeline spec (YAML)")
-    prefetch.add_argument("--config", type=Path, default=None, help="Base pipeline config (defaults to configs/base/pipeline.yaml)")
-    prefetch.add_argument("--work-dir", type=Path, default=None, help="Scratch dir (default: output/build)")
-    prefetch.add_argument("--pace-min", type=float, default=60.0, help="Min inter-tile wait (s) when throughput was healthy")
-    prefetch.add_argument("--pace-max", type=float, default=300.0, help="Max inter-tile wait (s) when throughput was healthy")
-    prefetch.add_argument("--throttle-floor", type=float, default=150.0, help="KiB/s below which the last tile counts as throttled")
-    prefetch.add_argument("--cooldown-min", type=float, default=600.0, help="Min cooldown (s) after a throttled tile")
-    prefetch.add_argument("--cooldown-max", type=float, default=900.0, help="Max cooldown (s) after a throttled tile")
-    prefetch.add_argument("--recovery-wait", type=float, default=1800.0, help="Seconds to wait between recovery rounds during a broad MPC outage")
-    prefetch.add_argument("--max-recovery-rounds", type=int, default=6, help="Max rounds re-attempting failed overlays (1 = no recovery wait); rides out an MPC STAC outage")
-    prefetch.add_argument("--dry-run", action="store_true", help="List the Sentinel-2 overlays that would be prefetched and exit")
-
-    split_plan = subcommands.add_parser(
-        "split-plan",
-        help="Split a global HLS plan into one ndjson shard per miniplanet",
-    )
-    split_plan.add_argument(
-        "--config",
-        type=Path,
-        default=None,
-        help="Path to pipeline configuration file (YAML or JSON)",
-    )
-    split_plan.add_argument(
-        "--plan",
-        type=Path,
-        default=None,
-        help="Explicit plan ndjson to split (defaults to the global HLS plan)",
-    )
-    split_plan.add_argument(
-        "--out",
-        type=Path,
-        default=None,
-        help="Output directory for shards (defaults to data_dir/plans/shards)",
-    )
+# Commands whose --dry-run output is the printed summary alone.
+_PRINT_ONLY_DRY_RUN_COMMANDS = frozenset({"mpc-fetch", "gsi-fetch"})
 
-    mpc_fetch = subcommands.add_parser(
-        "mpc-fetch",
-        help="Download a Sentinel-2 true color clip via Microsoft Planetary Computer",
-    )
-    mpc_fetch.add_argument("--lat", type=float, required=True, help="Latitude of the target point")
-    mpc_fetch.add_argument("--lon", type=float, required=True, help="Longitude of the target point")
-    mpc_fetch.add_argument(
-        "--width-m",
-        type=float,
-        default=500.0,
-        help="Clip width in meters (default: 500)",
-    )
-    mpc_fetch.add_argument(
-        "--height-m",
-        type=float,
-        default=500.0,
-        help="Clip height in meters (default: 500)",
-    )
-    mpc_fetch.add_argument(
-        "--max-cloud",
-        type=float,
-        default=None,
-        help="Maximum acceptable cloud cover percentage",
-    )
-    mpc_fetch.add_argument(
-        "--start",
-        dest="start_datetime",
-        default=None,
-        help="ISO8601 start datetime filter (inclusive)",
-    )
-    mpc_fetch.add_argument(
-        "--end",
-        dest="end_datetime",
-        default=None,
-        help="ISO8601 end datetime filter (inclusive)",
-    )
-    mpc_fetch.add_argument(
-        "--output",
-        type=Path,
-        default=Path("mpc_true_color.tif"),
-        help="Output GeoTIFF path (default: mpc_true_color.tif)",
-    )
-    mpc_fetch.add_argument(
-        "--gdal-translate",
-        default="gdal_translate",
-        help="gdal_translate executable name (default: gdal_translate)",
-    )
-    mpc_fetch.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Print commands without executing GDAL",
-    )
 
-    gsi_fetch = subcommands.add_parser(
-        "gsi-fetch",
-        help="Download a GSI high-resolution orthophoto clip via the XYZ tile service",
-    )
-    gsi_fetch.add_argument("--lat", type=float, required=True, help="Latitude of the target point")
-    gsi_fetch.add_argument("--lon", type=float, required=True, help="Longitude of the target point")
-    gsi_fetch.add_argument(
-        "--width-m",
-        type=float,
-        default=400.0,
-        help="Clip width in meters (default: 400)",
-    )
-    gsi_fetch.add_argument(
-        "--height-m",
-        type=float,
-        default=400.0,
-        help="Clip height in meters (default: 400)",
-    )
-    gsi_fetch.add_argument(
-        "--zoom",
-        type=int,
-        default=18,
-        help="Tile zoom level (default: 18)",
-    )
-    gsi_fetch.add_argument(
-        "--tile-template",
-        default="https://cyberjapandata.gsi.go.jp/xyz/ortho/{z}/{x}/{y}.jpg",
-        help="XYZ tile template URL (default: GSI ortho)",
-    )
-    gsi_fetch.add_argument(
-        "--output",
-        type=Path,
-        default=Path("gsi_ortho.tif"),
-        help="Output GeoTIFF path (default: gsi_ortho.tif)",
-    )
-    gsi_fetch.add_argument(
-        "--gdal-translate",
-        default="gdal_translate",
-        help="gdal_translate executable name (default: gdal_translate)",
-    )
-    gsi_fetch.add_argument(
-        "--gdal-buildvrt",
-        default="gdalbuildvrt",
-        help="gdalbuildvrt executable name (default: gdalbuildvrt)",
-    )
-    gsi_fetch.add_argument(
-        "--gdal-warp",
-        default="gdalwarp",
-        help="gdalwarp executable name (default: gdalwarp)",
-    )
-    gsi_fetch.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Print commands without executing GDAL",
-    )
+def _needs_logging(args: argparse.Namespace) -> bool:
+    """Return False for print-only dry runs that keep the default log settings.
 
-    gsi_collect = subcommands.add_parser(
-        "gsi-collect",
-        help="Collect a GSI XYZ layer (e.g. seamlessphoto) nationwide into a zxy dir, mokuroku-driven",
-    )
-    gsi_collect.add_argument("--layer", default="seamlessphoto", help="GSI layer id (default: seamlessphoto)")
-    gsi_collect.add_argument("--zoom-min", type=int, default=8)
-    gsi_collect.add_argument("--zoom-max", type=int, default=16)
-    gsi_collect.add_argument("--out", type=Path, default=None, help="Output zxy tile directory (omit when using --mbtiles)")
-    gsi_collect.add_argument("--mbtiles", type=Path, default=None, help="Write tiles directly into this MBTiles (no intermediate z/x/y files; resumable)")
-    gsi_collect.add_argument("--attribution", default=None, help="metadata attribution (when --mbtiles)")
-    gsi_collect.add_argument("--name", default=None, help="metadata name (when --mbtiles)")
-    gsi_collect.add_argument("--workers", type=int, default=10, help="Concurrent downloads (be polite; 403/429 trigger cool-down)")
-    gsi_collect.add_argument("--ext", default="jpg")
-    gsi_collect.add_argument("--quadrans", choices=["north", "east", "south", "west"], default=None,
-                             help="Only collect tiles in this Quadrans region (UNopenGIS/7#909) — for splitting work")
-    gsi_collect.add_argument("--mokuroku", default=None, help="mokuroku.csv.gz URL or local path (default: GSI URL for the layer)")
-    gsi_collect.add_argument("--config", type=Path, default=None, help="Pipeline config (for cache dir defaults)")
-    gsi_collect.add_argument("--dry-run", action="store_true", help="Report tile counts per zoom from mokuroku and exit")
-
-    gsi_pack = subcommands.add_parser(
-        "gsi-pack",
-        help="Pack a z/x/y tile directory into an MBTiles archive (create or append; faster than mb-util)",
-    )
-    gsi_pack.add_argument("--tiles", type=Path, required=True, help="Source z/x/y tile directory")
-    gsi_pack.add_argument("--out", type=Path, required=True, help="Destination MBTiles (created or appended)")
-    gsi_pack.add_argument("--format", default="jpg", help="Tile image format stored in metadata (default: jpg)")
-    gsi_pack.add_argument("--name", default=None, help="metadata name")
-    gsi_pack.add_argument("--attribution", default=None, help="metadata attribution")
-    gsi_pack.add_argument("--bounds", default=None, help="metadata bounds 'minlon,minlat,maxlon,maxlat'")
-    gsi_pack.add_argument("--batch-size", type=int, default=10000, help="Insert batch size (default: 10000)")
-
-    package = subcommands.add_parser("package", help="Create PMTiles distribution")
-    package.add_argument(
-        "--config",
-        type=Path,
-        default=None,
-        help="Path to pipeline configuration file (YAML or JSON)",
-    )
-    package.add_argument(
-        "--pmtiles-name",
-        type=str,
-        default=None,
-        help="Filename for the PMTiles archive (defaults to planet_<year>_<max_zoom_level>z.pmtiles)",
-    )
-    package.add_argument(
-        "--input",
-        type=Path,
-        default=None,
-        help="Path to an MBTiles archive to package (defaults to the latest tiling output)",
-    )
-    package.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Print packaging commands without executing",
-    )
-    package.add_argument(
-        "--force",
-        action="store_true",
-        help="Regenerate PMTiles even if output exists",
-    )
+    Those runs leave logging unconfigured; warnings and errors still reach stderr
+    through the logging module's last-resort handler.
+    """
 
-    serve = subcommands.add_parser("serve", help="Serve PMTiles with a simple web viewer")
-    serve.add_argument("--pmtiles", type=Path, default=None, help="Path to the PMTiles archive")
-    serve.add_argument("--region", type=str, default=None, help="Region name to resolve PMTiles from distribution")
-    serve.add_argument(
-        "--config",
-        type=Path,
-        default=None,
-        help="Path to pipeline configuration file (YAML or JSON) for region resolution",
-    )
-    serve.add_argument("--host", default="0.0.0.0", help="Host interface to bind (default: 0.0.0.0)")
-    serve.add_argument("--tiles-port", type=int, default=8080, help="Port for pmtiles server")
-    serve.add_argument("--ui-port", type=int, default=8081, help="Port for the viewer UI")
-    serve.add_argument(
-        "--viewer-root",
-        type=Path,
-        default=Path("src/planetarble/viewer"),
-        help="Directory containing viewer assets",
-    )
-    serve.add_argument("--open", action="store_true", help="Open the viewer URL in a browser")
+    if args.command not in _PRINT_ONLY_DRY_RUN_COMMANDS or not getattr(args, "dry_run", False):
+        return True
+    return args.log_json or args.log_level.upper() != "INFO"
 
-    copernicus_layers = subcommands.add_parser(
-        "copernicus-layers",
-        help="List available Copernicus WMS layers for the configured instance",
-    )
-    copernicus_layers.add_argument(
-        "--instance-id",
-        default=None,
-        help="Override COPERNICUS_INSTANCE_ID for listing layers",
-    )
-    copernicus_layers.add_argument(
-        "--no-credentials",
-        action="store_true",
-        help="Do not use client credentials when fetching capabilities",
-    )
+
+_PARSER_CACHE: dict[str | None, argparse.ArgumentParser] = {}
+
+
+def _get_parser(chosen: str | None) -> argparse.ArgumentParser:
+    """Return the parser for ``chosen``, building it once per process."""
+
+    parser = _PARSER_CACHE.get(chosen)
+    if parser is None:
+        parser = _PARSER_CACHE[chosen] = build_parser(chosen)
     return parser
 
 
-def main(argv: Iterable[str] | None = None) -> int:
-    _load_env()
-    parser = build_parser()
-    args = parser.parse_args(list(argv) if argv is not None else None)
+def _reset_parser_cache() -> None:
+    """Drop memoized parsers (tests that patch the subcommand tables)."""
 
-    configure_logging(level=args.log_level, json_logs=args.log_json)
+    _PARSER_CACHE.clear()
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    arguments = list(argv) if argv is not None else sys.argv[1:]
+    if arguments == ["--version"]:
+        # Answer before touching .env or building any parser.
+        print(f"planetarble {_package_version()}")
+        return 0
+    chosen = _sniff_subcommand(arguments)
+    # .env goes into os.environ before any GDAL child is spawned; core.gdal_env
+    # only fills in the tuning keys it leaves unset.
+    if chosen is not None and chosen not in _NO_ENV_COMMANDS:
+        _load_env()
+    parser = _get_parser(chosen)
+    args = parser.parse_args(arguments)
+
+    if _needs_logging(args):
+        from planetarble.logging import configure_logging
+
+        log_level = args.log_level
+        if args.command == "copernicus-layers" and log_level.upper() == "INFO":
+            # The layer listing is printed to stdout; keep routine INFO chatter out of it.
+            log_level = "WARNING"
+        configure_logging(level=log_level, json_logs=args.log_json)
 
     if args.command == "acquire":
         return _handle_acquire(args)
@@ -582,39 +828,126 @@ def main(argv: Iterable[str] | None = None) -> int:
     return 1
 
 
+@dataclass
+class CliContext:
+    """Loaded pipeline configuration plus its resolved working directories."""
+
+    cfg: PipelineConfig
+    data_dir: Path
+    output_dir: Path
+    processing_dir: Path
+    temp_dir: Path
+    tiling_dir: Path
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int) -> PipelineConfig:
+    from planetarble.config import load_config
+
+    return load_config(Path(path_str))
+
+
+def _load_config(path: Path | None) -> PipelineConfig:
+    """Load the pipeline config, reusing the parsed result while the file is unchanged.
+
+    The cached object is shared between callers, so handlers must not mutate it.
+    """
+
+    config_path = _resolve_config_path(path)
+    return _load_config_cached(str(config_path), config_path.stat().st_mtime_ns)
+
+
+def _abspath(path: Path) -> Path:
+    """Absolute, normalized ``path`` without resolve()'s per-component readlink/stat calls."""
+
+    return Path(os.path.abspath(path))
+
+
+def _cli_context(args: argparse.Namespace) -> CliContext:
+    cfg = _load_config(args.config)
+    output_dir = _abspath(cfg.output_dir)
+    return CliContext(
+        cfg=cfg,
+        data_dir=_abspath(cfg.data_dir),
+        output_dir=output_dir,
+        processing_dir=output_dir / "processing",
+        temp_dir=_abspath(cfg.temp_dir),
+        tiling_dir=output_dir / "tiling",
+    )
+
+
 def _resolve_config_path(path: Path | None) -> Path:
     if path is not None:
-        resolved = path.resolve()
+        resolved = _abspath(path)
         if not resolved.exists():
             raise SystemExit(f"Configuration file not found: {resolved}")
         return resolved
     default_cfg = Path("configs/base/pipeline.yaml")
     if default_cfg.exists():
-        return default_cfg.resolve()
+        return _abspath(default_cfg)
     raise SystemExit("No configuration file found; supply --config or create configs/base/pipeline.yaml")
 
 
-def _resolve_copernicus_cog(processing_dir: Path, layers: Iterable[CopernicusLayerConfig]) -> list[Path]:
-    ordered: list[Path] = []
-    seen: set[Path] = set()
+_PROCESSING_PATTERNS = {
+    "normalized": "*_normalized_cog.tif",
+    "modis": "modis_*_rgb_cog.tif",
+    "viirs": "viirs_*_rgb_cog.tif",
+    "copernicus": "copernicus_*_cog.tif",
+}
+
 
+def _require_path(path: Path, description: str) -> Path:
+    """Return ``path`` as an absolute path, exiting if it does not exist.
+
+    A single ``os.stat`` replaces the resolve()/exists() pair; callers pass paths
+    built from already-resolved base directories.
+    """
+
+    try:
+        os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise SystemExit(f"{description} not found: {path}") from None
+    return Path(os.path.abspath(path))
+
+
+def _index_processing_dir(processing_dir: Path) -> dict[str, list[Path]]:
+    """Bucket processing outputs by product with a single directory scan."""
+
+    index: dict[str, list[Path]] = {key: [] for key in _PROCESSING_PATTERNS}
+    with os.scandir(processing_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            for key, pattern in _PROCESSING_PATTERNS.items():
+                if fnmatch.fnmatchcase(entry.name, pattern):
+                    index[key].append(Path(entry.path))
+    for bucket in index.values():
+        bucket.sort()
+    return index
+
+
+def _resolve_copernicus_cog(
+    layers: Iterable[CopernicusLayerConfig],
+    available: Sequence[Path],
+) -> list[Path]:
+    """Order on-disk Copernicus COGs: configured layers first, then the rest by name."""
+
+    on_disk = {path.name: path for path in available}
+    ordered: list[Path] = []
     for layer in layers or []:
-        slug = _slugify(layer.output or layer.name)
-        candidate = processing_dir / f"copernicus_{slug}_cog.tif"
-        if candidate.exists() and candidate not in seen:
+        candidate = on_disk.pop(f"copernicus_{_slugify(layer.output or layer.name)}_cog.tif", None)
+        if candidate is not None:
             ordered.append(candidate)
-            seen.add(candidate)
+    ordered.extend(sorted(on_disk.values()))
+    return ordered
 
-    for candidate in sorted(processing_dir.glob("copernicus_*_cog.tif")):
-        if candidate not in seen:
-            ordered.append(candidate)
-            seen.add(candidate)
 
-    return ordered
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
 
+@functools.lru_cache(maxsize=256)
 def _slugify(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_") or "layer"
+    return _SLUG_RE.sub("_", value.lower()).strip("_") or "layer"
 
 
 def _handle_build(args: argparse.Namespace) -> int:
@@ -624,7 +957,7 @@ def _handle_build(args: argparse.Namespace) -> int:
     from planetarble.overlay.executor import DefaultPlanetExecutor
     from planetarble.overlay.orchestrator import build_planet
 
-    cfg = load_config(_resolve_config_path(args.config))
+    cfg = _load_config(args.config)
     spec = parse_pipeline_spec(yaml.safe_load(args.spec.read_text(encoding="utf-8")))
     work_dir = (args.work_dir or (cfg.output_dir / "build")).resolve()
     executor = DefaultPlanetExecutor(
@@ -653,7 +986,7 @@ def _handle_prefetch(args: argparse.Namespace) -> int:
     from planetarble.overlay.executor import DefaultPlanetExecutor
     from planetarble.prefetch import PrefetchPacing, prefetch_planet, prefetch_wait_seconds
 
-    cfg = load_config(_resolve_config_path(args.config))
+    cfg = _load_config(args.config)
     spec = parse_pipeline_spec(yaml.safe_load(args.spec.read_text(encoding="utf-8")))
     s2_overlays = [o for o in spec.overlays if o.source == "sentinel2"]
 
@@ -715,7 +1048,8 @@ def _handle_prefetch(args: argparse.Namespace) -> int:
 
 
 def _handle_split_plan(args: argparse.Namespace) -> int:
-    cfg = load_config(_resolve_config_path(args.config))
+    from planetarble.acquisition import split_plan_by_miniplanet
+    cfg = _load_config(args.config)
     plan_path = (args.plan.resolve() if args.plan else _resolve_hls_plan_path(cfg, None))
     if not plan_path.exists():
         raise SystemExit(f"Plan not found: {plan_path}")
@@ -737,7 +1071,7 @@ def _resolve_hls_plan_path(cfg: PipelineConfig, plan_region: Optional[str]) -> P
 def _resolve_hls_scene_manifest_path(cfg: PipelineConfig, plan_region: Optional[str]) -> Path:
     region = plan_region or cfg.hls.plan_region
     filename = "hls_scene_manifest.json" if not region else f"hls_scene_manifest_{region}.json"
-    return (cfg.output_dir / "processing" / filename).resolve()
+    return _abspath(cfg.output_dir / "processing" / filename)
 
 
 def _resolve_sentinel2_scene_manifest_path(cfg: PipelineConfig, plan_region: Optional[str]) -> Path:
@@ -747,7 +1081,7 @@ def _resolve_sentinel2_scene_manifest_path(cfg: PipelineConfig, plan_region: Opt
         if not region
         else f"sentinel2_scene_manifest_{region}.json"
     )
-    return (cfg.output_dir / "processing" / filename).resolve()
+    return _abspath(cfg.output_dir / "processing" / filename)
 
 
 def _is_valid_hls_scene_manifest(path: Path) -> bool:
@@ -816,6 +1150,8 @@ def _is_valid_raster(path: Path) -> bool:
 
 
 def _is_valid_mbtiles(path: Path) -> bool:
+    import sqlite3
+
     if not path.exists() or path.stat().st_size == 0:
         return False
     try:
@@ -835,6 +1171,8 @@ def _is_valid_mbtiles(path: Path) -> bool:
 
 
 def _read_mbtiles_metadata(path: Path) -> dict[str, object]:
+    import sqlite3
+
     if not path.exists() or path.stat().st_size == 0:
         return {}
     try:
@@ -908,42 +1246,106 @@ def _is_valid_tilejson(path: Path) -> bool:
     return all(key in data for key in required)
 
 
+def _copernicus_probe_cached(ctx: CliContext) -> bool:
+    """Return True when an earlier run already reached the Copernicus WMS.
+
+    The capabilities document is written only after a successful token
+    exchange and capabilities fetch, so its presence stands in for the probe.
+    """
+
+    return (ctx.data_dir / "copernicus" / "tiles" / "capabilities.xml").is_file()
+
+
+def _run_acquisition_jobs(
+    jobs: Sequence[tuple[str, Callable[[], object], tuple[type[Exception], ...]]],
+    *,
+    max_workers: int = 4,
+) -> dict[str, object]:
+    """Run independent acquisition jobs on a thread pool and collect their results.
+
+    Each job is ``(name, callable, tolerated)``. Exceptions listed in ``tolerated``
+    are logged as ``"<name> skipped"`` and the job is left out of the results;
+    anything else propagates once the remaining jobs have finished.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    results: dict[str, object] = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(job): (name, tolerated) for name, job, tolerated in jobs}
+        for future in as_completed(futures):
+            name, tolerated = futures[future]
+            try:
+                results[name] = future.result()
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except tolerated as exc:
+                _logger().warning("%s skipped: %s", name, exc)
+    finally:
+        executor.shutdown(wait=True)
+    return results
+
+
+def _plan_region_natural_earth_jobs(
+    manager: AcquisitionManager,
+    regions: Sequence[HLSPlanRegion],
+    *,
+    force: bool,
+) -> list[tuple[str, Callable[[], object], tuple[type[Exception], ...]]]:
+    """Return the Natural Earth download job when any plan region clips to admin or land polygons."""
+
+    needs_admin = any(region.natural_earth for region in regions)
+    needs_land = any(region.land_only for region in regions)
+    if not (needs_admin or needs_land):
+        return []
+    download = functools.partial(manager.download_natural_earth, force=force, include_admin=needs_admin)
+    return [("natural earth acquisition", download, (Exception,))]
+
+
 def _handle_acquire(args: argparse.Namespace) -> int:
-    config_path = _resolve_config_path(args.config)
-    cfg = load_config(config_path)
+    from planetarble.acquisition import (
+        AcquisitionManager,
+        CopernicusAccessError,
+        CopernicusAuthError,
+        CopernicusCredentialsMissing,
+    )
 
-    manifest_path = args.manifest or (cfg.output_dir / "MANIFEST.json")
+    ctx = _cli_context(args)
+    cfg = ctx.cfg
+
+    manifest_path = args.manifest or (ctx.output_dir / "MANIFEST.json")
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
 
     manager = AcquisitionManager(
         cfg.data_dir,
         manifest_path=manifest_path,
         use_aria2=not args.no_aria2,
+        aria2_extra_flags=cfg.acquire.aria2_extra_flags,
     )
     generation_params: dict[str, object] = {}
-    etopo_path: Path | None = None
+    # ETOPO comes from its own host; it is fetched alongside whichever downloads the
+    # selected tile source needs instead of ahead of them.
+    jobs: list[tuple[str, Callable[[], object], tuple[type[Exception], ...]]] = []
     if cfg.ocean.enabled:
-        try:
-            etopo_path = manager.download_etopo(source_id=cfg.ocean.source_id, force=args.force)
-            generation_params["etopo_path"] = str(etopo_path)
-        except Exception as exc:
-            LOGGER.warning("etopo acquisition skipped: %s", exc)
+        jobs.append(
+            (
+                "etopo acquisition",
+                functools.partial(manager.download_etopo, source_id=cfg.ocean.source_id, force=args.force),
+                (Exception,),
+            )
+        )
 
     if cfg.hls.enabled and cfg.processing.tile_source.lower() == "hls":
         if args.bmng_resolution != "500m":
-            LOGGER.info(
+            _logger().info(
                 "--bmng-resolution is ignored when tile_source is 'hls'",
                 extra={"bmng_resolution": args.bmng_resolution},
             )
         plan_region = args.plan_region or cfg.hls.plan_region
+        jobs.extend(_plan_region_natural_earth_jobs(manager, cfg.hls.plan_regions, force=args.force))
+        results = _run_acquisition_jobs(jobs)
         if cfg.hls.plan_regions:
-            needs_admin = any(region.natural_earth for region in cfg.hls.plan_regions)
-            needs_land = any(region.land_only for region in cfg.hls.plan_regions)
-            if needs_admin or needs_land:
-                try:
-                    manager.download_natural_earth(force=args.force, include_admin=needs_admin)
-                except Exception as exc:
-                    LOGGER.warning("natural earth acquisition skipped: %s", exc)
             summaries = manager.build_hls_plans(cfg.hls, force=args.force, selected_region=plan_region)
             if summaries:
                 generation_params["hls_plan_regions"] = [
@@ -980,69 +1382,117 @@ def _handle_acquire(args: argparse.Namespace) -> int:
                 }
     elif cfg.sentinel2.enabled and cfg.processing.tile_source.lower() == "sentinel2":
         plan_region = args.plan_region or cfg.sentinel2.plan_region
+        jobs.extend(_plan_region_natural_earth_jobs(manager, cfg.sentinel2.plan_regions, force=args.force))
+        results = _run_acquisition_jobs(jobs)
         if cfg.sentinel2.plan_regions:
-            needs_admin = any(region.natural_earth for region in cfg.sentinel2.plan_regions)
-            needs_land = any(region.land_only for region in cfg.sentinel2.plan_regions)
-            if needs_admin or needs_land:
-                try:
-                    manager.download_natural_earth(force=args.force, include_admin=needs_admin)
-                except Exception as exc:
-                    LOGGER.warning("natural earth acquisition skipped: %s", exc)
             if plan_region and not any(region.name == plan_region for region in cfg.sentinel2.plan_regions):
                 raise SystemExit(f"Unknown Sentinel-2 plan region: {plan_region}")
-        LOGGER.info(
+        _logger().info(
             "Sentinel-2 acquisition does not require downloads",
             extra={"plan_region": plan_region},
         )
     else:
-        LOGGER.info(
+        _logger().info(
             "HLS acquisition disabled or tile_source != 'hls'; running legacy Blue Marble pipeline",
             extra={"tile_source": cfg.processing.tile_source, "hls_enabled": cfg.hls.enabled},
         )
-        manager.download_bmng(args.bmng_resolution, force=args.force)
-        manager.download_gebco(force=args.force)
-        manager.download_natural_earth(force=args.force)
-        try:
-            manager.download_modis_mcd43a4(force=args.force)
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except Exception as exc:
-            LOGGER.warning("modis acquisition skipped: %s", exc)
-        try:
-            manager.download_viirs_corrected_reflectance(
-                force=args.force,
-                product=cfg.viirs.product,
-            )
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except Exception as exc:
-            LOGGER.warning("viirs acquisition skipped: %s", exc)
-        try:
-            manager.check_copernicus_connection()
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except Exception as exc:
-            LOGGER.warning("copernicus verification failed: %s", exc)
-
-        copernicus_summary: list[dict[str, object]] = []
-        try:
-            copernicus_summary = manager.download_copernicus_tiles(cfg.copernicus, force=args.force)
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except (CopernicusCredentialsMissing, CopernicusAuthError, CopernicusAccessError) as exc:
-            LOGGER.warning("copernicus tiles skipped: %s", exc)
+        # The legacy sources live on independent hosts and are network-bound, so
+        # fetch them concurrently; the manifest is only written once all settle.
+        copernicus_errors = (CopernicusCredentialsMissing, CopernicusAuthError, CopernicusAccessError)
+        jobs += [
+            ("bmng", functools.partial(manager.download_bmng, args.bmng_resolution, force=args.force), ()),
+            ("gebco", functools.partial(manager.download_gebco, force=args.force), ()),
+            ("natural earth", functools.partial(manager.download_natural_earth, force=args.force), ()),
+            (
+                "modis acquisition",
+                functools.partial(manager.download_modis_mcd43a4, force=args.force),
+                (Exception,),
+            ),
+            (
+                "viirs acquisition",
+                functools.partial(
+                    manager.download_viirs_corrected_reflectance,
+                    force=args.force,
+                    product=cfg.viirs.product,
+                ),
+                (Exception,),
+            ),
+            (
+                "copernicus tiles",
+                functools.partial(manager.download_copernicus_tiles, cfg.copernicus, force=args.force),
+                copernicus_errors,
+            ),
+        ]
+        if not args.force and _copernicus_probe_cached(ctx):
+            _logger().info("copernicus capabilities cached; skipping copernicus connection probe")
+        else:
+            jobs.append(("copernicus verification", manager.check_copernicus_connection, (Exception,)))
+        results = _run_acquisition_jobs(jobs)
+        copernicus_summary = results.get("copernicus tiles") or []
 
         generation_params["bmng_resolution"] = args.bmng_resolution
         if copernicus_summary:
             generation_params["copernicus_layers"] = copernicus_summary
 
+    etopo_path = results.get("etopo acquisition")
+    if etopo_path is not None:
+        generation_params["etopo_path"] = str(etopo_path)
     manager.generate_manifest(generation_params=generation_params or None)
     return 0
 
 
+def _subdirectory_names(root: Path) -> tuple[str, ...]:
+    """Return sorted names of the directories directly under ``root``."""
+
+    # DirEntry caches d_type from readdir, so is_dir() needs no extra stat for
+    # regular entries; symlinked tile directories are still followed.
+    with os.scandir(root) as entries:
+        return tuple(sorted(entry.name for entry in entries if entry.is_dir()))
+
+
+def _require_legacy_inputs(
+    data_dir: Path, cfg: PipelineConfig, *, natural_earth: bool = True
+) -> tuple[Path, Path, Path]:
+    """Return the BMNG, GEBCO and Natural Earth inputs, exiting before any work if one is missing.
+
+    One directory read of ``data_dir`` answers the top-level checks; only the two
+    nested inputs need their own ``stat``. ``natural_earth=False`` skips the
+    Natural Earth check when the archive comes from a URL instead.
+    """
+
+    bmng_dir = data_dir / "bmng" / cfg.processing.bmng_resolution
+    gebco_path = data_dir / "gebco" / f"GEBCO_{cfg.processing.gebco_year}_CF.nc"
+    natural_earth_dir = data_dir / "natural_earth"
+    try:
+        with os.scandir(data_dir) as entries:
+            children = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        children = set()
+    for child, description, path in (
+        ("bmng", "BMNG directory", bmng_dir),
+        ("gebco", "GEBCO file", gebco_path),
+        ("natural_earth", "Natural Earth directory", natural_earth_dir),
+    ):
+        if child == "natural_earth" and not natural_earth:
+            continue
+        if child not in children:
+            raise SystemExit(f"{description} not found: {path}")
+    return (
+        _require_path(bmng_dir, "BMNG directory"),
+        _require_path(gebco_path, "GEBCO file"),
+        _abspath(natural_earth_dir),
+    )
+
+
 def _handle_process(args: argparse.Namespace) -> int:
-    config_path = _resolve_config_path(args.config)
-    cfg = load_config(config_path)
+    from planetarble.acquisition import GSIError, fetch_gsi_ortho_clip
+    from planetarble.logging import log_skip
+    from planetarble.processing import ProcessingManager
+
+    ctx = _cli_context(args)
+    cfg = ctx.cfg
+    data_dir = ctx.data_dir
+    processing_dir = ctx.processing_dir
 
     manager = ProcessingManager(
         cfg.processing,
@@ -1067,7 +1517,7 @@ def _handle_process(args: argparse.Namespace) -> int:
         manifest_path = _resolve_hls_scene_manifest_path(cfg, args.plan_region)
         scene_manifest: Optional[Path] = None
         if _is_valid_hls_scene_manifest(manifest_path) and not args.force:
-            log_skip(LOGGER, phase="process", reason="valid HLS scene manifest", path=str(manifest_path))
+            log_skip(_logger(), phase="process", reason="valid HLS scene manifest", path=str(manifest_path))
             scene_manifest = manifest_path
         else:
             scene_manifest = manager.prepare_hls_scene_manifest(
@@ -1076,22 +1526,22 @@ def _handle_process(args: argparse.Namespace) -> int:
             )
         region = args.plan_region or cfg.hls.plan_region
         if scene_manifest and region:
-            mosaic_path = (cfg.output_dir / "processing" / f"hls_mosaic_{region}_cog.tif").resolve()
+            mosaic_path = processing_dir / f"hls_mosaic_{region}_cog.tif"
             if _is_valid_raster(mosaic_path) and not args.force:
-                log_skip(LOGGER, phase="process", reason="valid HLS mosaic", path=str(mosaic_path))
+                log_skip(_logger(), phase="process", reason="valid HLS mosaic", path=str(mosaic_path))
             else:
                 manager.build_hls_mosaic(scene_manifest, plan_region=args.plan_region)
 
         ocean_outputs: Dict[str, Path] = {}
         if cfg.ocean.enabled:
-            etopo_path = (cfg.data_dir / "etopo" / "ETOPO_2022_15s_bed.tif").resolve()
+            etopo_path = data_dir / "etopo" / "ETOPO_2022_15s_bed.tif"
             if not etopo_path.exists():
-                LOGGER.warning(
+                _logger().warning(
                     "ETOPO raster not found; skipping ocean shading",
                     extra={"path": str(etopo_path)},
                 )
             else:
-                ocean_dir = (cfg.output_dir / "processing" / "ocean").resolve()
+                ocean_dir = processing_dir / "ocean"
                 color_path = ocean_dir / "etopo_depth_color.tif"
                 hillshade_path = ocean_dir / "etopo_hillshade.tif"
                 color_ok = _is_valid_raster(color_path)
@@ -1100,7 +1550,7 @@ def _handle_process(args: argparse.Namespace) -> int:
                     hillshade_ok = _is_valid_raster(hillshade_path)
                 if color_ok and hillshade_ok:
                     log_skip(
-                        LOGGER,
+                        _logger(),
                         phase="process",
                         reason="valid ocean shading outputs",
                         extra={"color": str(color_path), "hillshade": str(hillshade_path)},
@@ -1112,7 +1562,7 @@ def _handle_process(args: argparse.Namespace) -> int:
                 else:
                     ocean_outputs = manager.render_ocean(etopo_path)
 
-        LOGGER.info(
+        _logger().info(
             "HLS preprocessing complete",
             extra={
                 "scene_manifest": str(scene_manifest) if scene_manifest else None,
@@ -1129,7 +1579,7 @@ def _handle_process(args: argparse.Namespace) -> int:
         manifest_path = _resolve_sentinel2_scene_manifest_path(cfg, plan_region)
         scene_manifest: Optional[Path] = None
         if _is_valid_sentinel2_scene_manifest(manifest_path, required_assets=cfg.sentinel2.assets) and not args.force:
-            log_skip(LOGGER, phase="process", reason="valid Sentinel-2 scene manifest", path=str(manifest_path))
+            log_skip(_logger(), phase="process", reason="valid Sentinel-2 scene manifest", path=str(manifest_path))
             scene_manifest = manifest_path
         else:
             scene_manifest = manager.prepare_sentinel2_scene_manifest(
@@ -1143,12 +1593,12 @@ def _handle_process(args: argparse.Namespace) -> int:
                 if plan_region
                 else "sentinel2_mosaic_cog.tif"
             )
-            mosaic_path = (cfg.output_dir / "processing" / mosaic_name).resolve()
+            mosaic_path = processing_dir / mosaic_name
             if _is_valid_raster(mosaic_path) and not args.force:
-                log_skip(LOGGER, phase="process", reason="valid Sentinel-2 mosaic", path=str(mosaic_path))
+                log_skip(_logger(), phase="process", reason="valid Sentinel-2 mosaic", path=str(mosaic_path))
             else:
                 manager.build_sentinel2_mosaic(scene_manifest, force=args.force, plan_region=plan_region)
-        LOGGER.info(
+        _logger().info(
             "Sentinel-2 preprocessing complete",
             extra={"scene_manifest": str(scene_manifest) if scene_manifest else None},
         )
@@ -1161,9 +1611,9 @@ def _handle_process(args: argparse.Namespace) -> int:
         except (SystemExit, KeyboardInterrupt):
             raise
         except Exception as exc:
-            LOGGER.warning("copernicus processing skipped: %s", exc)
+            _logger().warning("copernicus processing skipped: %s", exc)
             copernicus_cogs = []
-        LOGGER.info(
+        _logger().info(
             "Copernicus preprocessing complete",
             extra={"copernicus_cogs": [str(path) for path in copernicus_cogs]},
         )
@@ -1171,12 +1621,12 @@ def _handle_process(args: argparse.Namespace) -> int:
     if tile_source == "gsi_orthophotos":
         if not cfg.gsi_orthophotos.enabled:
             raise SystemExit("GSI processing requested but gsi_orthophotos.enabled is false")
-        gsi_output = (cfg.output_dir / "processing" / f"{cfg.gsi_orthophotos.output_basename}.tif").resolve()
+        gsi_output = processing_dir / f"{cfg.gsi_orthophotos.output_basename}.tif"
         product_slug = "seamlessphoto" if cfg.gsi_orthophotos.product == "seamlessphoto" else "orthophoto"
         gsi_cache_root = cfg.data_dir / "cache" / f"gsi_{product_slug}"
         if not args.dry_run:
             gsi_cache_root.mkdir(parents=True, exist_ok=True)
-        LOGGER.info("gsi tile cache", extra={"path": str(gsi_cache_root)})
+        _logger().info("gsi tile cache", extra={"path": str(gsi_cache_root)})
         try:
             gsi_summary = fetch_gsi_ortho_clip(
                 lat=cfg.gsi_orthophotos.lat,
@@ -1194,28 +1644,26 @@ def _handle_process(args: argparse.Namespace) -> int:
             )
         except GSIError as exc:
             raise SystemExit(f"Failed to fetch GSI orthophotos: {exc}") from exc
-        LOGGER.info(
+        _logger().info(
             "GSI preprocessing complete",
             extra={"output": gsi_summary.get("output") if gsi_summary else str(gsi_output)},
         )
         return 0
 
-    bmng_dir = (cfg.data_dir / "bmng" / cfg.processing.bmng_resolution).resolve()
-    if not bmng_dir.exists():
-        raise SystemExit(f"BMNG directory not found: {bmng_dir}")
+    natural_earth_url = args.natural_earth_url
+    if natural_earth_url is not None and not natural_earth_url.startswith(("http://", "https://")):
+        raise SystemExit(f"--natural-earth-url must be an http(s) URL: {natural_earth_url}")
+    bmng_dir, gebco_path, natural_earth_dir = _require_legacy_inputs(
+        data_dir, cfg, natural_earth=natural_earth_url is None
+    )
     bmng_panels = tuple(sorted(bmng_dir.glob("*.tif")))
     bmng_source = manager.compose_bmng_panels(bmng_dir)
     normalized = manager.normalize_bmng(bmng_source, source_files=bmng_panels)
 
-    gebco_path = (cfg.data_dir / "gebco" / f"GEBCO_{cfg.processing.gebco_year}_CF.nc").resolve()
-    if not gebco_path.exists():
-        raise SystemExit(f"GEBCO file not found: {gebco_path}")
     hillshade = manager.generate_hillshade(gebco_path)
 
-    natural_earth_dir = (cfg.data_dir / "natural_earth").resolve()
-    if not natural_earth_dir.exists():
-        raise SystemExit(f"Natural Earth directory not found: {natural_earth_dir}")
-    masks_dir = manager.create_masks(natural_earth_dir)
+    # The URL stays a str: a Path would collapse the scheme's "//".
+    masks_dir = manager.create_masks(natural_earth_url or natural_earth_dir)
 
     cog_path = manager.create_cog(normalized)
 
@@ -1223,10 +1671,8 @@ def _handle_process(args: argparse.Namespace) -> int:
     if cfg.modis.enabled:
         if not cfg.modis.doy:
             raise SystemExit("modis.doy must be set when modis.enabled is true")
-        modis_root = (cfg.data_dir / "modis_mcd43a4" / cfg.modis.doy).resolve()
-        if not modis_root.exists():
-            raise SystemExit(f"MODIS directory not found: {modis_root}")
-        tiles = cfg.modis.tiles or tuple(sorted(p.name for p in modis_root.iterdir() if p.is_dir()))
+        modis_root = _require_path(data_dir / "modis_mcd43a4" / cfg.modis.doy, "MODIS directory")
+        tiles = cfg.modis.tiles or _subdirectory_names(modis_root)
         if not tiles:
             raise SystemExit(f"No MODIS tiles found under {modis_root}")
         modis_cog_path = manager.prepare_modis_rgb(
@@ -1239,12 +1685,8 @@ def _handle_process(args: argparse.Namespace) -> int:
     if cfg.viirs.enabled:
         if not cfg.viirs.date:
             raise SystemExit("viirs.date must be set when viirs.enabled is true")
-        viirs_root = (cfg.data_dir / "viirs_vnp09ga" / cfg.viirs.date).resolve()
-        if not viirs_root.exists():
-            raise SystemExit(f"VIIRS directory not found: {viirs_root}")
-        tiles = cfg.viirs.tiles or tuple(
-            sorted(p.name for p in viirs_root.iterdir() if p.is_dir())
-        )
+        viirs_root = _require_path(data_dir / "viirs_vnp09ga" / cfg.viirs.date, "VIIRS directory")
+        tiles = cfg.viirs.tiles or _subdirectory_names(viirs_root)
         if not tiles:
             raise SystemExit(f"No VIIRS tiles found under {viirs_root}")
         viirs_cog_path = manager.prepare_viirs_rgb(
@@ -1260,17 +1702,17 @@ def _handle_process(args: argparse.Namespace) -> int:
         except (SystemExit, KeyboardInterrupt):
             raise
         except Exception as exc:
-            LOGGER.warning("copernicus processing skipped: %s", exc)
+            _logger().warning("copernicus processing skipped: %s", exc)
 
     gsi_summary: dict[str, object] | None = None
     gsi_cog_path: Path | None = None
     if cfg.gsi_orthophotos.enabled:
-        gsi_output = (cfg.output_dir / "processing" / f"{cfg.gsi_orthophotos.output_basename}.tif").resolve()
+        gsi_output = processing_dir / f"{cfg.gsi_orthophotos.output_basename}.tif"
         product_slug = "seamlessphoto" if cfg.gsi_orthophotos.product == "seamlessphoto" else "orthophoto"
         gsi_cache_root = cfg.data_dir / "cache" / f"gsi_{product_slug}"
         if not args.dry_run:
             gsi_cache_root.mkdir(parents=True, exist_ok=True)
-        LOGGER.info("gsi tile cache", extra={"path": str(gsi_cache_root)})
+        _logger().info("gsi tile cache", extra={"path": str(gsi_cache_root)})
         try:
             gsi_summary = fetch_gsi_ortho_clip(
                 lat=cfg.gsi_orthophotos.lat,
@@ -1291,7 +1733,7 @@ def _handle_process(args: argparse.Namespace) -> int:
         gsi_output_str = gsi_summary.get("output") if gsi_summary else str(gsi_output)
         gsi_cog_path = Path(gsi_output_str)
 
-    LOGGER.info("processing outputs", extra={
+    _logger().info("processing outputs", extra={
         "bmng_mosaic": str(bmng_source),
         "normalized": str(normalized),
         "hillshade": str(hillshade),
@@ -1306,18 +1748,120 @@ def _handle_process(args: argparse.Namespace) -> int:
     return 0
 
 
+# Tile source pickers take the indexed processing outputs, the processing
+# directory, the pipeline config and the --plan-region value.
+_SourcePicker = Callable[[Dict[str, list[Path]], Path, "PipelineConfig", Optional[str]], Path]
+
+
+def _pick_bmng(
+    outputs: dict[str, list[Path]], processing_dir: Path, cfg: PipelineConfig, plan_region: Optional[str]
+) -> Path:
+    return outputs["normalized"][0]
+
+
+def _pick_modis(
+    outputs: dict[str, list[Path]], processing_dir: Path, cfg: PipelineConfig, plan_region: Optional[str]
+) -> Path:
+    if not outputs["modis"]:
+        raise SystemExit("MODIS tile source selected but no modis_*_rgb_cog.tif found; run process stage")
+    return outputs["modis"][0]
+
+
+def _pick_viirs(
+    outputs: dict[str, list[Path]], processing_dir: Path, cfg: PipelineConfig, plan_region: Optional[str]
+) -> Path:
+    if not outputs["viirs"]:
+        raise SystemExit("VIIRS tile source selected but no viirs_*_rgb_cog.tif found; run process stage")
+    return outputs["viirs"][0]
+
+
+def _pick_copernicus(
+    outputs: dict[str, list[Path]], processing_dir: Path, cfg: PipelineConfig, plan_region: Optional[str]
+) -> Path:
+    copernicus_candidates = _resolve_copernicus_cog(cfg.copernicus.layers, outputs["copernicus"])
+    if not copernicus_candidates:
+        raise SystemExit(
+            "Copernicus tile source selected but no copernicus_*_cog.tif found; run process stage"
+        )
+    return copernicus_candidates[0]
+
+
+def _pick_sentinel2(
+    outputs: dict[str, list[Path]], processing_dir: Path, cfg: PipelineConfig, plan_region: Optional[str]
+) -> Path:
+    plan_region = plan_region or cfg.sentinel2.plan_region
+    if cfg.sentinel2.plan_regions and not plan_region:
+        raise SystemExit("sentinel2.plan_regions is set; pass --plan-region or set sentinel2.plan_region")
+    filename = (
+        f"sentinel2_mosaic_{plan_region}_cog.tif"
+        if plan_region
+        else "sentinel2_mosaic_cog.tif"
+    )
+    sentinel2_candidate = processing_dir / filename
+    if not sentinel2_candidate.exists():
+        raise SystemExit(
+            "Sentinel-2 tile source selected but no sentinel2_mosaic_cog.tif found; run process stage"
+        )
+    return sentinel2_candidate
+
+
+def _pick_gsi_orthophotos(
+    outputs: dict[str, list[Path]], processing_dir: Path, cfg: PipelineConfig, plan_region: Optional[str]
+) -> Path:
+    gsi_candidate = processing_dir / f"{cfg.gsi_orthophotos.output_basename}.tif"
+    if not gsi_candidate.exists():
+        raise SystemExit(
+            "GSI tile source selected but no GSI orthophoto COG found; run process stage"
+        )
+    return gsi_candidate
+
+
+def _pick_blend(
+    outputs: dict[str, list[Path]], processing_dir: Path, cfg: PipelineConfig, plan_region: Optional[str]
+) -> Path:
+    raise SystemExit("tile_source=blend is not implemented yet")
+
+
+def _pick_hls(
+    outputs: dict[str, list[Path]], processing_dir: Path, cfg: PipelineConfig, plan_region: Optional[str]
+) -> Path:
+    region = plan_region or cfg.hls.plan_region
+    if not region:
+        raise SystemExit("tile_source=hls requires --plan-region or hls.plan_region in config")
+    return _require_path(processing_dir / f"hls_mosaic_{region}_cog.tif", "HLS mosaic COG")
+
+
+_TILE_SOURCE_HANDLERS: dict[str, _SourcePicker] = {
+    "bmng": _pick_bmng,
+    "modis": _pick_modis,
+    "viirs": _pick_viirs,
+    "copernicus": _pick_copernicus,
+    "sentinel2": _pick_sentinel2,
+    "gsi_orthophotos": _pick_gsi_orthophotos,
+    "blend": _pick_blend,
+    "hls": _pick_hls,
+}
+
+
 def _handle_tile(args: argparse.Namespace) -> int:
-    config_path = _resolve_config_path(args.config)
-    cfg = load_config(config_path)
+    from planetarble.logging import log_skip
+    from planetarble.tiling import TilingManager
 
+    ctx = _cli_context(args)
+    cfg = ctx.cfg
+
+    overrides: dict[str, object] = {}
     if args.tile_format is not None:
-        cfg.processing.tile_format = args.tile_format
+        overrides["tile_format"] = args.tile_format
     if args.quality is not None:
-        cfg.processing.tile_quality = args.quality
+        overrides["tile_quality"] = args.quality
     if args.min_zoom is not None:
-        cfg.processing.min_zoom = args.min_zoom
+        overrides["min_zoom"] = args.min_zoom
     if args.max_zoom is not None:
-        cfg.processing.max_zoom = args.max_zoom
+        overrides["max_zoom"] = args.max_zoom
+    if overrides:
+        # The loaded config is cached; apply CLI overrides to a copy.
+        cfg = dataclasses.replace(cfg, processing=dataclasses.replace(cfg.processing, **overrides))
 
     manager = TilingManager(
         cfg.processing,
@@ -1326,67 +1870,17 @@ def _handle_tile(args: argparse.Namespace) -> int:
         dry_run=args.dry_run,
     )
 
-    processing_dir = (cfg.output_dir / "processing").resolve()
-    if not processing_dir.exists():
-        raise SystemExit(f"Processing directory not found: {processing_dir}")
+    processing_dir = _require_path(ctx.processing_dir, "Processing directory")
 
-    source_candidates = sorted(processing_dir.glob("*_normalized_cog.tif"))
-    if not source_candidates:
+    outputs = _index_processing_dir(processing_dir)
+    if not outputs["normalized"]:
         raise SystemExit("No normalized COG raster found; run the process stage first")
-    source_raster = source_candidates[0]
 
     tile_source = (cfg.processing.tile_source or cfg.modis.tile_source or "bmng").lower()
-
-    if tile_source == "modis":
-        modis_candidates = sorted(processing_dir.glob("modis_*_rgb_cog.tif"))
-        if not modis_candidates:
-            raise SystemExit("MODIS tile source selected but no modis_*_rgb_cog.tif found; run process stage")
-        source_raster = modis_candidates[0]
-    elif tile_source == "viirs":
-        viirs_candidates = sorted(processing_dir.glob("viirs_*_rgb_cog.tif"))
-        if not viirs_candidates:
-            raise SystemExit("VIIRS tile source selected but no viirs_*_rgb_cog.tif found; run process stage")
-        source_raster = viirs_candidates[0]
-    elif tile_source == "copernicus":
-        copernicus_candidates = _resolve_copernicus_cog(processing_dir, cfg.copernicus.layers)
-        if not copernicus_candidates:
-            raise SystemExit(
-                "Copernicus tile source selected but no copernicus_*_cog.tif found; run process stage"
-            )
-        source_raster = copernicus_candidates[0]
-    elif tile_source == "sentinel2":
-        plan_region = args.plan_region or cfg.sentinel2.plan_region
-        if cfg.sentinel2.plan_regions and not plan_region:
-            raise SystemExit("sentinel2.plan_regions is set; pass --plan-region or set sentinel2.plan_region")
-        filename = (
-            f"sentinel2_mosaic_{plan_region}_cog.tif"
-            if plan_region
-            else "sentinel2_mosaic_cog.tif"
-        )
-        sentinel2_candidate = (cfg.output_dir / "processing" / filename).resolve()
-        if not sentinel2_candidate.exists():
-            raise SystemExit(
-                "Sentinel-2 tile source selected but no sentinel2_mosaic_cog.tif found; run process stage"
-            )
-        source_raster = sentinel2_candidate
-    elif tile_source == "gsi_orthophotos":
-        gsi_candidate = (cfg.output_dir / "processing" / f"{cfg.gsi_orthophotos.output_basename}.tif").resolve()
-        if not gsi_candidate.exists():
-            raise SystemExit(
-                "GSI tile source selected but no GSI orthophoto COG found; run process stage"
-            )
-        source_raster = gsi_candidate
-    elif tile_source == "blend":
-        raise SystemExit("tile_source=blend is not implemented yet")
-    elif tile_source == "hls":
-        region = args.plan_region or cfg.hls.plan_region
-        if not region:
-            raise SystemExit("tile_source=hls requires --plan-region or hls.plan_region in config")
-        source_raster = (cfg.output_dir / "processing" / f"hls_mosaic_{region}_cog.tif").resolve()
-        if not source_raster.exists():
-            raise SystemExit(f"HLS mosaic COG not found: {source_raster}")
-    elif tile_source != "bmng":
+    pick_source = _TILE_SOURCE_HANDLERS.get(tile_source)
+    if pick_source is None:
         raise SystemExit(f"Unsupported tile_source value: {cfg.processing.tile_source}")
+    source_raster = pick_source(outputs, processing_dir, cfg, args.plan_region)
 
     mbtiles_destination = None
     if tile_source == "hls":
@@ -1403,13 +1897,18 @@ def _handle_tile(args: argparse.Namespace) -> int:
             / f"planet_{cfg.processing.gebco_year}_{cfg.processing.max_zoom}z.mbtiles"
         )
     if _is_valid_mbtiles(mbtiles_destination) and not args.force:
-        log_skip(LOGGER, phase="tile", reason="valid MBTiles", path=str(mbtiles_destination))
+        log_skip(_logger(), phase="tile", reason="valid MBTiles", path=str(mbtiles_destination))
         return 0
     if args.force and mbtiles_destination.exists() and not args.dry_run:
         mbtiles_destination.unlink()
-    mbtiles_path = manager.create_mbtiles(source_raster, destination=mbtiles_destination)
+    if args.shards is not None and args.shards > 1:
+        mbtiles_path = manager.create_mbtiles_parallel(
+            source_raster, args.shards, destination=mbtiles_destination
+        )
+    else:
+        mbtiles_path = manager.create_mbtiles(source_raster, destination=mbtiles_destination)
 
-    LOGGER.info("tiling outputs", extra={
+    _logger().info("tiling outputs", extra={
         "source": str(source_raster),
         "mbtiles": str(mbtiles_path),
     })
@@ -1429,6 +1928,10 @@ def _resolve_gsi_tile_template(config: GSIOrthophotoConfig) -> str:
 
 
 def _handle_tiling_pmtiles(args: argparse.Namespace) -> int:
+    from planetarble.core.models import ProcessingConfig
+    from planetarble.tiling import PmtilesTilingManager
+    from planetarble.tiling.pmtiles import direct_pmtiles_available
+
     source_path = args.input.resolve()
     if not source_path.exists():
         raise SystemExit(f"Input raster not found: {source_path}")
@@ -1469,36 +1972,68 @@ def _handle_tiling_pmtiles(args: argparse.Namespace) -> int:
         resampling=resampling,
     )
 
-    mbtiles_path = manager.pack_mbtiles(
-        zxy_dir,
-        source_path=source_path,
-        tile_format=tile_format,
-        min_zoom=min_zoom,
-        max_zoom=max_zoom,
-        name=name,
-        attribution=attribution,
-        bounds_mode=args.bounds_mode,
-    )
-
     pmtiles_destination = output_dir / f"{source_path.stem}_{min_zoom}-{max_zoom}.pmtiles"
-    pmtiles_path = manager.convert_pmtiles(
-        mbtiles_path,
-        destination=pmtiles_destination,
-        deduplicate=deduplicate,
-        cluster=args.cluster,
-    )
+    mbtiles_path: Path | None = None
+    if shutil.which("mb-util") is None and direct_pmtiles_available():
+        if args.cluster:
+            _logger().info("direct PMTiles writer emits clustered archives; skipping pmtiles cluster")
+        if not deduplicate:
+            _logger().info("direct PMTiles writer always stores identical tiles once; ignoring --no-deduplication")
+        pmtiles_path = manager.direct_zxy_to_pmtiles(
+            zxy_dir,
+            pmtiles_destination,
+            source_path=source_path,
+            tile_format=tile_format,
+            min_zoom=min_zoom,
+            max_zoom=max_zoom,
+            name=name,
+            attribution=attribution,
+            bounds_mode=args.bounds_mode,
+        )
+    elif args.drop_mbtiles or args.scratch_dir is not None:
+        pmtiles_path = manager.pack_and_convert(
+            zxy_dir,
+            source_path=source_path,
+            tile_format=tile_format,
+            min_zoom=min_zoom,
+            max_zoom=max_zoom,
+            name=name,
+            attribution=attribution,
+            bounds_mode=args.bounds_mode,
+            destination=pmtiles_destination,
+            deduplicate=deduplicate,
+            cluster=args.cluster,
+            scratch_dir=args.scratch_dir.resolve() if args.scratch_dir else None,
+        )
+    else:
+        mbtiles_path = manager.pack_mbtiles(
+            zxy_dir,
+            source_path=source_path,
+            tile_format=tile_format,
+            min_zoom=min_zoom,
+            max_zoom=max_zoom,
+            name=name,
+            attribution=attribution,
+            bounds_mode=args.bounds_mode,
+        )
+        pmtiles_path = manager.convert_pmtiles(
+            mbtiles_path,
+            destination=pmtiles_destination,
+            deduplicate=deduplicate,
+            cluster=args.cluster,
+        )
 
     manager.verify(pmtiles_path)
     header = manager.show_header(pmtiles_path)
     if header:
-        LOGGER.info("pmtiles header", extra=header)
+        _logger().info("pmtiles header", extra=header)
 
     if not args.dry_run:
-        LOGGER.info(
+        _logger().info(
             "pmtiles build complete",
             extra={
                 "pmtiles": str(pmtiles_path),
-                "mbtiles": str(mbtiles_path),
+                "mbtiles": str(mbtiles_path) if mbtiles_path else None,
                 "zxy_dir": str(zxy_dir),
             },
         )
@@ -1506,11 +2041,13 @@ def _handle_tiling_pmtiles(args: argparse.Namespace) -> int:
 
 
 def _handle_merge_mbtiles(args: argparse.Namespace) -> int:
+    from planetarble.tiling.mbtiles import merge_mbtiles
+
     base = args.base.resolve()
     overlay = args.overlay.resolve()
     out = args.out.resolve()
     merged = merge_mbtiles(base, overlay, destination=out)
-    LOGGER.info(
+    _logger().info(
         "mbtiles merge complete",
         extra={"base": str(base), "overlay": str(overlay), "output": str(merged)},
     )
@@ -1520,6 +2057,8 @@ def _handle_merge_mbtiles(args: argparse.Namespace) -> int:
 def _handle_union_mbtiles(args: argparse.Namespace) -> int:
     import time
 
+    from planetarble.tiling.mbtiles import union_mbtiles
+
     inputs = [p.resolve() for p in args.inputs]
     out = args.out.resolve()
     start = time.monotonic()
@@ -1531,7 +2070,7 @@ def _handle_union_mbtiles(args: argparse.Namespace) -> int:
             return
         last[0] = now
         elapsed = now - start
-        LOGGER.info(
+        _logger().info(
             "mbtiles union progress",
             extra={"inserted": inserted,
                    "tiles_per_s": round(inserted / elapsed) if elapsed else 0,
@@ -1539,7 +2078,7 @@ def _handle_union_mbtiles(args: argparse.Namespace) -> int:
         )
 
     union_mbtiles(inputs, out, chunk_size=args.chunk_size, on_progress=_progress)
-    LOGGER.info(
+    _logger().info(
         "mbtiles union complete",
         extra={"inputs": [str(p) for p in inputs], "output": str(out),
                "seconds": round(time.monotonic() - start, 1)},
@@ -1563,7 +2102,7 @@ def _handle_stitch_512(args: argparse.Namespace) -> int:
             return
         last[0] = now
         elapsed = now - start
-        LOGGER.info(
+        _logger().info(
             "stitch-512 progress",
             extra={"out_tiles": written,
                    "tiles_per_s": round(written / elapsed) if elapsed else 0,
@@ -1572,7 +2111,7 @@ def _handle_stitch_512(args: argparse.Namespace) -> int:
 
     stitch_to_512(source, out, tile_format=args.format, quality=args.quality,
                   workers=args.workers, shard_dir=args.shard_dir, on_progress=_progress)
-    LOGGER.info(
+    _logger().info(
         "stitch-512 complete",
         extra={"source": str(source), "output": str(out),
                "seconds": round(time.monotonic() - start, 1)},
@@ -1580,31 +2119,67 @@ def _handle_stitch_512(args: argparse.Namespace) -> int:
     return 0
 
 
+# tile_source -> (label template, attribution, license data-source line)
+_IMAGERY_TABLE: dict[str, tuple[str, str, str]] = {
+    "modis": (
+        "MODIS MCD43A4 ({modis_date})",
+        "Imagery: NASA MODIS MCD43A4 (LP DAAC).",
+        "- MODIS MCD43A4 BRDF-Corrected Reflectance (NASA LP DAAC).",
+    ),
+    "viirs": (
+        "VIIRS Corrected Reflectance ({viirs_product} {viirs_date})",
+        "Imagery: NASA VIIRS Corrected Reflectance (LP DAAC).",
+        "- VIIRS Corrected Reflectance (VNP09GA, NASA LP DAAC).",
+    ),
+    "copernicus": (
+        "Copernicus Sentinel-2 Level-2A",
+        "Imagery: Copernicus Sentinel-2 (European Space Agency).",
+        "- Copernicus Sentinel-2 Level-2A (European Space Agency).",
+    ),
+    "sentinel2": (
+        "Sentinel-2 L2A (Microsoft Planetary Computer)",
+        "Imagery: Copernicus Sentinel-2 (European Space Agency).",
+        "- Copernicus Sentinel-2 Level-2A via Microsoft Planetary Computer.",
+    ),
+    "gsi_orthophotos": (
+        "GSI Seamless Orthophoto",
+        "Imagery: Geospatial Information Authority of Japan (GSI) Seamless Orthophotography.",
+        "- Geospatial Information Authority of Japan Seamless Orthophotography.",
+    ),
+    "bmng": (
+        "NASA Blue Marble Next Generation (2004)",
+        "Imagery: NASA Blue Marble (2004).",
+        "- NASA Blue Marble Next Generation (2004).",
+    ),
+}
+
+
 def _handle_package(args: argparse.Namespace) -> int:
-    config_path = _resolve_config_path(args.config)
-    cfg = load_config(config_path)
+    from planetarble.core.models import TileMetadata
+    from planetarble.logging import log_skip
+    from planetarble.packaging import PackagingManager
+
+    ctx = _cli_context(args)
+    cfg = ctx.cfg
 
-    tiling_dir = (cfg.output_dir / "tiling").resolve()
-    if not tiling_dir.exists():
-        raise SystemExit(f"Tiling directory not found: {tiling_dir}")
+    output_dir = ctx.output_dir
+    tiling_dir = _require_path(ctx.tiling_dir, "Tiling directory")
     if args.input is not None:
-        mbtiles_path = args.input.resolve()
-        if not mbtiles_path.exists():
-            raise SystemExit(f"MBTiles archive not found: {mbtiles_path}")
+        mbtiles_path = _require_path(args.input, "MBTiles archive")
     else:
-        mbtiles_candidates = sorted(
-            tiling_dir.glob(f"planet_{cfg.processing.gebco_year}_{cfg.processing.max_zoom}z.mbtiles")
+        mbtiles_path = min(
+            tiling_dir.glob(f"planet_{cfg.processing.gebco_year}_{cfg.processing.max_zoom}z.mbtiles"),
+            default=None,
         )
-        if not mbtiles_candidates:
+        if mbtiles_path is None:
             raise SystemExit("No MBTiles archive found; run the tile stage first")
-        mbtiles_path = mbtiles_candidates[0]
 
     pmtiles_name = args.pmtiles_name or f"planet_{cfg.processing.gebco_year}_{cfg.processing.max_zoom}z.pmtiles"
     pmtiles_destination = tiling_dir / pmtiles_name
     tilejson_destination = pmtiles_destination.with_suffix(".tilejson.json")
     if _is_valid_pmtiles(pmtiles_destination) and _is_valid_tilejson(tilejson_destination) and not args.force:
         log_skip(
-            LOGGER,
+            _logger(),
             phase="package",
             reason="valid PMTiles and TileJSON",
             extra={"pmtiles": str(pmtiles_destination), "tilejson": str(tilejson_destination)},
@@ -1616,25 +2191,14 @@ def _handle_package(args: argparse.Namespace) -> int:
 
     tile_source = (cfg.processing.tile_source or cfg.modis.tile_source or "bmng").lower()
 
-    if tile_source == "modis":
-        imagery_label = f"MODIS MCD43A4 ({cfg.modis.doy or 'unknown date'})"
-        imagery_attribution = "Imagery: NASA MODIS MCD43A4 (LP DAAC)."
-    elif tile_source == "viirs":
-        product = cfg.viirs.product or "VNP09GA"
-        imagery_label = f"VIIRS Corrected Reflectance ({product} {cfg.viirs.date or 'daily'})"
-        imagery_attribution = "Imagery: NASA VIIRS Corrected Reflectance (LP DAAC)."
-    elif tile_source == "copernicus":
-        imagery_label = "Copernicus Sentinel-2 Level-2A"
-        imagery_attribution = "Imagery: Copernicus Sentinel-2 (European Space Agency)."
-    elif tile_source == "sentinel2":
-        imagery_label = "Sentinel-2 L2A (Microsoft Planetary Computer)"
-        imagery_attribution = "Imagery: Copernicus Sentinel-2 (European Space Agency)."
-    elif tile_source == "gsi_orthophotos":
-        imagery_label = "GSI Seamless Orthophoto"
-        imagery_attribution = "Imagery: Geospatial Information Authority of Japan (GSI) Seamless Orthophotography."
-    else:
-        imagery_label = "NASA Blue Marble Next Generation (2004)"
-        imagery_attribution = "Imagery: NASA Blue Marble (2004)."
+    label_template, imagery_attribution, imagery_line = _IMAGERY_TABLE.get(
+        tile_source, _IMAGERY_TABLE["bmng"]
+    )
+    imagery_label = label_template.format(
+        modis_date=cfg.modis.doy or "unknown date",
+        viirs_product=cfg.viirs.product or "VNP09GA",
+        viirs_date=cfg.viirs.date or "daily",
+    )
 
     mbtiles_meta = _read_mbtiles_metadata(mbtiles_path)
     bounds = tuple(mbtiles_meta.get("bounds") or (-180.0, -85.0511, 180.0, 85.0511))
@@ -1658,15 +2222,7 @@ def _handle_package(args: argparse.Namespace) -> int:
     )
     tilejson_path = packaging.generate_tilejson(pmtiles_path, metadata)
 
-    manifest_path = (cfg.output_dir / "MANIFEST.json").resolve()
-    imagery_line = {
-        "modis": "- MODIS MCD43A4 BRDF-Corrected Reflectance (NASA LP DAAC).",
-        "viirs": "- VIIRS Corrected Reflectance (VNP09GA, NASA LP DAAC).",
-        "copernicus": "- Copernicus Sentinel-2 Level-2A (European Space Agency).",
-        "sentinel2": "- Copernicus Sentinel-2 Level-2A via Microsoft Planetary Computer.",
-        "gsi_orthophotos": "- Geospatial Information Authority of Japan Seamless Orthophotography.",
-    }.get(tile_source, "- NASA Blue Marble Next Generation (2004).")
-
+    manifest_path = output_dir / "MANIFEST.json"
     license_text = (
         "Planetarble Distribution\n\n"
         "Data Sources:\n"
@@ -1685,7 +2241,7 @@ def _handle_package(args: argparse.Namespace) -> int:
         destination=cfg.output_dir / "distribution",
     )
 
-    LOGGER.info("packaging outputs", extra={
+    _logger().info("packaging outputs", extra={
         "mbtiles": str(mbtiles_path),
         "pmtiles": str(pmtiles_path),
         "tilejson": str(tilejson_path),
@@ -1695,6 +2251,10 @@ def _handle_package(args: argparse.Namespace) -> int:
 
 
 def _handle_serve(args: argparse.Namespace) -> int:
+    import http.server
+
+    from planetarble.cli.range_server import RangeRequestHandler
+
     if args.pmtiles is None and not args.region:
         raise SystemExit("--pmtiles or --region must be provided")
     if args.pmtiles is not None and args.region:
@@ -1703,7 +2263,7 @@ def _handle_serve(args: argparse.Namespace) -> int:
     if args.pmtiles is not None:
         pmtiles_path = args.pmtiles.resolve()
     else:
-        cfg = load_config(_resolve_config_path(args.config))
+        cfg = _load_config(args.config)
         region = args.region
         distribution_dir = (cfg.output_dir / "distribution").resolve()
         region_variants = [region]
@@ -1730,7 +2290,7 @@ def _handle_serve(args: argparse.Namespace) -> int:
         except Exception:
             center = None
         else:
-            cfg = load_config(_resolve_config_path(args.config))
+            cfg = _load_config(args.config)
             region_name = args.region
             region_config = None
             for item in cfg.hls.plan_regions:
@@ -1753,7 +2313,7 @@ def _handle_serve(args: argparse.Namespace) -> int:
     ui_port = args.ui_port
     tiles_port = args.tiles_port
     if tiles_port != ui_port:
-        LOGGER.warning(
+        _logger().warning(
             "serve uses a single HTTP server; ignoring tiles-port",
             extra={"tiles_port": tiles_port, "ui_port": ui_port},
         )
@@ -1770,28 +2330,28 @@ def _handle_serve(args: argparse.Namespace) -> int:
     ui_url = f"http://{bind_host}:{ui_port}/viewer/"
     pmtiles_url = f"http://{bind_host}:{ui_port}/{pmtiles_path.name}"
 
-    LOGGER.info(
+    _logger().info(
         "serve starting",
         extra={"pmtiles": str(pmtiles_path), "viewer": str(viewer_target)},
     )
-    LOGGER.info("serve commands", extra={"ui": f"python -m planetarble serve {tiles_host}:{ui_port}"})
+    _logger().info("serve commands", extra={"ui": f"python -m planetarble serve {tiles_host}:{ui_port}"})
     viewer_url = f"{ui_url}?pmtiles={pmtiles_url}"
     if center is not None:
         viewer_url = f"{viewer_url}#8/{center[1]}/{center[0]}"
-    LOGGER.info("serve urls", extra={"viewer": viewer_url, "pmtiles": pmtiles_url})
-    LOGGER.info("open viewer: %s", viewer_url)
+    _logger().info("serve urls", extra={"viewer": viewer_url, "pmtiles": pmtiles_url})
+    _logger().info("open viewer: %s", viewer_url)
 
     try:
         if args.open:
             import webbrowser
 
             webbrowser.open(f"{ui_url}?pmtiles={pmtiles_url}")
-        handler = functools.partial(_RangeRequestHandler, directory=str(distribution_dir))
+        handler = functools.partial(RangeRequestHandler, directory=str(distribution_dir))
         httpd = http.server.ThreadingHTTPServer((tiles_host, ui_port), handler)
-        LOGGER.info("serve http", extra={"address": f"{tiles_host}:{ui_port}"})
+        _logger().info("serve http", extra={"address": f"{tiles_host}:{ui_port}"})
         httpd.serve_forever()
     except KeyboardInterrupt:
-        LOGGER.info("serve interrupted; shutting down")
+        _logger().info("serve interrupted; shutting down")
     finally:
         try:
             httpd.shutdown()  # type: ignore[name-defined]
@@ -1800,72 +2360,13 @@ def _handle_serve(args: argparse.Namespace) -> int:
     return 0
 
 
-class _RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
-    """Serve files with HTTP range support for PMTiles."""
-
-    def send_head(self):  # type: ignore[override]
-        path = self.translate_path(self.path)
-        if not os.path.exists(path):
-            return super().send_head()
-        if os.path.isdir(path):
-            return super().send_head()
-
-        f = None
-        try:
-            f = open(path, "rb")
-            fs = os.fstat(f.fileno())
-            size = fs.st_size
-            range_header = self.headers.get("Range")
-            if range_header:
-                start, end = self._parse_range(range_header, size)
-                if start is None:
-                    self.send_error(416, "Requested Range Not Satisfiable")
-                    return None
-                self.send_response(206)
-                self.send_header("Content-Type", self.guess_type(path))
-                self.send_header("Accept-Ranges", "bytes")
-                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
-                self.send_header("Content-Length", str(end - start + 1))
-                self.end_headers()
-                f.seek(start)
-                self.wfile.write(f.read(end - start + 1))
-                f.close()
-                return None
-
-            self.send_response(200)
-            self.send_header("Content-Type", self.guess_type(path))
-            self.send_header("Content-Length", str(size))
-            self.send_header("Accept-Ranges", "bytes")
-            self.end_headers()
-            return f
-        except OSError:
-            if f:
-                f.close()
-            self.send_error(404, "File not found")
-            return None
-
-    def _parse_range(self, header: str, size: int) -> tuple[Optional[int], int]:
-        if not header.startswith("bytes="):
-            return None, 0
-        range_spec = header.split("=", 1)[1]
-        if "," in range_spec:
-            range_spec = range_spec.split(",", 1)[0]
-        start_str, end_str = range_spec.split("-", 1)
-        if start_str == "":
-            length = int(end_str)
-            start = max(size - length, 0)
-            end = size - 1
-            return start, end
-        start = int(start_str)
-        end = int(end_str) if end_str else size - 1
-        if start >= size:
-            return None, 0
-        end = min(end, size - 1)
-        return start, end
-
-
 def _handle_copernicus_layers(args: argparse.Namespace) -> int:
-    from planetarble.acquisition import CopernicusAccessError, CopernicusAuthError, get_available_layers
+    from planetarble.acquisition import (
+        CopernicusAccessError,
+        CopernicusAuthError,
+        CopernicusCredentialsMissing,
+        get_available_layers,
+    )
 
     try:
         layers = get_available_layers(
@@ -1873,14 +2374,14 @@ def _handle_copernicus_layers(args: argparse.Namespace) -> int:
             use_credentials=not args.no_credentials,
         )
     except CopernicusCredentialsMissing as exc:
-        LOGGER.error(str(exc))
+        _logger().error(str(exc))
         return 1
     except (CopernicusAuthError, CopernicusAccessError) as exc:
-        LOGGER.error("Unable to list Copernicus layers: %s", exc)
+        _logger().error("Unable to list Copernicus layers: %s", exc)
         return 1
 
     if not layers:
-        LOGGER.warning("No layers found for the specified Copernicus instance")
+        _logger().warning("No layers found for the specified Copernicus instance")
         return 0
 
     for name, title in layers:
@@ -1889,6 +2390,8 @@ def _handle_copernicus_layers(args: argparse.Namespace) -> int:
 
 
 def _handle_mpc_fetch(args: argparse.Namespace) -> int:
+    from planetarble.acquisition import MPCError, fetch_true_color_tile
+
     try:
         summary = fetch_true_color_tile(
             lat=args.lat,
@@ -1900,15 +2403,16 @@ def _handle_mpc_fetch(args: argparse.Namespace) -> int:
             start_datetime=args.start_datetime,
             end_datetime=args.end_datetime,
             gdal_translate=args.gdal_translate,
+            num_threads=args.num_threads,
             dry_run=args.dry_run,
         )
     except (SystemExit, KeyboardInterrupt):
         raise
     except MPCError as exc:
-        LOGGER.error("MPC fetch failed: %s", exc)
+        _logger().error("MPC fetch failed: %s", exc)
         return 1
 
-    LOGGER.info("mpc fetch complete", extra=summary)
+    _logger().info("mpc fetch complete", extra=summary)
     if args.dry_run:
         print(summary)
     return 0
@@ -1922,7 +2426,7 @@ def _handle_gsi_collect(args: argparse.Namespace) -> int:
     )
     from planetarble.acquisition.tiles import download_xyz_tiles
 
-    cfg = load_config(_resolve_config_path(args.config))
+    cfg = _load_config(args.config)
     layer = args.layer
     template = f"https://cyberjapandata.gsi.go.jp/xyz/{layer}/{{z}}/{{x}}/{{y}}.{args.ext}"
 
@@ -1930,7 +2434,7 @@ def _handle_gsi_collect(args: argparse.Namespace) -> int:
     src = args.mokuroku or mokuroku_url(layer)
     if str(src).startswith(("http://", "https://")):
         cache = (cfg.data_dir / "cache" / "mokuroku" / f"{layer}.csv.gz").resolve()
-        LOGGER.info("fetching mokuroku", extra={"url": src, "dest": str(cache)})
+        _logger().info("fetching mokuroku", extra={"url": src, "dest": str(cache)})
         gz = fetch_mokuroku(src, cache)
     else:
         gz = Path(src)
@@ -2037,6 +2541,8 @@ def _handle_gsi_pack(args: argparse.Namespace) -> int:
 
 
 def _handle_gsi_fetch(args: argparse.Namespace) -> int:
+    from planetarble.acquisition import GSIError, fetch_gsi_ortho_clip
+
     try:
         summary = fetch_gsi_ortho_clip(
             lat=args.lat,
@@ -2048,16 +2554,17 @@ def _handle_gsi_fetch(args: argparse.Namespace) -> int:
             gdal_translate=args.gdal_translate,
             gdal_buildvrt=args.gdal_buildvrt,
             gdal_warp=args.gdal_warp,
+            num_threads=args.num_threads,
             output_path=args.output,
             dry_run=args.dry_run,
         )
     except (SystemExit, KeyboardInterrupt):
         raise
     except GSIError as exc:
-        LOGGER.error("GSI fetch failed: %s", exc)
+        _logger().error("GSI fetch failed: %s", exc)
         return 1
 
-    LOGGER.info("gsi fetch complete", extra=summary)
+    _logger().info("gsi fetch complete", extra=summary)
     if args.dry_run:
         print(summary)
     return 0
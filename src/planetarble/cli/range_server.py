@@ -0,0 +1,71 @@
+"""HTTP handler with byte-range support used by ``planetarble serve``."""
+
+from __future__ import annotations
+
+import http.server
+import os
+from typing import Optional
+
+
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Serve files with HTTP range support for PMTiles."""
+
+    def send_head(self):  # type: ignore[override]
+        path = self.translate_path(self.path)
+        if not os.path.exists(path):
+            return super().send_head()
+        if os.path.isdir(path):
+            return super().send_head()
+
+        f = None
+        try:
+            f = open(path, "rb")
+            fs = os.fstat(f.fileno())
+            size = fs.st_size
+            range_header = self.headers.get("Range")
+            if range_header:
+                start, end = self._parse_range(range_header, size)
+                if start is None:
+                    self.send_error(416, "Requested Range Not Satisfiable")
+                    return None
+                self.send_response(206)
+                self.send_header("Content-Type", self.guess_type(path))
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                self.send_header("Content-Length", str(end - start + 1))
+                self.end_headers()
+                f.seek(start)
+                self.wfile.write(f.read(end - start + 1))
+                f.close()
+                return None
+
+            self.send_response(200)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Length", str(size))
+            self.send_header("Accept-Ranges", "bytes")
+            self.end_headers()
+            return f
+        except OSError:
+            if f:
+                f.close()
+            self.send_error(404, "File not found")
+            return None
+
+    def _parse_range(self, header: str, size: int) -> tuple[Optional[int], int]:
+        if not header.startswith("bytes="):
+            return None, 0
+        range_spec = header.split("=", 1)[1]
+        if "," in range_spec:
+            range_spec = range_spec.split(",", 1)[0]
+        start_str, end_str = range_spec.split("-", 1)
+        if start_str == "":
+            length = int(end_str)
+            start = max(size - length, 0)
+            end = size - 1
+            return start, end
+        start = int(start_str)
+        end = int(end_str) if end_str else size - 1
+        if start >= size:
+            return None, 0
+        end = min(end, size - 1)
+        return start, end
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from planetarble.core.models import (
+    AcquisitionConfig,
     CopernicusConfig,
     CopernicusLayerConfig,
     Sentinel2Config,
@@ -26,6 +28,103 @@ try:
     import yaml  # type: ignore
 except ImportError:  # pragma: no cover - optional dependency guard
     yaml = None
+    _YamlLoader = None
+else:
+    # libyaml-backed loader when PyYAML was built against it; same safe constructor set.
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def _optional(cast: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda value: None if value is None else cast(value)
+
+
+_FLOAT = _optional(float)
+_INT = _optional(int)
+_TUPLE = _optional(tuple)
+
+
+def _tuple_or_empty(value: Any) -> tuple:
+    return tuple(value or ())
+
+
+# Per-section casts for scalar and list fields; keys absent from the payload are left alone.
+_MODIS_SPEC: Dict[str, Callable[[Any], Any]] = {
+    "tiles": _tuple_or_empty,
+    "scale_min": _FLOAT,
+    "scale_max": _FLOAT,
+    "gamma": _FLOAT,
+}
+_VIIRS_SPEC = _MODIS_SPEC
+_COPERNICUS_SPEC: Dict[str, Callable[[Any], Any]] = {
+    **dict.fromkeys(
+        (
+            "min_zoom",
+            "max_zoom",
+            "tile_size",
+            "timeout_seconds",
+            "max_tiles_per_layer",
+            "max_retries",
+            "rate_limit_max_requests",
+            "rate_limit_window_seconds",
+        ),
+        _INT,
+    ),
+    **dict.fromkeys(("request_interval_seconds", "backoff_factor", "rate_limit_min_interval_seconds"), _FLOAT),
+}
+_SENTINEL2_SPEC: Dict[str, Callable[[Any], Any]] = {
+    "assets": _TUPLE,
+    **dict.fromkeys(
+        (
+            "max_items",
+            "mosaic_max_scenes",
+            "cache_ttl_days",
+            "request_timeout_seconds",
+            "stac_search_timeout_seconds",
+            "max_retries",
+        ),
+        _INT,
+    ),
+    **dict.fromkeys(("max_cloud", "backoff_factor"), _FLOAT),
+}
+_HLS_SPEC: Dict[str, Callable[[Any], Any]] = {
+    **dict.fromkeys(("collections", "fallback_collections", "spectral_bands"), _TUPLE),
+    **dict.fromkeys(("land_buffer_km", "max_cloud", "fallback_max_cloud", "backoff_factor"), _FLOAT),
+    **dict.fromkeys(
+        (
+            "target_zoom",
+            "tile_size",
+            "concurrency",
+            "request_timeout_seconds",
+            "max_retries",
+            "max_scene_age_days",
+            "robust_median_window",
+            "scenes_per_tile",
+            "scene_search_limit",
+            "cloud_mask_dilation",
+            "compositing_year",
+            "cache_ttl_days",
+        ),
+        _INT,
+    ),
+}
+_ACQUIRE_SPEC: Dict[str, Callable[[Any], Any]] = {"aria2_extra_flags": _tuple_or_empty}
+_OCEAN_SPEC: Dict[str, Callable[[Any], Any]] = dict.fromkeys(
+    ("hillshade_azimuth", "hillshade_altitude", "hillshade_strength", "viirs_blend_percent", "viirs_max_fraction"),
+    _FLOAT,
+)
+_GSI_SPEC: Dict[str, Callable[[Any], Any]] = {
+    **dict.fromkeys(("lat", "lon", "width_m", "height_m", "rate_limit_seconds"), _FLOAT),
+    **dict.fromkeys(("zoom", "timeout_seconds"), _INT),
+}
+
+
+def _coerce(section: Dict[str, Any], spec: Dict[str, Callable[[Any], Any]]) -> Dict[str, Any]:
+    """Return a copy of ``section`` with each key in ``spec`` passed through its cast."""
+
+    data = dict(section)
+    for key, cast in spec.items():
+        if key in data:
+            data[key] = cast(data[key])
+    return data
 
 
 def _normalize_miniplanet(value: Any) -> Optional[str]:
@@ -48,6 +147,7 @@ class PipelineConfig:
     temp_dir: Path = Path("tmp")
     output_dir: Path = Path("output")
     processing: ProcessingConfig = field(default_factory=ProcessingConfig)
+    acquire: AcquisitionConfig = field(default_factory=AcquisitionConfig)
     modis: ModisConfig = field(default_factory=ModisConfig)
     viirs: ViirsConfig = field(default_factory=ViirsConfig)
     copernicus: CopernicusConfig = field(default_factory=CopernicusConfig)
@@ -85,7 +185,7 @@ class ConfigLoader:
     def _resolve_path(self, path: Path) -> Path:
         if path.is_absolute():
             return path
-        return (self._base_dir / path).resolve()
+        return Path(os.path.abspath(self._base_dir / path))
 
     def _load_payload(self, path: Path) -> Dict[str, Any]:
         suffix = path.suffix.lower()
@@ -95,7 +195,7 @@ class ConfigLoader:
                     "PyYAML is required to load YAML configuration files."
                 )
             with path.open("r", encoding="utf-8") as handle:
-                return yaml.safe_load(handle) or {}
+                return yaml.load(handle, Loader=_YamlLoader) or {}
         if suffix == ".json":
             with path.open("r", encoding="utf-8") as handle:
                 return json.load(handle) or {}
@@ -110,30 +210,23 @@ class ConfigLoader:
             raise ValueError("processing section must be a mapping")
         processing = ProcessingConfig(**processing_payload)
 
+        acquire_payload = payload.get("acquire") or {}
+        if not isinstance(acquire_payload, dict):
+            raise ValueError("acquire section must be a mapping")
+        acquire = AcquisitionConfig(**_coerce(acquire_payload, _ACQUIRE_SPEC))
+
         modis_payload = payload.get("modis") or {}
         if not isinstance(modis_payload, dict):
             raise ValueError("modis section must be a mapping")
-        modis_data = dict(modis_payload)
-        if "tiles" in modis_data:
-            modis_data["tiles"] = tuple(modis_data.get("tiles") or [])
-        for key in ("scale_min", "scale_max", "gamma"):
-            if key in modis_data and modis_data[key] is not None:
-                modis_data[key] = float(modis_data[key])
-        modis = ModisConfig(**modis_data)
+        modis = ModisConfig(**_coerce(modis_payload, _MODIS_SPEC))
 
         viirs_payload = payload.get("viirs") or {}
         if not isinstance(viirs_payload, dict):
             raise ValueError("viirs section must be a mapping")
-        viirs_data = dict(viirs_payload)
-        if "tiles" in viirs_data:
-            viirs_data["tiles"] = tuple(viirs_data.get("tiles") or [])
-        for key in ("scale_min", "scale_max", "gamma"):
-            if key in viirs_data and viirs_data[key] is not None:
-                viirs_data[key] = float(viirs_data[key])
-        viirs = ViirsConfig(**viirs_data)
+        viirs = ViirsConfig(**_coerce(viirs_payload, _VIIRS_SPEC))
 
         copernicus_payload = payload.get("copernicus", {})
-        copernicus_data = dict(copernicus_payload)
+        copernicus_data = _coerce(copernicus_payload, _COPERNICUS_SPEC)
         layers_payload = copernicus_data.pop("layers", []) or []
         layer_configs = []
         for layer in layers_payload:
@@ -147,45 +240,17 @@ class ConfigLoader:
             if not isinstance(bbox, (list, tuple)) or len(bbox) != 4:
                 raise ValueError("copernicus.bbox must be a list of four numbers")
             copernicus_data["bbox"] = tuple(float(value) for value in bbox)
-        for key in (
-            "min_zoom",
-            "max_zoom",
-            "tile_size",
-            "timeout_seconds",
-            "max_tiles_per_layer",
-            "max_retries",
-            "rate_limit_max_requests",
-            "rate_limit_window_seconds",
-        ):
-            if key in copernicus_data and copernicus_data[key] is not None:
-                copernicus_data[key] = int(copernicus_data[key])
-        for key in ("request_interval_seconds", "backoff_factor"):
-            if key in copernicus_data and copernicus_data[key] is not None:
-                copernicus_data[key] = float(copernicus_data[key])
-        if "rate_limit_min_interval_seconds" in copernicus_data and copernicus_data["rate_limit_min_interval_seconds"] is not None:
-            copernicus_data["rate_limit_min_interval_seconds"] = float(
-                copernicus_data["rate_limit_min_interval_seconds"]
-            )
         copernicus = CopernicusConfig(**copernicus_data)
 
         sentinel2_payload = payload.get("sentinel2") or {}
         if not isinstance(sentinel2_payload, dict):
             raise ValueError("sentinel2 section must be a mapping")
-        sentinel2_data = dict(sentinel2_payload)
+        sentinel2_data = _coerce(sentinel2_payload, _SENTINEL2_SPEC)
         bbox = sentinel2_data.get("bbox")
         if bbox is not None:
             if not isinstance(bbox, (list, tuple)) or len(bbox) != 4:
                 raise ValueError("sentinel2.bbox must be a list of four numbers")
             sentinel2_data["bbox"] = tuple(float(value) for value in bbox)
-        if "assets" in sentinel2_data and sentinel2_data["assets"] is not None:
-            sentinel2_data["assets"] = tuple(sentinel2_data.get("assets") or [])
-        for key in ("max_items", "mosaic_max_scenes", "cache_ttl_days", "request_timeout_seconds", "stac_search_timeout_seconds", "max_retries"):
-            if key in sentinel2_data and sentinel2_data[key] is not None:
-                sentinel2_data[key] = int(sentinel2_data[key])
-        if "max_cloud" in sentinel2_data and sentinel2_data["max_cloud"] is not None:
-            sentinel2_data["max_cloud"] = float(sentinel2_data["max_cloud"])
-        if "backoff_factor" in sentinel2_data and sentinel2_data["backoff_factor"] is not None:
-            sentinel2_data["backoff_factor"] = float(sentinel2_data["backoff_factor"])
         regions_payload = sentinel2_data.pop("plan_regions", []) or []
         region_configs = []
         for region in regions_payload:
@@ -224,24 +289,7 @@ class ConfigLoader:
         hls_payload = payload.get("hls") or {}
         if not isinstance(hls_payload, dict):
             raise ValueError("hls section must be a mapping")
-        hls_data = dict(hls_payload)
-        if "collections" in hls_data and hls_data["collections"] is not None:
-            hls_data["collections"] = tuple(hls_data.get("collections") or [])
-        if "fallback_collections" in hls_data and hls_data["fallback_collections"] is not None:
-            hls_data["fallback_collections"] = tuple(hls_data.get("fallback_collections") or [])
-        if "spectral_bands" in hls_data and hls_data["spectral_bands"] is not None:
-            hls_data["spectral_bands"] = tuple(hls_data.get("spectral_bands") or [])
-        for key in ("land_buffer_km", "max_cloud", "fallback_max_cloud"):
-            if key in hls_data and hls_data[key] is not None:
-                hls_data[key] = float(hls_data[key])
-        for key in ("target_zoom", "tile_size", "concurrency", "request_timeout_seconds", "max_retries", "max_scene_age_days", "robust_median_window", "scenes_per_tile", "scene_search_limit", "cloud_mask_dilation", "compositing_year"):
-            if key in hls_data and hls_data[key] is not None:
-                hls_data[key] = int(hls_data[key])
-        for key in ("backoff_factor",):
-            if key in hls_data and hls_data[key] is not None:
-                hls_data[key] = float(hls_data[key])
-        if "cache_ttl_days" in hls_data and hls_data["cache_ttl_days"] is not None:
-            hls_data["cache_ttl_days"] = int(hls_data["cache_ttl_days"])
+        hls_data = _coerce(hls_payload, _HLS_SPEC)
         seasonal_payload = hls_data.pop("seasonal_windows", []) or []
         seasonal_windows = []
         for entry in seasonal_payload:
@@ -288,32 +336,22 @@ class ConfigLoader:
         ocean_payload = payload.get("ocean") or {}
         if not isinstance(ocean_payload, dict):
             raise ValueError("ocean section must be a mapping")
-        ocean_data = dict(ocean_payload)
-        for key in ("hillshade_azimuth", "hillshade_altitude", "hillshade_strength", "viirs_blend_percent", "viirs_max_fraction"):
-            if key in ocean_data and ocean_data[key] is not None:
-                ocean_data[key] = float(ocean_data[key])
-        ocean = OceanConfig(**ocean_data)
+        ocean = OceanConfig(**_coerce(ocean_payload, _OCEAN_SPEC))
 
         gsi_payload = payload.get("gsi_orthophotos", {}) or {}
-        gsi_data = dict(gsi_payload)
+        gsi_data = _coerce(gsi_payload, _GSI_SPEC)
         bbox = gsi_data.get("bbox")
         if bbox is not None:
             if not isinstance(bbox, (list, tuple)) or len(bbox) != 4:
                 raise ValueError("gsi_orthophotos.bbox must be a list of four numbers")
             gsi_data["bbox"] = tuple(float(value) for value in bbox)
-        for key in ("lat", "lon", "width_m", "height_m", "rate_limit_seconds"):
-            if key in gsi_data and gsi_data[key] is not None:
-                gsi_data[key] = float(gsi_data[key])
-        if "zoom" in gsi_data and gsi_data["zoom"] is not None:
-            gsi_data["zoom"] = int(gsi_data["zoom"])
-        if "timeout_seconds" in gsi_data and gsi_data["timeout_seconds"] is not None:
-            gsi_data["timeout_seconds"] = int(gsi_data["timeout_seconds"])
         gsi_orthophotos = GSIOrthophotoConfig(**gsi_data)
         return PipelineConfig(
             data_dir=data_dir,
             temp_dir=temp_dir,
             output_dir=output_dir,
             processing=processing,
+            acquire=acquire,
             modis=modis,
             viirs=viirs,
             copernicus=copernicus,
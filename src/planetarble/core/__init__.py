@@ -1,31 +1,39 @@
 """Core data models for Planetarble."""
 
 from .models import (
+    AcquisitionConfig,
     AssetManifest,
     AssetSource,
     CopernicusConfig,
     CopernicusLayerConfig,
     GSIOrthophotoConfig,
     HLSConfig,
+    HLSPlanRegion,
     HLSSeasonWindow,
     ModisConfig,
+    NaturalEarthRegion,
     OceanConfig,
     ProcessingConfig,
+    Sentinel2Config,
     TileMetadata,
     ViirsConfig,
 )
 
 __all__ = [
+    "AcquisitionConfig",
     "AssetManifest",
     "AssetSource",
     "CopernicusConfig",
     "CopernicusLayerConfig",
     "GSIOrthophotoConfig",
     "HLSConfig",
+    "HLSPlanRegion",
     "HLSSeasonWindow",
     "ModisConfig",
+    "NaturalEarthRegion",
     "OceanConfig",
     "ProcessingConfig",
+    "Sentinel2Config",
     "TileMetadata",
     "ViirsConfig",
 ]
@@ -0,0 +1,121 @@
+"""Runtime environment shared by every GDAL child process."""
+
+from __future__ import annotations
+
+import functools
+import os
+from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from .models import ProcessingConfig
+
+# Tuning applied to GDAL commands unless the environment already sets the knob.
+# GDAL_CACHEMAX accepts a percentage of RAM since GDAL 2.1.
+GDAL_ENV_DEFAULTS: Dict[str, str] = {
+    "GDAL_CACHEMAX": "25%",
+    "GDAL_NUM_THREADS": "ALL_CPUS",
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "VSI_CACHE": "TRUE",
+    "VSI_CACHE_SIZE": str(256 * 1024 * 1024),
+    "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": ".tif,.tiff,.vrt",
+}
+
+
+# Tuning the in-process bindings apply; ``configure_gdal`` folds a config in.
+_ACTIVE_TUNING: Dict[str, str] = dict(GDAL_ENV_DEFAULTS)
+
+
+def gdal_tuning(config: Optional[ProcessingConfig] = None) -> Dict[str, str]:
+    """Return the GDAL defaults with ``config``'s cache size and thread count applied."""
+
+    tuning = dict(GDAL_ENV_DEFAULTS)
+    if config is not None:
+        tuning["GDAL_CACHEMAX"] = str(config.gdal_cachemax)
+        tuning["GDAL_NUM_THREADS"] = str(config.gdal_num_threads)
+    return tuning
+
+
+def gdal_env(
+    config: Optional[ProcessingConfig] = None,
+    *,
+    base: Optional[Mapping[str, str]] = None,
+) -> Dict[str, str]:
+    """Return ``base`` (``os.environ`` by default) with the GDAL tuning filled in.
+
+    Precedence is environment, then ``config`` (its ``gdal_cachemax`` and
+    ``gdal_num_threads``), then ``GDAL_ENV_DEFAULTS``: a value the user
+    exported is never overridden.
+    """
+
+    env = dict(os.environ if base is None else base)
+    for key, value in gdal_tuning(config).items():
+        env.setdefault(key, value)
+    return env
+
+
+def configure_gdal(config: ProcessingConfig) -> None:
+    """Apply ``config``'s tuning to the in-process bindings, with ``gdal_env``'s precedence.
+
+    GDAL config options are process-wide, so the most recently configured
+    manager wins; GDAL_CACHEMAX only takes effect before the block cache is
+    first used. Does not import the bindings when nothing has loaded them yet.
+    """
+
+    _ACTIVE_TUNING.update(gdal_tuning(config))
+    if gdal_bindings.cache_info().currsize:
+        gdal = gdal_bindings()
+        if gdal is not None:
+            _apply_tuning(gdal)
+
+
+@functools.lru_cache(maxsize=1)
+def gdal_bindings():
+    """Return ``osgeo.gdal`` with exceptions enabled, or ``None`` when it is not installed.
+
+    In-process calls get the same tuning as child processes: each value is
+    applied as a config option unless the environment already sets it.
+    """
+
+    try:
+        from osgeo import gdal  # type: ignore
+    except ImportError:
+        return None
+    gdal.UseExceptions()
+    _apply_tuning(gdal)
+    return gdal
+
+
+def run_gdal_jobs(
+    run: Callable[..., None],
+    jobs: Sequence[Tuple[Sequence[str], str]],
+    *,
+    sequential: bool = False,
+    max_workers: Optional[int] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> None:
+    """Run independent ``(command, description)`` jobs through ``run`` concurrently.
+
+    ``run`` is a runner's ``run(command, *, description, env=None)``. Each
+    command is pinned to ``GDAL_NUM_THREADS=1`` while others run beside it so
+    the fan-out does not oversubscribe the cores; ``env`` replaces that
+    override. ``sequential`` (dry runs) runs the jobs in order instead. The
+    first failure (in job order) is raised once every job has finished.
+    """
+
+    if sequential or len(jobs) <= 1:
+        for command, description in jobs:
+            run(command, description=description)
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    env = env if env is not None else {"GDAL_NUM_THREADS": "1"}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run, command, description=description, env=env) for command, description in jobs]
+    for future in futures:
+        future.result()
+
+
+def _apply_tuning(gdal) -> None:
+    for key, value in _ACTIVE_TUNING.items():
+        if key not in os.environ:
+            gdal.SetConfigOption(key, value)
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetSource:
     """Describe a single upstream dataset and its provenance."""
 
@@ -19,17 +20,23 @@ class AssetSource:
     attribution: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetManifest:
     """Record the datasets and parameters used to build an artifact."""
 
     sources: Dict[str, AssetSource] = field(default_factory=dict)
     generation_params: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at_ns: int = field(default_factory=time.time_ns)
     version: str = "0.0.1"
 
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as an aware UTC datetime."""
 
-@dataclass
+        return datetime.fromtimestamp(self.created_at_ns / 1e9, tz=timezone.utc)
+
+
+@dataclass(slots=True, frozen=True)
 class ProcessingConfig:
     """Configuration options that control raster processing."""
 
@@ -49,11 +56,15 @@ class ProcessingConfig:
     gdal_num_threads: str = "ALL_CPUS"
     gdal_cachemax: str = "50%"
     pmtiles_dedup: bool = True
+    canonicalize_uniform_tiles: bool = False
     mbtiles_tiler: str = "auto"
     zoom_level_strategy: str = "LOWER"
+    cog_compression: str = "ZSTD"
+    cog_compression_level: Optional[int] = None
+    cog_predictor: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModisConfig:
     """Configuration for MODIS MCD43A4 surface reflectance processing."""
 
@@ -66,7 +77,7 @@ class ModisConfig:
     gamma: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ViirsConfig:
     """Configuration for VIIRS corrected reflectance processing."""
 
@@ -79,7 +90,7 @@ class ViirsConfig:
     gamma: float = 0.8
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CopernicusLayerConfig:
     """Describe a Copernicus WMS layer to download."""
 
@@ -90,7 +101,7 @@ class CopernicusLayerConfig:
     output: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CopernicusConfig:
     """Configuration controlling Copernicus Sentinel-2 acquisition."""
 
@@ -110,7 +121,7 @@ class CopernicusConfig:
     rate_limit_window_seconds: int = 86400
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Sentinel2Config:
     """Configuration controlling Sentinel-2 L2A acquisition via MPC STAC."""
 
@@ -133,7 +144,7 @@ class Sentinel2Config:
     backoff_factor: float = 1.8
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HLSSeasonWindow:
     """Define a hemisphere-specific seasonal window for HLS compositing."""
 
@@ -145,7 +156,7 @@ class HLSSeasonWindow:
     end_day: int
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class NaturalEarthRegion:
     """Describe a Natural Earth feature selection used for regional planning."""
 
@@ -154,7 +165,7 @@ class NaturalEarthRegion:
     path: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class HLSPlanRegion:
     """Define a named subset for HLS plan generation."""
 
@@ -165,7 +176,7 @@ class HLSPlanRegion:
     land_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HLSConfig:
     """Configuration for Harmonized Landsat and Sentinel-2 acquisition and mosaicking."""
 
@@ -231,7 +242,7 @@ class HLSConfig:
     plan_include_global: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GSIOrthophotoConfig:
     """Configuration controlling GSI orthophoto extraction."""
 
@@ -249,7 +260,15 @@ class GSIOrthophotoConfig:
     rate_limit_seconds: float = 0.1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class AcquisitionConfig:
+    """Options for the source-dataset download stage."""
+
+    # Appended after the default aria2c flags, so e.g. "--split=4" overrides the default.
+    aria2_extra_flags: Tuple[str, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
 class OceanConfig:
     """Configuration for ocean rendering using auxiliary elevation datasets."""
 
@@ -265,7 +284,7 @@ class OceanConfig:
     viirs_max_fraction: float = 0.05
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TileMetadata:
     """Metadata embedded in PMTiles and TileJSON outputs."""
 
@@ -4,10 +4,19 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from logging import Logger
 from logging.config import dictConfig
 from typing import Optional
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency guard
+    orjson = None
+
+_ACTIVE_CONFIG: Optional[tuple[str, bool, Optional[str]]] = None
+_DATEFMT = "%Y-%m-%dT%H:%M:%SZ"
+
 
 def log_step(
     logger: Logger,
@@ -86,19 +95,45 @@ def log_progress(
         )
 
 
-class JSONFormatter(logging.Formatter):
-    """Structured JSON formatter for pipeline logs."""
+class UTCFormatter(logging.Formatter):
+    """Text formatter whose ``asctime`` is UTC, matching the ``Z`` in ``_DATEFMT``."""
+
+    converter = time.gmtime
 
-    def format(self, record: logging.LogRecord) -> str:  # pragma: no cover - thin wrapper
+
+class JSONFormatter(logging.Formatter):
+    """Structured JSON formatter for pipeline logs.
+
+    Timestamps are UTC at one-second resolution, so the formatted string is
+    reused for every record logged within the same second. Lines are compact
+    UTF-8 JSON (non-ASCII characters are not ``\\u``-escaped), byte-identical
+    whether or not orjson is installed.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._last_timestamp: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        cached = self._last_timestamp
+        if cached[0] != second:
+            cached = (second, time.strftime(self.datefmt or _DATEFMT, time.gmtime(second)))
+            self._last_timestamp = cached
+        return cached[1]
+
+    def format(self, record: logging.LogRecord) -> str:
         payload = {
-            "timestamp": self.formatTime(record, self.datefmt),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=True)
+        if orjson is not None:
+            return orjson.dumps(payload).decode("utf-8")
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
 
 
 def configure_logging(
@@ -107,18 +142,28 @@ def configure_logging(
     json_logs: bool = False,
     log_file: Optional[str] = None,
 ) -> None:
-    """Configure global logging handlers and formatters."""
+    """Configure global logging handlers and formatters.
+
+    Repeated calls with the same settings are no-ops, so in-process callers can
+    invoke the CLI back to back without rebuilding handlers each time.
+    """
+
+    global _ACTIVE_CONFIG
+    key = (level.upper(), json_logs, log_file)
+    if key == _ACTIVE_CONFIG:
+        return
 
     formatters = {
         "standard": {
-            "format": "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-            "datefmt": "%Y-%m-%dT%H:%M:%SZ",
+            "()": UTCFormatter,
+            "fmt": "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+            "datefmt": _DATEFMT,
         }
     }
     if json_logs:
         formatters["json"] = {
             "()": JSONFormatter,
-            "datefmt": "%Y-%m-%dT%H:%M:%SZ",
+            "datefmt": _DATEFMT,
         }
 
     handlers = {
@@ -148,6 +193,7 @@ def configure_logging(
             },
         }
     )
+    _ACTIVE_CONFIG = key
 
 
 def get_logger(name: str) -> Logger:
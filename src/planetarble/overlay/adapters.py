@@ -127,6 +127,7 @@ class OpenAerialMapAdapter(BaseSourceAdapter):
             oam_cache_path,
             oam_download_command,
         )
+        from planetarble.core.gdal_env import gdal_env
 
         items = plan if plan is not None else self._selected
         if not items:
@@ -151,7 +152,7 @@ class OpenAerialMapAdapter(BaseSourceAdapter):
             output_path=output_path,
             resampling=self._resampling,
         )
-        subprocess.run(command, check=True)
+        subprocess.run(command, check=True, env=gdal_env())
         return output_path
 
 
@@ -199,14 +199,6 @@ class DefaultPlanetExecutor:
         return pmgr.prefetch_sentinel2_assets(manifest_path, plan_region=overlay.name)
 
     def _tile_to_mbtiles(self, cog: Path, overlay: Overlay) -> Path:
-        import subprocess
-
-        # add an alpha band so nodata is transparent when tiled
-        alpha = self._work / f"{overlay.name}_alpha.tif"
-        subprocess.run(
-            ["gdalwarp", "-overwrite", "-dstalpha", "-of", "COG", "-co", "COMPRESS=WEBP", str(cog), str(alpha)],
-            check=True,
-        )
         out_dir = self._work / f"tile_{overlay.name}"
         manager = PmtilesTilingManager(
             ProcessingConfig(tile_format=self._tile_format.upper(), tile_quality=self._quality),
@@ -215,12 +207,13 @@ class DefaultPlanetExecutor:
         )
         min_zoom = overlay.min_zoom or 0
         fmt = self._tile_format.upper()
+        # the tiler warps and adds the alpha band (nodata -> transparent) in one pass
         zxy = manager.build_zxy(
-            alpha, min_zoom=min_zoom, max_zoom=overlay.max_zoom,
-            tile_format=fmt, quality=self._quality, resampling="cubic",
+            cog, min_zoom=min_zoom, max_zoom=overlay.max_zoom,
+            tile_format=fmt, quality=self._quality, resampling="cubic", add_alpha=True,
         )
         return manager.pack_mbtiles(
-            zxy, source_path=alpha, tile_format=fmt, min_zoom=min_zoom, max_zoom=overlay.max_zoom,
+            zxy, source_path=cog, tile_format=fmt, min_zoom=min_zoom, max_zoom=overlay.max_zoom,
             name=overlay.name, attribution="",
         )
 
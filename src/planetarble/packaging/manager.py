@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import subprocess
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -14,9 +16,66 @@ from planetarble.logging import get_logger, log_step
 
 from .base import PackagingManager as PackagingProtocol
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency guard
+    orjson = None
+
 LOGGER = get_logger(__name__)
 
 
+def _dumps_indented(payload: dict) -> bytes:
+    """Serialize ``payload`` as two-space indented UTF-8 JSON, via orjson when installed."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=4)
+def _find_pmtiles(search_path: Optional[str]) -> Optional[str]:
+    """Locate the pmtiles CLI once per PATH value, warning the first time it is missing."""
+
+    found = shutil.which("pmtiles", path=search_path)
+    if found is None:
+        LOGGER.warning("pmtiles CLI not found; packaging command will fail unless installed")
+    return found
+
+
+def _fast_copy(source: Path, destination: Path, *, hardlink: bool = False) -> None:
+    """Copy ``source`` to ``destination``, reflinking when the filesystem allows.
+
+    With ``hardlink=True`` the destination shares the source inode, so any
+    in-place rewrite of either path (``pmtiles cluster``, re-conversion) changes
+    both. An existing destination is unlinked first so a previous hard link is
+    never truncated through (which would also truncate ``source``).
+    """
+
+    try:
+        if os.path.samefile(source, destination):
+            return
+    except FileNotFoundError:
+        pass
+    destination.unlink(missing_ok=True)
+    if hardlink:
+        try:
+            os.link(source, destination)
+            return
+        except OSError:  # cross-device, unsupported filesystem, ...
+            pass
+    try:
+        with source.open("rb") as src, destination.open("wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        shutil.copystat(source, destination)
+    except (AttributeError, OSError):  # no copy_file_range on this platform/filesystem
+        shutil.copy2(source, destination)
+
+
 class PackagingError(RuntimeError):
     """Raised when PMTiles packaging commands fail."""
 
@@ -26,9 +85,7 @@ class PackagingManager(PackagingProtocol):
 
     def __init__(self, *, dry_run: bool = False) -> None:
         self._dry_run = dry_run
-        self._pmtiles_cli = shutil.which("pmtiles")
-        if self._pmtiles_cli is None:
-            LOGGER.warning("pmtiles CLI not found; packaging command will fail unless installed")
+        self._pmtiles_cli = _find_pmtiles(os.environ.get("PATH"))
 
     def convert_to_pmtiles(self, mbtiles_path: Path, destination: Optional[Path] = None) -> Path:
         pmtiles_path = destination or mbtiles_path.with_suffix(".pmtiles")
@@ -62,11 +119,11 @@ class PackagingManager(PackagingProtocol):
             "format": metadata.format.lower(),
             "scheme": metadata.scheme,
             "tiles": [f"pmtiles://{pmtiles_path.name}"],
-            "created_at": datetime.utcnow().isoformat() + "Z",
+            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         }
         log_step(LOGGER, phase="package", step="write TileJSON metadata", extra={"path": str(tilejson_path)})
         if not self._dry_run:
-            tilejson_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tilejson_path.write_bytes(_dumps_indented(payload))
         return tilejson_path
 
     def create_distribution_package(
@@ -77,7 +134,14 @@ class PackagingManager(PackagingProtocol):
         manifest_path: Path,
         license_text: str,
         destination: Optional[Path] = None,
+        hardlink: bool = False,
     ) -> Path:
+        """Assemble the archive, TileJSON, manifest and license into ``destination``.
+
+        The archive is reflinked or copied by default. ``hardlink=True`` avoids the
+        copy on filesystems without reflinks, but the distributed file then aliases
+        the tiling output: rewriting one in place rewrites the other.
+        """
         package_dir = destination or pmtiles_path.parent / "distribution"
         package_dir.mkdir(parents=True, exist_ok=True)
 
@@ -88,10 +152,12 @@ class PackagingManager(PackagingProtocol):
             extra={"directory": str(package_dir)},
         )
         if not self._dry_run:
-            shutil.copy2(pmtiles_path, package_dir / pmtiles_path.name)
-            shutil.copy2(tilejson_path, package_dir / tilejson_path.name)
+            # The archive is the only large file and may opt into a hard link; the
+            # sidecars are rewritten in place by later runs, so they are always copied.
+            _fast_copy(pmtiles_path, package_dir / pmtiles_path.name, hardlink=hardlink)
+            _fast_copy(tilejson_path, package_dir / tilejson_path.name)
             if manifest_path.exists():
-                shutil.copy2(manifest_path, package_dir / manifest_path.name)
+                _fast_copy(manifest_path, package_dir / manifest_path.name)
             license_path = package_dir / "LICENSE_AND_CREDITS.txt"
             license_path.write_text(license_text, encoding="utf-8")
         return package_dir
@@ -15,8 +15,12 @@ class DataProcessor(Protocol):
     def generate_hillshade(self, gebco_path: Path) -> Path:
         """Return a hillshade raster derived from GEBCO bathymetry."""
 
-    def create_masks(self, natural_earth_path: Path) -> Path:
-        """Return a mask dataset delineating land and ocean regions."""
+    def create_masks(self, natural_earth_path: Path | str) -> Path:
+        """Return a mask dataset delineating land and ocean regions.
+
+        ``natural_earth_path`` is a local archive or directory of archives, or
+        an ``http(s)`` URL of a single archive given as a ``str``.
+        """
 
     def create_cog(self, raster_path: Path) -> Path:
         """Convert an input raster to a Cloud Optimized GeoTIFF."""
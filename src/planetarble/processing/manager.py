@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import hashlib
+import io
 import json
 import math
+import os
 import re
 import shutil
+import struct
 import subprocess
 import time
 import zipfile
 from urllib.request import urlopen
+from xml.sax.saxutils import escape as xml_escape
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from planetarble.core.models import (
     CopernicusConfig,
@@ -25,39 +31,126 @@ from planetarble.core.models import (
     Sentinel2Config,
     ViirsConfig,
 )
+from planetarble.core.gdal_env import configure_gdal, gdal_bindings, gdal_env, run_gdal_jobs
 from planetarble.logging import get_logger, log_progress, log_step, log_skip
 
 from .base import DataProcessor
 from .hls import HLSSceneManifestBuilder
 from .ocean import OceanRenderer
+from planetarble.acquisition.http_range import RangeHTTPFile, is_url
 from planetarble.acquisition.hls import load_land_geometry, load_region_geometry, _geom_intersects_bbox
 from planetarble.acquisition.mpc import append_sas_token, fetch_sas_token
 from planetarble.acquisition.sentinel_2 import Sentinel2SceneManifestBuilder
 
+__all__ = [
+    "CommandExecutionError",
+    "CommandRunner",
+    "ProcessingManager",
+]
+
+try:
+    import blake3  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency guard
+    blake3 = None
+try:
+    import xxhash  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency guard
+    xxhash = None
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
+
 LOGGER = get_logger(__name__)
 
+# Source-hash sidecars are reuse keys, not integrity checks, so the fastest available
+# hash wins. The entry is stored under the algorithm's name; entries written with a
+# different algorithm simply miss and get rehashed.
+if blake3 is not None:
+    _SOURCE_HASH = "blake3"
+elif xxhash is not None:
+    _SOURCE_HASH = "xxh3_128"
+else:
+    _SOURCE_HASH = "md5"
+_HASH_CHUNK_SIZE = 4 * 1024 * 1024
+_FADVISE_MIN_BYTES = 64 * 1024 * 1024
+_ZSTD_MIN_GDAL = (3, 1)
+_EXTRACT_WORKERS = 8
+_ZIP_COPY_BUFFER = 4 * 1024 * 1024
+_HILLSHADE_AZIMUTH = 315
+_HILLSHADE_ALTITUDE = 45
+_COMPRESSION_BLOCKSIZE = 512
+# GTiff creation option carrying the level of each leveled codec (the COG driver uses LEVEL).
+_LEVEL_KEYS = {"ZSTD": "ZSTD_LEVEL", "DEFLATE": "ZLEVEL", "LZMA": "LZMA_PRESET"}
+# ZSTD 9 still encodes faster than DEFLATE 6 and packs tighter; DEFLATE/LZMA keep GDAL's 6.
+_DEFAULT_LEVELS = {"ZSTD": 9, "DEFLATE": 6, "LZMA": 6}
+
+
+def _new_source_hasher():
+    if blake3 is not None:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.md5()
+
 ORIGIN_SHIFT = 20037508.342789244
 
 
+def _stat_fingerprint(stat: os.stat_result) -> Tuple[int, int, int]:
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_file_hash(path: str, size: int, mtime_ns: int) -> str:
+    """Hash ``path`` once per run for a given (size, mtime) even when several products share it."""
+
+    return ProcessingManager._hash_file(Path(path))
+
+
 class CommandExecutionError(RuntimeError):
     """Raised when an external processing command fails."""
 
 
 class CommandRunner:
-    """Execute external commands with optional dry-run support."""
+    """Execute external commands with optional dry-run support.
+
+    Commands run with ``env`` when given, otherwise the environment captured at
+    construction with the GDAL defaults filled in (see ``gdal_env``).
+    """
 
-    def __init__(self, *, dry_run: bool = False) -> None:
+    def __init__(self, *, dry_run: bool = False, env: Optional[Dict[str, str]] = None) -> None:
         self._dry_run = dry_run
+        self._env = env if env is not None else gdal_env()
 
-    def run(self, command: Sequence[str], *, description: str) -> None:
+    @property
+    def dry_run(self) -> bool:
+        return self._dry_run
+
+    def run(
+        self,
+        command: Sequence[str],
+        *,
+        description: str,
+        env: Optional[Dict[str, str]] = None,
+    ) -> None:
         log_step(LOGGER, phase="process", step=description, command=list(command))
         if self._dry_run:
             return
         try:
-            subprocess.run(command, check=True)
+            subprocess.run(command, check=True, env={**self._env, **env} if env else self._env)
         except subprocess.CalledProcessError as exc:  # pragma: no cover - requires GDAL runtime
             raise CommandExecutionError(f"Command failed: {' '.join(command)}") from exc
 
+    def run_many(
+        self,
+        jobs: Sequence[Tuple[Sequence[str], str]],
+        *,
+        max_workers: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Run independent ``(command, description)`` jobs concurrently (see ``run_gdal_jobs``)."""
+
+        run_gdal_jobs(self.run, jobs, sequential=self._dry_run, max_workers=max_workers, env=env)
+
 
 class ProcessingManager(DataProcessor):
     """Implement data processing steps using GDAL tooling."""
@@ -88,10 +181,12 @@ class ProcessingManager(DataProcessor):
         self._sentinel2 = sentinel2 or Sentinel2Config(enabled=False)
         self._hls = hls or HLSConfig(enabled=False)
         self._ocean = ocean or OceanConfig(enabled=False)
-        self._runner = CommandRunner(dry_run=dry_run)
+        self._runner = CommandRunner(dry_run=dry_run, env=gdal_env(config))
+        configure_gdal(config)
         self._dry_run = dry_run
+        self._resolved_sources: Dict[str, Path] = {}
         self._temp_dir.mkdir(parents=True, exist_ok=True)
-        self._output_dir.mkdir(parents=True, exist_ok=True)
+        # parents=True also creates the output dir
         self._processing_dir.mkdir(parents=True, exist_ok=True)
 
     def prepare_hls_scene_manifest(
@@ -436,39 +531,40 @@ class ProcessingManager(DataProcessor):
     def compose_bmng_panels(self, panel_dir: Path) -> Path:
         """Build a single raster from BMNG panels if multiple files are present."""
 
-        tif_files = sorted(panel_dir.glob("*.tif"))
+        tif_files = _disk_order(panel_dir.glob("*.tif"))
         if not tif_files:
             raise FileNotFoundError(f"No TIFF panels found in {panel_dir}")
         if len(tif_files) == 1:
             LOGGER.info("single BMNG panel detected; skipping mosaic")
             return tif_files[0]
 
-        panel_list = self._temp_dir / "bmng_panels.txt"
-        panel_list.write_text("\n".join(str(path) for path in tif_files), encoding="utf-8")
+        mosaic_path = self._processing_dir / "bmng_mosaic.tif"
+        meta_path = self._metadata_path_for_output(mosaic_path)
+        sources = self._format_sources(tif_files, default_key="bmng_panel", fallback=panel_dir)
+        if self._can_reuse_output(mosaic_path, meta_path, sources):
+            LOGGER.info(
+                "reusing BMNG panel mosaic",
+                extra={"output": str(mosaic_path)},
+            )
+            return mosaic_path
+
         vrt_path = self._temp_dir / "bmng_panels.vrt"
-        self._runner.run(
-            [
-                "gdalbuildvrt",
-                "-input_file_list",
-                str(panel_list),
-                str(vrt_path),
-            ],
+        _run_gdalbuildvrt(
+            self._runner,
+            vrt_path,
+            tif_files,
+            list_path=self._temp_dir / "bmng_panels.txt",
             description="assemble BMNG panels into VRT",
         )
 
-        mosaic_path = self._processing_dir / "bmng_mosaic.tif"
-        self._runner.run(
-            [
-                "gdal_translate",
-                str(vrt_path),
-                str(mosaic_path),
-                "-co",
-                "TILED=YES",
-                "-co",
-                "COMPRESS=DEFLATE",
-            ],
+        _run_gdal_translate(
+            self._runner,
+            vrt_path,
+            mosaic_path,
+            self._raster_compression("Byte"),
             description="convert BMNG VRT mosaic to GeoTIFF",
         )
+        self._record_source_hashes(meta_path, sources)
         return mosaic_path
 
     def normalize_bmng(self, input_path: Path, *, source_files: Sequence[Path] | None = None) -> Path:
@@ -481,20 +577,14 @@ class ProcessingManager(DataProcessor):
                 extra={"output": str(output)},
             )
             return output
-        command = [
-            "gdal_translate",
+        options = [
             "-of",
             "GTiff",
             "-a_srs",
             "EPSG:4326",
-            "-co",
-            "TILED=YES",
-            "-co",
-            "COMPRESS=DEFLATE",
-            str(input_path),
-            str(output),
+            *self._raster_compression("Byte"),
         ]
-        self._runner.run(command, description="normalize BMNG raster")
+        _run_gdal_translate(self._runner, input_path, output, options, description="normalize BMNG raster")
         self._record_source_hashes(meta_path, sources)
         return output
 
@@ -508,13 +598,29 @@ class ProcessingManager(DataProcessor):
                 extra={"output": str(output)},
             )
             return output
+        if not self._dry_run and _gdal_bindings() is not None:
+            log_step(
+                LOGGER,
+                phase="process",
+                step="generate GEBCO hillshade",
+                extra={"source": str(gebco_path), "output": str(output)},
+            )
+            _hillshade_numpy(
+                gebco_path,
+                output,
+                azimuth=_HILLSHADE_AZIMUTH,
+                altitude=_HILLSHADE_ALTITUDE,
+                compression=self._raster_compression,
+            )
+            self._record_source_hashes(meta_path, sources)
+            return output
         command = [
             "gdaldem",
             "hillshade",
             "-az",
-            "315",
+            str(_HILLSHADE_AZIMUTH),
             "-alt",
-            "45",
+            str(_HILLSHADE_ALTITUDE),
             "-compute_edges",
             str(gebco_path),
             str(output),
@@ -523,9 +629,15 @@ class ProcessingManager(DataProcessor):
         self._record_source_hashes(meta_path, sources)
         return output
 
-    def create_masks(self, natural_earth_path: Path) -> Path:
+    def create_masks(self, natural_earth_path: Path | str) -> Path:
         destination = self._temp_dir / "natural_earth"
         destination.mkdir(parents=True, exist_ok=True)
+        if is_url(natural_earth_path):
+            # A remote archive is read member by member over HTTP ranges and, like a
+            # local single archive, unpacks into ``destination``. There is no local
+            # copy to hash, so it is extracted on every run.
+            self._extract_zip(natural_earth_path, destination)
+            return destination
         meta_path = self._metadata_path_for_output(destination)
         sources = self._collect_natural_earth_sources(natural_earth_path)
         if self._can_reuse_output(destination, meta_path, sources):
@@ -537,8 +649,13 @@ class ProcessingManager(DataProcessor):
         if natural_earth_path.is_file() and natural_earth_path.suffix == ".zip":
             self._extract_zip(natural_earth_path, destination)
         elif natural_earth_path.is_dir():
-            for archive in natural_earth_path.glob("*.zip"):
-                self._extract_zip(archive, destination / archive.stem)
+            archives = sorted(natural_earth_path.glob("*.zip"))
+            # Archives unpack into separate directories; zlib releases the GIL while inflating.
+            from concurrent.futures import ThreadPoolExecutor
+
+            workers = max(1, min(_EXTRACT_WORKERS, len(archives), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda archive: self._extract_zip(archive, destination / archive.stem), archives))
         else:  # pragma: no cover - input guard
             raise ValueError(f"Unsupported Natural Earth input: {natural_earth_path}")
         self._record_source_hashes(meta_path, sources)
@@ -546,25 +663,60 @@ class ProcessingManager(DataProcessor):
 
     def create_cog(self, raster_path: Path) -> Path:
         output = self._processing_dir / f"{raster_path.stem}_cog.tif"
-        self._runner.run(
-            _cog_command(raster_path, output),
+        meta_path = self._metadata_path_for_output(output)
+        sources = {"raster": raster_path}
+        if self._can_reuse_output(output, meta_path, sources):
+            LOGGER.info("reusing Cloud Optimized GeoTIFF", extra={"output": str(output)})
+            return output
+        _run_gdal_translate(
+            self._runner,
+            raster_path,
+            output,
+            _cog_options(creation_options=[*self._raster_compression("Byte", driver="COG"), *_cog_overview_opts()]),
             description="create Cloud Optimized GeoTIFF",
         )
+        self._record_source_hashes(meta_path, sources)
         return output
 
     def blend_layers(self, base: Path, overlay: Path, opacity: float) -> Path:
         opacity = max(0.0, min(opacity, 1.0))
         output = self._processing_dir / f"{base.stem}_blended.tif"
+        if not self._dry_run and _gdal_bindings() is not None:
+            log_step(
+                LOGGER,
+                phase="process",
+                step="blend base and overlay rasters",
+                extra={"base": str(base), "overlay": str(overlay), "opacity": opacity},
+            )
+            return _blend_numpy(base, overlay, opacity, output, compression=self._raster_compression)
+        calc = f"A*(1-{opacity})+B*({opacity})"
+        nodata_options: List[str] = []
+        base_nodata = None if self._dry_run else _band_nodata(base)
+        overlay_nodata = None if self._dry_run else _band_nodata(overlay)
+        if base_nodata is not None and overlay_nodata is not None:
+            # Mask explicitly, as the in-process path does, rather than letting gdal_calc.py
+            # write its per-type default nodata (255 for Byte) over the overlay's holes.
+            checks = [
+                _nodata_check(letter, values[0])
+                for letter, values in (("A", base_nodata), ("B", overlay_nodata))
+                if values and values[0] is not None
+            ]
+            if checks:
+                calc = f"where({' | '.join(checks)}, A, {calc})"
+            nodata_options.append("--hideNoData")
+            if base_nodata and base_nodata[0] is not None:
+                nodata_options.append(f"--NoDataValue={base_nodata[0]!r}")
         command = [
             "gdal_calc.py",
             "-A",
             str(base),
             "-B",
             str(overlay),
-            "--A_band=1",
+            "--allBands=A",
             "--B_band=1",
             "--calc",
-            f"A*(1-{opacity})+B*({opacity})",
+            calc,
+            *nodata_options,
             "--format",
             "GTiff",
             "--outfile",
@@ -573,27 +725,60 @@ class ProcessingManager(DataProcessor):
         self._runner.run(command, description="blend base and overlay rasters")
         return output
 
-    def _extract_zip(self, archive: Path, destination: Path) -> None:
+    def _raster_compression(self, dtype: str, *, driver: str = "GTiff") -> List[str]:
+        """``_compression_opts`` with the configured codec, level and predictor."""
+
+        return _compression_opts(
+            dtype,
+            driver=driver,
+            codec=self._config.cog_compression,
+            level=self._config.cog_compression_level,
+            predictor=self._config.cog_predictor,
+        )
+
+    def _extract_zip(self, archive: Path | str, destination: Path) -> None:
         destination.mkdir(parents=True, exist_ok=True)
         LOGGER.info(
             "extracting archive",
             extra={"archive": str(archive), "destination": str(destination)},
         )
-        with zipfile.ZipFile(archive) as bundle:
-            bundle.extractall(destination)
+        root = Path(os.path.realpath(destination))
+        members: List[Tuple[zipfile.ZipInfo, Path]] = []
+        created = {root}
+        with _open_zip(archive) as bundle:
+            # Validate every member and create the directory tree before any data is written.
+            for info in bundle.infolist():
+                target = _zip_member_target(root, info.filename)
+                directory = target if info.is_dir() else target.parent
+                if directory not in created:
+                    directory.mkdir(parents=True, exist_ok=True)
+                    created.add(directory)
+                if not info.is_dir():
+                    members.append((info, target))
+        workers = max(1, min(_EXTRACT_WORKERS, len(members)))
+        if workers == 1:
+            _extract_zip_members(archive, members)
+            return
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Each worker reads through its own ZipFile handle; a shared handle would serialise on its file position.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_extract_zip_members, archive, members[index::workers]) for index in range(workers)]
+            for future in futures:
+                future.result()
 
     def _collect_natural_earth_sources(self, natural_earth_path: Path) -> Dict[str, Path]:
         if natural_earth_path.is_file():
             if natural_earth_path.suffix.lower() != ".zip":
                 raise ValueError(f"Unsupported Natural Earth archive: {natural_earth_path}")
-            return {natural_earth_path.name: natural_earth_path.resolve()}
+            return {natural_earth_path.name: self._resolve_source(natural_earth_path)}
         if natural_earth_path.is_dir():
             archives = sorted(natural_earth_path.glob("*.zip"))
             if not archives:
                 raise FileNotFoundError(
                     f"No Natural Earth ZIP archives found under {natural_earth_path}"
                 )
-            return {archive.name: archive.resolve() for archive in archives}
+            return {archive.name: self._resolve_source(archive) for archive in archives}
         raise ValueError(f"Unsupported Natural Earth input: {natural_earth_path}")
 
     def _format_sources(
@@ -604,12 +789,18 @@ class ProcessingManager(DataProcessor):
         fallback: Path,
     ) -> Dict[str, Path]:
         if source_files:
-            mapping: Dict[str, Path] = {}
-            for index, path in enumerate(sorted(set(Path(p).resolve() for p in source_files))):
-                mapping[f"{default_key}_{index + 1:02d}"] = path
-            if mapping:
-                return mapping
-        return {default_key: fallback.resolve()}
+            resolved = sorted({self._resolve_source(path) for path in source_files})
+            return {f"{default_key}_{index:02d}": path for index, path in enumerate(resolved, start=1)}
+        return {default_key: self._resolve_source(fallback)}
+
+    def _resolve_source(self, path: Path) -> Path:
+        """Return the real path of ``path``, resolving each distinct path once per manager."""
+
+        key = os.fspath(path)
+        resolved = self._resolved_sources.get(key)
+        if resolved is None:
+            resolved = self._resolved_sources[key] = Path(os.path.realpath(key))
+        return resolved
 
     def _metadata_path_for_output(self, output: Path) -> Path:
         if output.suffix:
@@ -624,19 +815,27 @@ class ProcessingManager(DataProcessor):
     ) -> bool:
         if self._dry_run:
             return False
-        if not output.exists() or not meta_path.exists():
+        if not output.exists():
             return False
-        try:
+        try:  # a missing sidecar surfaces as OSError, so it needs no separate exists()
             cached = json.loads(meta_path.read_text(encoding="utf-8"))
         except (OSError, json.JSONDecodeError):
             return False
         recorded = cached.get("sources", {})
         for key, source_path in sources.items():
-            if not source_path.exists():
+            try:
+                stat = source_path.stat()
+            except OSError:
                 return False
-            current_hash = self._hash_file(source_path)
             cached_entry = recorded.get(key, {})
-            if cached_entry.get("md5") != current_hash:
+            if _stat_fingerprint(stat) == (
+                cached_entry.get("size"),
+                cached_entry.get("mtime_ns"),
+                cached_entry.get("inode"),
+            ):
+                continue  # same file, untouched since it was hashed
+            current_hash = _cached_file_hash(str(source_path), stat.st_size, stat.st_mtime_ns)
+            if cached_entry.get(_SOURCE_HASH) != current_hash:
                 return False
         if len(recorded) != len(sources):
             return False
@@ -647,16 +846,25 @@ class ProcessingManager(DataProcessor):
             return
         payload = {"sources": {}}
         for key, source_path in sources.items():
-            resolved = source_path.resolve()
-            if not resolved.exists():
+            resolved = self._resolve_source(source_path)
+            try:
+                stat = os.stat(resolved)
+            except FileNotFoundError:
                 continue
+            size, mtime_ns, inode = _stat_fingerprint(stat)
             payload["sources"][key] = {
                 "path": str(resolved),
-                "md5": self._hash_file(resolved),
+                _SOURCE_HASH: _cached_file_hash(str(resolved), size, mtime_ns),
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "inode": inode,
             }
+        # Write-then-rename so an interrupted run never leaves a truncated sidecar behind.
+        tmp_path = meta_path.with_name(meta_path.name + ".tmp")
         try:
             meta_path.parent.mkdir(parents=True, exist_ok=True)
-            meta_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, meta_path)
         except OSError as exc:
             LOGGER.warning(
                 "failed to persist hash metadata",
@@ -665,9 +873,16 @@ class ProcessingManager(DataProcessor):
 
     @staticmethod
     def _hash_file(path: Path) -> str:
-        checksum = hashlib.md5()
+        checksum = _new_source_hasher()
+        if hasattr(checksum, "update_mmap"):  # blake3: mmap + multi-threaded compression
+            checksum.update_mmap(path)
+            return checksum.hexdigest()
         with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            if hasattr(os, "posix_fadvise") and os.fstat(handle.fileno()).st_size > _FADVISE_MIN_BYTES:
+                os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+: buffer reuse, no per-chunk bytes
+                return hashlib.file_digest(handle, lambda: checksum).hexdigest()
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
                 checksum.update(chunk)
         return checksum.hexdigest()
 
@@ -680,15 +895,25 @@ class ProcessingManager(DataProcessor):
         if not tiles_root.exists():
             raise FileNotFoundError(f"Copernicus tiles directory not found: {tiles_root}")
 
-        outputs: List[Path] = []
+        pending: List[Tuple[CopernicusLayerConfig, Path]] = []
         for layer_config in config.layers:
             slug = _slugify(layer_config.output or layer_config.name)
             layer_dir = tiles_root / slug
             if not layer_dir.exists():
                 LOGGER.warning("copernicus layer tiles missing", extra={"layer": layer_config.name, "path": str(layer_dir)})
                 continue
+            pending.append((layer_config, layer_dir))
+        if not pending:
+            return []
+
+        # Layers write distinct mosaics and COGs, and the heavy lifting happens in
+        # gdal_translate subprocesses, so threads overlap them without pickling state.
+        from concurrent.futures import ThreadPoolExecutor
+
+        def build(item: Tuple[CopernicusLayerConfig, Path]) -> Optional[Path]:
+            layer_config, layer_dir = item
             try:
-                cog = self._build_copernicus_cog(
+                return self._build_copernicus_cog(
                     layer_dir=layer_dir,
                     layer_config=layer_config,
                     config=config,
@@ -696,9 +921,12 @@ class ProcessingManager(DataProcessor):
                 )
             except Exception as exc:
                 LOGGER.warning("copernicus layer processing failed", extra={"layer": layer_config.name, "error": str(exc)})
-                continue
-            outputs.append(cog)
-        return outputs
+                return None
+
+        workers = min(len(pending), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(build, pending))
+        return [cog for cog in results if cog is not None]
 
     def _build_copernicus_cog(
         self,
@@ -713,54 +941,23 @@ class ProcessingManager(DataProcessor):
             raise FileNotFoundError(f"No tiles found under {layer_dir}")
 
         slug = _slugify(layer_config.output or layer_config.name)
-        vrt_dir = self._temp_dir / "copernicus_vrts" / slug
-        vrt_dir.mkdir(parents=True, exist_ok=True)
-
-        vrt_paths: List[Path] = []
-        for tile_path, zoom, x, y in tile_records:
-            vrt_path = vrt_dir / f"{zoom}_{x}_{y}.vrt"
-            if force or not vrt_path.exists():
-                minx, miny, maxx, maxy = _tile_bounds(x, y, zoom)
-                command = [
-                    "gdal_translate",
-                    "-of",
-                    "VRT",
-                    "-a_srs",
-                    "EPSG:3857",
-                    "-a_ullr",
-                    str(minx),
-                    str(maxy),
-                    str(maxx),
-                    str(miny),
-                    str(tile_path),
-                    str(vrt_path),
-                ]
-                self._runner.run(command, description="georeference copernicus tile")
-            vrt_paths.append(vrt_path)
-
-        list_path = vrt_dir / "inputs.txt"
-        list_path.write_text("\n".join(str(path) for path in vrt_paths), encoding="utf-8")
-
         mosaic_vrt = self._temp_dir / f"copernicus_{slug}_mosaic.vrt"
-        if mosaic_vrt.exists() and not self._dry_run:
-            mosaic_vrt.unlink()
-
-        command = [
-            "gdalbuildvrt",
-            "-resolution",
-            "highest",
-            "-input_file_list",
-            str(list_path),
-            str(mosaic_vrt),
-        ]
-        self._runner.run(command, description="build Copernicus mosaic VRT")
+        # XYZ tiles sit on a fixed pixel grid, so the mosaic VRT is written directly
+        # instead of georeferencing each tile and re-reading them with gdalbuildvrt.
+        log_step(
+            LOGGER,
+            phase="process",
+            step="write Copernicus mosaic VRT",
+            extra={"path": str(mosaic_vrt), "tiles": len(tile_records)},
+        )
+        if not self._dry_run:
+            mosaic_vrt.write_text(_copernicus_mosaic_vrt(tile_records, config.tile_size), encoding="utf-8")
 
         cog_path = self._processing_dir / f"copernicus_{slug}_cog.tif"
         if cog_path.exists() and force and not self._dry_run:
             cog_path.unlink()
 
-        translate_cmd = [
-            "gdal_translate",
+        translate_options = [
             "-of",
             "COG",
             "-co",
@@ -769,12 +966,14 @@ class ProcessingManager(DataProcessor):
             "BLOCKSIZE=512",
             "-co",
             "NUM_THREADS=ALL_CPUS",
-            str(mosaic_vrt),
-            str(cog_path),
         ]
         if layer_config.format.lower() == "image/jpeg":
-            translate_cmd.extend(["-co", "QUALITY=90"])
-        self._runner.run(translate_cmd, description="convert Copernicus mosaic to COG")
+            translate_options.extend(["-co", "QUALITY=90", *_cog_overview_opts(jpeg_quality=85)])
+        else:
+            translate_options.extend(_cog_overview_opts())
+        _run_gdal_translate(
+            self._runner, mosaic_vrt, cog_path, translate_options, description="convert Copernicus mosaic to COG"
+        )
         return cog_path
 
     def prepare_modis_rgb(
@@ -866,43 +1065,75 @@ class ProcessingManager(DataProcessor):
                     )
                 band_files[key].extend(matches)
 
-        vrt_paths: Dict[str, Path] = {}
         for key, files in band_files.items():
-            list_path = self._temp_dir / f"{product_slug}_{key}_tiles.txt"
-            list_path.write_text("\n".join(str(path) for path in files), encoding="utf-8")
-            vrt_path = self._temp_dir / f"{product_slug}_{key}_mosaic.vrt"
-            command = [
-                "gdalbuildvrt",
-                "-input_file_list",
-                str(list_path),
-                str(vrt_path),
-            ]
-            self._runner.run(command, description=f"mosaic {product_slug.upper()} {key} band")
-            vrt_paths[key] = vrt_path
+            # Aliased tile names or symlinked tile roots must not become overlapping VRT sources.
+            unique: Dict[Path, Path] = {}
+            for path in files:
+                unique.setdefault(self._resolve_source(path), path)
+            if len(unique) != len(files):
+                LOGGER.warning(
+                    "dropped duplicate band files",
+                    extra={"product": product_slug, "band": key, "duplicates": len(files) - len(unique)},
+                )
+            band_files[key] = _disk_order(unique.values())
+
+        vrt_paths = {key: self._temp_dir / f"{product_slug}_{key}_mosaic.vrt" for key in band_files}
+        # Band VRTs over many thousands of tiles are slow to rebuild; skip those whose file list is unchanged.
+        list_keys = {key: _file_list_key(files) for key, files in band_files.items()}
+        pending = {
+            key: files
+            for key, files in band_files.items()
+            if self._dry_run or not _vrt_key_matches(vrt_paths[key], list_keys[key])
+        }
+        if len(pending) < len(band_files):
+            LOGGER.info(
+                "reusing band mosaics with unchanged tile lists",
+                extra={"product": product_slug, "bands": sorted(set(band_files) - set(pending))},
+            )
+        if pending and (self._dry_run or _gdal_bindings() is None):
+            # The band mosaics are independent gdalbuildvrt processes; run them side by side.
+            list_paths = {key: self._temp_dir / f"{product_slug}_{key}_tiles.txt" for key in pending}
+            self._runner.run_many(
+                [
+                    (
+                        _gdalbuildvrt_command(vrt_paths[key], files, list_path=list_paths[key]),
+                        f"mosaic {product_slug.upper()} {key} band",
+                    )
+                    for key, files in pending.items()
+                ]
+            )
+            if not self._dry_run:
+                for list_path in list_paths.values():
+                    list_path.unlink(missing_ok=True)
+        else:
+            for key, files in pending.items():
+                _run_gdalbuildvrt(
+                    self._runner, vrt_paths[key], files, description=f"mosaic {product_slug.upper()} {key} band"
+                )
+        if not self._dry_run:
+            for key in pending:
+                _vrt_key_path(vrt_paths[key]).write_text(list_keys[key], encoding="utf-8")
 
         rgb_vrt = self._temp_dir / f"{product_slug}_rgb.vrt"
-        command = [
-            "gdalbuildvrt",
-            "-separate",
-            str(rgb_vrt),
-            str(vrt_paths["red"]),
-            str(vrt_paths["green"]),
-            str(vrt_paths["blue"]),
-        ]
-        self._runner.run(command, description=f"combine {product_slug.upper()} bands into RGB VRT")
+        _run_gdalbuildvrt(
+            self._runner,
+            rgb_vrt,
+            [vrt_paths["red"], vrt_paths["green"], vrt_paths["blue"]],
+            separate=True,
+            description=f"combine {product_slug.upper()} bands into RGB VRT",
+        )
 
-        rgb_tif = self._processing_dir / f"{product_slug}_{date_code}_rgb.tif"
+        # Scale straight into the COG: a GTiff intermediate would push every RGB
+        # pixel through the disk twice. Lossless like create_cog, so nodata=0 holds.
+        cog_path = self._processing_dir / f"{product_slug}_{date_code}_rgb_cog.tif"
 
-        command = [
-            "gdal_translate",
+        options = [
             "-of",
-            "GTiff",
-            "-co",
-            "TILED=YES",
-            "-co",
-            "COMPRESS=DEFLATE",
-            "-co",
-            "PHOTOMETRIC=RGB",
+            "COG",
+            *self._raster_compression("Byte", driver="COG"),
+            *_cog_overview_opts(),
+            "-colorinterp",
+            "red,green,blue",
             "-ot",
             "Byte",
             "-scale",
@@ -912,22 +1143,23 @@ class ProcessingManager(DataProcessor):
             "255",
         ]
         if gamma and gamma != 1.0:
-            command.extend(["-exponent", str(gamma)])
-        command.extend([
-            "-a_nodata",
-            "0",
-            str(rgb_vrt),
-            str(rgb_tif),
-        ])
-        self._runner.run(command, description=f"convert {product_slug.upper()} RGB mosaic to GeoTIFF")
-
-        cog_path = self.create_cog(rgb_tif)
+            options.extend(["-exponent", str(gamma)])
+        options.extend(["-a_nodata", "0"])
+        _run_gdal_translate(
+            self._runner,
+            rgb_vrt,
+            cog_path,
+            options,
+            description=f"convert {product_slug.upper()} RGB mosaic to COG",
+        )
         return cog_path
 
     def _resolve_tile_data_dir(self, tile_dir: Path) -> Path:
-        candidates = sorted(p for p in tile_dir.iterdir() if p.is_dir())
+        # DirEntry.is_dir() answers from the directory listing without another stat.
+        with os.scandir(tile_dir) as entries:
+            candidates = [entry.name for entry in entries if entry.is_dir()]
         if candidates:
-            return candidates[0]
+            return tile_dir / min(candidates)
         return tile_dir
 
     def _resolve_hls_region(self, plan_region: Optional[str]) -> Optional[HLSPlanRegion]:
@@ -1603,6 +1835,235 @@ def _dilate_fmask(
     return out_path
 
 
+def _hillshade_block(
+    window: "np.ndarray",
+    ewres: float,
+    nsres: float,
+    *,
+    azimuth: float,
+    altitude: float,
+) -> "np.ndarray":
+    """Shade the interior of ``window`` (a block with a one-pixel halo) like ``gdaldem hillshade``.
+
+    Horn gradients come from slicing the halo block, then GDAL's simplified
+    form ``(sin(alt) - (y*cos(az) - x*sin(az))*cos(alt)) / sqrt(1 + x^2 + y^2)``
+    is evaluated in float32. Output is Byte with 1..255 for shade (0 is nodata).
+    """
+    import numpy as np
+
+    w = window.astype(np.float32, copy=False)
+    a, b, c = w[:-2, :-2], w[:-2, 1:-1], w[:-2, 2:]
+    d, f = w[1:-1, :-2], w[1:-1, 2:]
+    g, h, i = w[2:, :-2], w[2:, 1:-1], w[2:, 2:]
+    x = ((a + d + d + g) - (c + f + f + i)) * np.float32(1.0 / (8.0 * ewres))
+    y = ((g + h + h + i) - (a + b + b + c)) * np.float32(1.0 / (8.0 * nsres))
+
+    az = math.radians(azimuth)
+    alt = math.radians(altitude)
+    shade = np.float32(math.sin(alt)) - (
+        y * np.float32(math.cos(az) * math.cos(alt)) - x * np.float32(math.sin(az) * math.cos(alt))
+    )
+    shade /= np.sqrt(np.float32(1.0) + x * x + y * y)
+    out = np.where(shade <= 0, np.float32(1.0), np.float32(1.0) + np.float32(254.0) * shade)
+    return (out + np.float32(0.5)).astype(np.uint8)
+
+
+def _hillshade_numpy(
+    source: Path,
+    output: Path,
+    *,
+    azimuth: float,
+    altitude: float,
+    block_rows: int = 256,
+    compression: Callable[[str], List[str]],
+) -> Path:
+    """Write a Byte hillshade of ``source`` in row strips, edges extrapolated (2a-b) as with ``-compute_edges``.
+
+    ``compression`` maps a GDAL dtype to ``-co`` options, usually the manager's
+    ``_raster_compression``.
+    """
+    import numpy as np
+
+    gdal = _gdal_bindings()
+    src = gdal.Open(str(source))
+    band = src.GetRasterBand(1)
+    xs, ys = src.RasterXSize, src.RasterYSize
+    gt = src.GetGeoTransform()
+    ewres, nsres = gt[1], gt[5]  # signed, as gdaldem uses them (nsres < 0 for north-up)
+    dst = gdal.GetDriverByName("GTiff").Create(
+        str(output), xs, ys, 1, gdal.GDT_Byte, options=compression("Byte")[1::2]
+    )
+    dst.SetGeoTransform(gt)
+    dst.SetProjection(src.GetProjection())
+    out_band = dst.GetRasterBand(1)
+    out_band.SetNoDataValue(0)
+    for y in range(0, ys, block_rows):
+        rows = min(block_rows, ys - y)
+        top = max(y - 1, 0)
+        bottom = min(y + rows + 1, ys)
+        strip = band.ReadAsArray(0, top, xs, bottom - top).astype(np.float32)
+        # Odd reflection extrapolates the outer ring as 2a-b, matching -compute_edges.
+        pad = ((int(top == y), int(bottom == y + rows)), (1, 1))
+        strip = np.pad(strip, pad, mode="reflect", reflect_type="odd")
+        out_band.WriteArray(
+            _hillshade_block(strip, ewres, nsres, azimuth=azimuth, altitude=altitude), 0, y
+        )
+    dst.FlushCache()
+    dst = None
+    src = None
+    return output
+
+
+@functools.lru_cache(maxsize=1)
+def _numexpr():
+    """Return ``numexpr`` when installed; imported lazily since it pulls in NumPy."""
+
+    try:
+        import numexpr  # type: ignore
+    except ImportError:
+        return None
+    return numexpr
+
+
+def _blend_block(
+    base: "np.ndarray",
+    overlay: "np.ndarray",
+    opacity: float,
+    *,
+    keep: Optional["np.ndarray"] = None,
+) -> "np.ndarray":
+    """Return ``base*(1-opacity) + overlay*opacity`` in the dtype of ``base``.
+
+    Uses numexpr's fused, multi-threaded evaluation when installed, otherwise
+    in-place float32 NumPy ufuncs (one temporary for the overlay term). Pixels
+    set in the boolean ``keep`` mask (nodata in either input) stay as ``base``.
+    """
+    import numpy as np
+
+    inv = np.float32(1.0 - opacity)
+    op = np.float32(opacity)
+    numexpr = _numexpr()
+    if numexpr is not None:
+        blended = numexpr.evaluate(
+            "a * inv + b * op",
+            local_dict={"a": base.astype(np.float32), "b": overlay.astype(np.float32), "inv": inv, "op": op},
+        )
+    else:
+        blended = base.astype(np.float32)
+        blended *= inv
+        term = overlay.astype(np.float32)
+        term *= op
+        blended += term
+    if np.issubdtype(base.dtype, np.integer):
+        info = np.iinfo(base.dtype)
+        np.add(blended, np.float32(0.5), out=blended)
+        np.clip(blended, info.min, info.max, out=blended)
+    blended = blended.astype(base.dtype, copy=False)
+    if keep is not None:
+        np.copyto(blended, base, where=keep)
+    return blended
+
+
+def _nodata_mask(block: "np.ndarray", nodata: Optional[float]) -> Optional["np.ndarray"]:
+    """Boolean mask of ``block`` pixels equal to ``nodata`` (NaN-aware), or ``None`` without one."""
+    import numpy as np
+
+    if nodata is None:
+        return None
+    if math.isnan(nodata):
+        return np.isnan(block)
+    return block == nodata
+
+
+def _nodata_check(letter: str, nodata: float) -> str:
+    """gdal_calc.py expression that is true where input ``letter`` equals ``nodata``."""
+
+    return f"isnan({letter})" if math.isnan(nodata) else f"({letter}=={nodata!r})"
+
+
+def _band_nodata(path: Path) -> Optional[List[Optional[float]]]:
+    """Per-band nodata values from ``gdalinfo -json``, or ``None`` when it cannot be read."""
+
+    try:
+        result = subprocess.run(
+            ["gdalinfo", "-json", "-nomd", str(path)], capture_output=True, text=True, check=True
+        )
+        bands = json.loads(result.stdout)["bands"]
+        return [None if band.get("noDataValue") is None else float(band["noDataValue"]) for band in bands]
+    except (OSError, subprocess.CalledProcessError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _blend_numpy(
+    base: Path,
+    overlay: Path,
+    opacity: float,
+    output: Path,
+    *,
+    compression: Callable[[str], List[str]],
+) -> Path:
+    """Blend ``overlay`` onto ``base`` one block at a time with the GDAL bindings.
+
+    Replaces ``gdal_calc.py --allBands=A --B_band=1``: every base band is blended
+    with the first overlay band, with no interpreter spawn and memory bounded by
+    the source block size. Pixels that are nodata in either input keep the base
+    value, and each base band's nodata value is carried over to the output.
+    """
+    import numpy as np
+
+    gdal = _gdal_bindings()
+    base_ds = gdal.Open(str(base))
+    overlay_ds = gdal.Open(str(overlay))
+    xs, ys, bands = base_ds.RasterXSize, base_ds.RasterYSize, base_ds.RasterCount
+    if (overlay_ds.RasterXSize, overlay_ds.RasterYSize) != (xs, ys):
+        raise ValueError(f"Overlay {overlay} does not match the {xs}x{ys} grid of {base}")
+    first_band = base_ds.GetRasterBand(1)
+    block_x, block_y = first_band.GetBlockSize()
+    dtype = gdal.GetDataTypeName(first_band.DataType)
+    creation_options = compression(dtype)[1::2]
+    if block_x % 16 == 0 and block_y % 16 == 0 and block_x < xs:
+        # Tile the output on the source block grid so every write covers whole blocks.
+        creation_options = [
+            option for option in creation_options if not option.startswith(("BLOCKXSIZE=", "BLOCKYSIZE="))
+        ] + [f"BLOCKXSIZE={block_x}", f"BLOCKYSIZE={block_y}"]
+    out_ds = gdal.GetDriverByName("GTiff").Create(
+        str(output), xs, ys, bands, first_band.DataType, options=creation_options
+    )
+    out_ds.SetGeoTransform(base_ds.GetGeoTransform())
+    out_ds.SetProjection(base_ds.GetProjection())
+    base_nodata = [base_ds.GetRasterBand(index).GetNoDataValue() for index in range(1, bands + 1)]
+    for index, nodata in enumerate(base_nodata, start=1):
+        if nodata is not None:
+            out_ds.GetRasterBand(index).SetNoDataValue(nodata)
+    overlay_band = overlay_ds.GetRasterBand(1)
+    overlay_nodata = overlay_band.GetNoDataValue()
+    masked = overlay_nodata is not None or any(nodata is not None for nodata in base_nodata)
+    for y in range(0, ys, block_y):
+        rows = min(block_y, ys - y)
+        for x in range(0, xs, block_x):
+            cols = min(block_x, xs - x)
+            base_block = base_ds.ReadAsArray(x, y, cols, rows).reshape(bands, rows, cols)
+            overlay_block = overlay_band.ReadAsArray(x, y, cols, rows)[None]  # broadcast over base bands
+            keep = None
+            if masked:
+                keep = np.zeros(base_block.shape, dtype=bool)
+                overlay_mask = _nodata_mask(overlay_block, overlay_nodata)
+                if overlay_mask is not None:
+                    keep |= overlay_mask
+                for index, nodata in enumerate(base_nodata):
+                    band_mask = _nodata_mask(base_block[index], nodata)
+                    if band_mask is not None:
+                        keep[index] |= band_mask
+            out_ds.WriteRaster(
+                x, y, cols, rows, _blend_block(base_block, overlay_block, opacity, keep=keep).tobytes()
+            )
+    out_ds.FlushCache()
+    out_ds = None
+    base_ds = None
+    overlay_ds = None
+    return output
+
+
 def _mask_hls_scene_bands(
     runner: CommandRunner,
     scenes: Sequence[Dict[str, object]],
@@ -1876,6 +2337,7 @@ def _cog_command(
     output: Path,
     *,
     compress: str = "DEFLATE",
+    creation_options: Sequence[str] | None = None,
     gdal_translate: str = "gdal_translate",
 ) -> List[str]:
     """gdal_translate command to produce a Cloud Optimized GeoTIFF.
@@ -1886,18 +2348,311 @@ def _cog_command(
     over the BMNG floor) and adds 8x8 block artefacts over high-contrast urban
     scenes, which is the bulk of the "dirty" look. The COG here is an
     intermediate; final tiles are re-encoded to WebP at tiling time.
+
+    ``creation_options`` (a ready ``-co`` list such as ``_compression_opts``)
+    replaces the plain ``COMPRESS=<compress>`` option when given.
     """
     return [
         gdal_translate,
-        "-of",
-        "COG",
-        "-co",
-        f"COMPRESS={compress}",
+        *_cog_options(compress=compress, creation_options=creation_options),
         str(raster_path),
         str(output),
     ]
 
 
+def _cog_options(*, compress: str = "DEFLATE", creation_options: Sequence[str] | None = None) -> List[str]:
+    """The ``gdal_translate`` options of ``_cog_command``, without program and paths."""
+
+    if creation_options is None:
+        creation_options = ["-co", f"COMPRESS={compress}"]
+    return ["-of", "COG", *creation_options]
+
+
+def _file_list_key(paths: Sequence[Path]) -> str:
+    """Fingerprint a mosaic source list by path and mtime; cheap enough for 200k+ tiles."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = -1
+        digest.update(f"{path}:{mtime}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _vrt_key_path(vrt_path: Path) -> Path:
+    return vrt_path.with_suffix(".vrt.key")
+
+
+def _vrt_key_matches(vrt_path: Path, key: str) -> bool:
+    try:
+        return vrt_path.exists() and _vrt_key_path(vrt_path).read_text(encoding="utf-8") == key
+    except OSError:
+        return False
+
+
+def _disk_order(paths: Iterable[Path]) -> List[Path]:
+    """Sort ``paths`` by inode so GDAL reads mosaic sources roughly in on-disk order.
+
+    Only the source order of non-overlapping mosaics may be changed this way.
+    Lexical order is used off POSIX or when any path cannot be stat-ed.
+    """
+
+    ordered = sorted(paths, key=str)
+    if os.name != "posix":
+        return ordered
+    try:
+        stats = [path.stat() for path in ordered]
+    except OSError:
+        return ordered
+    keys = {path: (stat.st_dev, stat.st_ino) for path, stat in zip(ordered, stats)}
+    return sorted(ordered, key=keys.__getitem__)
+
+
+@contextlib.contextmanager
+def _open_zip(archive: Path | str) -> Iterator[zipfile.ZipFile]:
+    """Open a local archive, or a remote one through HTTP range reads."""
+
+    if not is_url(archive):
+        with zipfile.ZipFile(archive) as bundle:
+            yield bundle
+        return
+    with io.BufferedReader(RangeHTTPFile(str(archive)), buffer_size=_ZIP_COPY_BUFFER) as handle:
+        with zipfile.ZipFile(handle) as bundle:
+            yield bundle
+
+
+def _extract_zip_members(archive: Path | str, members: Sequence[Tuple[zipfile.ZipInfo, Path]]) -> None:
+    with _open_zip(archive) as bundle:
+        for info, target in members:
+            if not _copy_stored_member(bundle, info, target):
+                with bundle.open(info) as source, open(target, "wb") as sink:
+                    shutil.copyfileobj(source, sink, _ZIP_COPY_BUFFER)
+            mode = (info.external_attr >> 16) & 0o777
+            if mode:
+                os.chmod(target, mode)
+
+
+def _copy_stored_member(bundle: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path) -> bool:
+    """Copy an uncompressed member with ``os.copy_file_range``, staying in the kernel.
+
+    Returns ``False`` (caller falls back to ``ZipFile.open``) for compressed or
+    encrypted members, platforms without ``copy_file_range``, or filesystems
+    that refuse it. The CRC is not re-checked on this path.
+    """
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None or info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return False
+    handle = bundle.fp
+    try:
+        fileno = handle.fileno() if handle is not None else None
+    except (AttributeError, OSError):
+        fileno = None
+    if fileno is None:
+        return False
+    handle.seek(info.header_offset)
+    header = handle.read(30)
+    if len(header) != 30 or header[:4] != b"PK\x03\x04":
+        return False
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    offset = info.header_offset + 30 + name_length + extra_length
+    try:
+        with open(target, "wb") as sink:
+            remaining = info.file_size
+            while remaining:
+                copied = copy_file_range(fileno, sink.fileno(), remaining, offset_src=offset)
+                if copied == 0:
+                    raise OSError("unexpected end of archive")
+                offset += copied
+                remaining -= copied
+    except OSError:
+        return False
+    return True
+
+
+def _zip_member_target(root: Path, name: str) -> Path:
+    """Return where archive member ``name`` extracts under ``root``, refusing paths that escape it."""
+
+    target = Path(os.path.realpath(root / name))
+    if target != root and root not in target.parents:
+        raise ValueError(f"Archive member escapes extraction directory: {name}")
+    return target
+
+
+def _cog_overview_opts(*, resampling: str = "AVERAGE", jpeg_quality: Optional[int] = None) -> List[str]:
+    """``-co`` options for the overviews the COG driver builds in the same pass.
+
+    Overviews keep the main image's compression unless ``jpeg_quality`` is set;
+    only already-lossy imagery takes JPEG overviews, since lossless COGs carry
+    an exact nodata=0 the tiler relies on at every zoom.
+    """
+
+    options = ["OVERVIEWS=AUTO", f"OVERVIEW_RESAMPLING={resampling}", "SPARSE_OK=TRUE"]
+    if jpeg_quality is not None:
+        options.extend(["OVERVIEW_COMPRESS=JPEG", f"OVERVIEW_QUALITY={jpeg_quality}"])
+    return [part for option in options for part in ("-co", option)]
+
+
+def _gdal_bindings():
+    """Return ``osgeo.gdal`` with exceptions enabled, or ``None`` when it is not installed."""
+
+    return gdal_bindings()
+
+
+def _run_gdalbuildvrt(
+    runner: CommandRunner,
+    vrt_path: Path,
+    sources: Sequence[Path],
+    *,
+    description: str,
+    separate: bool = False,
+    list_path: Optional[Path] = None,
+) -> None:
+    """Build ``vrt_path`` from ``sources``, in-process when the GDAL bindings are importable.
+
+    The subprocess fallback passes the sources through ``list_path`` (when given)
+    so long mosaics do not hit the argument length limit.
+    """
+
+    gdal = None if runner.dry_run else _gdal_bindings()
+    if gdal is not None:
+        log_step(LOGGER, phase="process", step=description, extra={"path": str(vrt_path), "sources": len(sources)})
+        try:
+            dataset = gdal.BuildVRT(str(vrt_path), [str(path) for path in sources], separate=separate)
+        except RuntimeError as exc:
+            raise CommandExecutionError(f"gdal.BuildVRT failed for {vrt_path}: {exc}") from exc
+        if dataset is None:
+            raise CommandExecutionError(f"gdal.BuildVRT failed for {vrt_path}")
+        dataset = None  # closing the dataset writes the VRT
+        return
+    runner.run(
+        _gdalbuildvrt_command(vrt_path, sources, separate=separate, list_path=list_path),
+        description=description,
+    )
+    if list_path is not None and not runner.dry_run:
+        # The VRT records its sources; the list is dead weight in the (often tmpfs) temp dir.
+        list_path.unlink(missing_ok=True)
+
+
+def _gdalbuildvrt_command(
+    vrt_path: Path,
+    sources: Sequence[Path],
+    *,
+    separate: bool = False,
+    list_path: Optional[Path] = None,
+) -> List[str]:
+    """``gdalbuildvrt`` argv for ``sources``, written through ``list_path`` when given."""
+
+    command = ["gdalbuildvrt"]
+    if separate:
+        command.append("-separate")
+    if list_path is not None:
+        list_path.write_text("\n".join(str(path) for path in sources), encoding="utf-8")
+        command.extend(["-input_file_list", str(list_path), str(vrt_path)])
+    else:
+        command.extend([str(vrt_path), *(str(path) for path in sources)])
+    return command
+
+
+def _run_gdal_translate(
+    runner: CommandRunner,
+    source: Path,
+    destination: Path,
+    options: Sequence[str],
+    *,
+    description: str,
+) -> None:
+    """Run ``gdal_translate`` on ``source``, in-process when the GDAL bindings are importable.
+
+    ``options`` is the argv between the program name and the paths, so the
+    subprocess fallback runs exactly the equivalent command line.
+    """
+
+    command = ["gdal_translate", *options, str(source), str(destination)]
+    gdal = None if runner.dry_run else _gdal_bindings()
+    if gdal is None:
+        runner.run(command, description=description)
+        return
+    log_step(LOGGER, phase="process", step=description, command=command)
+    try:
+        dataset = gdal.Translate(str(destination), str(source), options=list(options))
+    except RuntimeError as exc:
+        raise CommandExecutionError(f"gdal.Translate failed: {' '.join(command)}") from exc
+    if dataset is None:
+        raise CommandExecutionError(f"gdal.Translate failed: {' '.join(command)}")
+    dataset = None
+
+
+@functools.lru_cache(maxsize=1)
+def _gdal_version() -> Optional[Tuple[int, int]]:
+    """Return the (major, minor) version of the GDAL bindings or tools on PATH, if any."""
+
+    gdal = _gdal_bindings()
+    if gdal is not None:
+        number = int(gdal.VersionInfo("VERSION_NUM"))
+        return number // 1_000_000, number // 10_000 % 100
+    gdalinfo = shutil.which("gdalinfo")
+    if gdalinfo is None:
+        return None
+    try:
+        result = subprocess.run([gdalinfo, "--version"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    match = re.search(r"GDAL (\d+)\.(\d+)", result.stdout)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def _compression_opts(
+    dtype: str,
+    *,
+    driver: str = "GTiff",
+    codec: Optional[str] = None,
+    level: Optional[int] = None,
+    predictor: Optional[int] = None,
+) -> List[str]:
+    """Lossless ``-co`` options for intermediate rasters of the given GDAL ``dtype``.
+
+    ZSTD (GDAL >= 3.1) encodes and decodes several times faster than DEFLATE at a
+    better ratio; older GDAL builds fall back to DEFLATE, as does an explicit
+    ``codec="ZSTD"``. Unless ``level`` is given, ZSTD uses level 9 and the
+    other leveled codecs 6. Unless ``predictor`` is given, float rasters get the
+    floating-point predictor and everything else horizontal differencing.
+    GTiff output is written sparse so empty ocean/nodata blocks are skipped;
+    ``_cog_overview_opts`` does the same for COGs.
+    """
+
+    version = _gdal_version()
+    zstd_ok = version is not None and version >= _ZSTD_MIN_GDAL
+    codec = (codec or "ZSTD").upper()
+    if codec == "ZSTD" and not zstd_ok:
+        codec = "DEFLATE"
+    if predictor is None:
+        predictor = 3 if dtype.lower().startswith("float") else 2
+    options = [f"COMPRESS={codec}"]
+    if codec in _LEVEL_KEYS:
+        level_key = "LEVEL" if driver == "COG" else _LEVEL_KEYS[codec]
+        options.append(f"{level_key}={_DEFAULT_LEVELS[codec] if level is None else level}")
+    if codec != "NONE":
+        options.append(f"PREDICTOR={predictor}")
+    options.extend(["NUM_THREADS=ALL_CPUS", "BIGTIFF=IF_SAFER"])
+    if driver == "COG":
+        options.append(f"BLOCKSIZE={_COMPRESSION_BLOCKSIZE}")
+    else:
+        options.extend(
+            [
+                "TILED=YES",
+                f"BLOCKXSIZE={_COMPRESSION_BLOCKSIZE}",
+                f"BLOCKYSIZE={_COMPRESSION_BLOCKSIZE}",
+                "SPARSE_OK=TRUE",
+            ]
+        )
+    return [part for option in options for part in ("-co", option)]
+
+
 def _load_sentinel2_scene_manifest(path: Path) -> List[Dict[str, object]]:
     payload = json.loads(path.read_text(encoding="utf-8"))
     scenes = payload.get("scenes") if isinstance(payload, dict) else None
@@ -2212,12 +2967,15 @@ def _write_geometry_geojson(geometry: "ogr.Geometry", path: Path) -> None:
     feature = None
     dataset = None
 
+
+_COPERNICUS_TILE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+
+
 def _collect_copernicus_tiles(
     layer_dir: Path,
     config: CopernicusConfig,
 ) -> List[Tuple[Path, int, int, int]]:
     records: List[Tuple[Path, int, int, int]] = []
-    valid_suffixes = {".jpg", ".jpeg", ".png", ".webp"}
     available_zooms = []
     for zoom in range(config.min_zoom, config.max_zoom + 1):
         zoom_dir = layer_dir / str(zoom)
@@ -2232,23 +2990,29 @@ def _collect_copernicus_tiles(
             "copernicus max zoom tiles missing; using highest available zoom",
             extra={"requested": config.max_zoom, "available": target_zoom},
         )
-    for zoom in [target_zoom]:
-        zoom_dir = layer_dir / str(zoom)
-        for x_dir in sorted(p for p in zoom_dir.iterdir() if p.is_dir()):
-            try:
-                x = int(x_dir.name)
-            except ValueError:
-                continue
-            for tile_file in sorted(x_dir.iterdir()):
-                if not tile_file.is_file():
-                    continue
-                if tile_file.suffix.lower() not in valid_suffixes:
+    # scandir entries carry the d_type from readdir, so filtering costs no extra stat per tile.
+    zoom_dir = layer_dir / str(target_zoom)
+    with os.scandir(zoom_dir) as x_entries:
+        x_dirs = [entry for entry in x_entries if entry.is_dir()]
+    for x_entry in x_dirs:
+        try:
+            x = int(x_entry.name)
+        except ValueError:
+            continue
+        x_dir = zoom_dir / x_entry.name
+        with os.scandir(x_entry.path) as tile_entries:
+            for tile_entry in tile_entries:
+                stem, dot, suffix = tile_entry.name.rpartition(".")
+                if not dot or "." + suffix.lower() not in _COPERNICUS_TILE_SUFFIXES:
                     continue
                 try:
-                    y = int(tile_file.stem)
+                    y = int(stem)
                 except ValueError:
                     continue
-                records.append((tile_file, zoom, x, y))
+                if not tile_entry.is_file():
+                    continue
+                records.append((x_dir / tile_entry.name, target_zoom, x, y))
+    records.sort(key=lambda record: (record[2], record[3]))
     return records
 
 
@@ -2272,13 +3036,84 @@ def _compression_for_format(fmt: str) -> str:
     return "DEFLATE"
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slugify(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_") or "layer"
+    return _SLUG_RE.sub("_", value.lower()).strip("_") or "layer"
+
+
+def _tile_band_count(path: Path) -> int:
+    """Band count GDAL reports for an XYZ tile: PNG from its IHDR colour type, else RGB."""
+
+    if path.suffix.lower() != ".png":
+        return 3
+    try:
+        with path.open("rb") as handle:
+            header = handle.read(26)
+    except OSError:
+        return 3
+    if len(header) < 26 or header[12:16] != b"IHDR":
+        return 3
+    # colour types: 0 grey, 2 RGB, 3 palette (indices pass through as one band), 4 grey+alpha, 6 RGBA
+    return {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}.get(header[25], 3)
+
+
+_BAND_COLOR_INTERP = {
+    1: ("Gray",),
+    2: ("Gray", "Alpha"),
+    3: ("Red", "Green", "Blue"),
+    4: ("Red", "Green", "Blue", "Alpha"),
+}
+
+
+def _copernicus_mosaic_vrt(tile_records: Sequence[Tuple[Path, int, int, int]], tile_size: int) -> str:
+    """Return a VRT mosaicking same-zoom XYZ tiles of ``tile_size`` pixels in EPSG:3857."""
+
+    zoom = tile_records[0][1]
+    xs = [x for _, _, x, _ in tile_records]
+    ys = [y for _, _, _, y in tile_records]
+    min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+    origin_x, _, _, origin_y = _tile_bounds(min_x, min_y, zoom)
+    resolution = _tile_span(zoom) / tile_size
+    width = (max_x - min_x + 1) * tile_size
+    height = (max_y - min_y + 1) * tile_size
+    bands = _tile_band_count(tile_records[0][0])
+
+    lines = [
+        f'<VRTDataset rasterXSize="{width}" rasterYSize="{height}">',
+        "  <SRS>EPSG:3857</SRS>",
+        f"  <GeoTransform>{origin_x!r}, {resolution!r}, 0.0, {origin_y!r}, 0.0, {-resolution!r}</GeoTransform>",
+    ]
+    # Every band lists the same sources, so each tile's filename and rects are formatted once.
+    src_rect = f'      <SrcRect xOff="0" yOff="0" xSize="{tile_size}" ySize="{tile_size}"/>'
+    sources = [
+        (
+            f'      <SourceFilename relativeToVRT="0">{xml_escape(str(tile_path))}</SourceFilename>',
+            f'      <DstRect xOff="{(x - min_x) * tile_size}" yOff="{(y - min_y) * tile_size}"'
+            f' xSize="{tile_size}" ySize="{tile_size}"/>',
+        )
+        for tile_path, _, x, y in tile_records
+    ]
+    for band, interp in enumerate(_BAND_COLOR_INTERP[bands], start=1):
+        lines.append(f'  <VRTRasterBand dataType="Byte" band="{band}">')
+        lines.append(f"    <ColorInterp>{interp}</ColorInterp>")
+        source_band = f"      <SourceBand>{band}</SourceBand>"
+        for filename, dst_rect in sources:
+            lines.extend(("    <SimpleSource>", filename, source_band, src_rect, dst_rect, "    </SimpleSource>"))
+        lines.append("  </VRTRasterBand>")
+    lines.append("</VRTDataset>")
+    return "\n".join(lines) + "\n"
+
+
+@functools.lru_cache(maxsize=32)
+def _tile_span(zoom: int) -> float:
+    """Width of one XYZ tile at ``zoom`` in EPSG:3857 metres."""
+    return (ORIGIN_SHIFT * 2) / 2**zoom
 
 
 def _tile_bounds(x: int, y: int, zoom: int) -> Tuple[float, float, float, float]:
-    n = 2**zoom
-    tile_size = (ORIGIN_SHIFT * 2) / n
+    tile_size = _tile_span(zoom)
     minx = -ORIGIN_SHIFT + x * tile_size
     maxx = minx + tile_size
     maxy = ORIGIN_SHIFT - y * tile_size
@@ -2321,156 +3156,3 @@ def _lat_to_tile(lat: float, zoom: int) -> float:
     lat_rad = math.radians(lat)
     n = 2**zoom
     return (1 - math.log(math.tan(lat_rad) + (1 / math.cos(lat_rad))) / math.pi) / 2 * n
-
-    def prepare_modis_rgb(
-        self,
-        modis_root: Path,
-        *,
-        tiles: Sequence[str],
-        date_code: str,
-    ) -> Path:
-        band_map: Dict[str, str] = {
-            "red": "Nadir_Reflectance_Band1",
-            "green": "Nadir_Reflectance_Band4",
-            "blue": "Nadir_Reflectance_Band3",
-        }
-        return self._prepare_rgb_product(
-            product_root=modis_root,
-            tiles=tiles,
-            date_code=date_code,
-            band_map=band_map,
-            pattern_template="*{band}_doy{date_code}*.tif",
-            product_slug="modis",
-            scale_min=self._modis.scale_min,
-            scale_max=self._modis.scale_max,
-            gamma=self._modis.gamma,
-        )
-
-    def prepare_viirs_rgb(
-        self,
-        viirs_root: Path,
-        *,
-        tiles: Sequence[str],
-        date_code: str,
-    ) -> Path:
-        product = (self._viirs.product or "").strip()
-        if product.endswith((".002", ".003")):
-            band_map: Dict[str, str] = {
-                "red": "SurfReflect_I1_1",
-                "green": "SurfReflect_I2_1",
-                "blue": "SurfReflect_I3_1",
-            }
-        else:
-            band_map = {
-                "red": "SurfReflect_I1",
-                "green": "SurfReflect_I2",
-                "blue": "SurfReflect_I3",
-            }
-        return self._prepare_rgb_product(
-            product_root=viirs_root,
-            tiles=tiles,
-            date_code=date_code,
-            band_map=band_map,
-            pattern_template="*{band}_doy{date_code}*.tif",
-            product_slug="viirs",
-            scale_min=self._viirs.scale_min,
-            scale_max=self._viirs.scale_max,
-            gamma=self._viirs.gamma,
-        )
-
-    def _prepare_rgb_product(
-        self,
-        *,
-        product_root: Path,
-        tiles: Sequence[str],
-        date_code: str,
-        band_map: Dict[str, str],
-        pattern_template: str,
-        product_slug: str,
-        scale_min: float,
-        scale_max: float,
-        gamma: float,
-    ) -> Path:
-        if not tiles:
-            raise ValueError(f"No {product_slug} tiles provided for processing")
-
-        band_files: Dict[str, List[Path]] = {key: [] for key in band_map}
-
-        for tile in tiles:
-            tile_dir = product_root / tile
-            if not tile_dir.exists():
-                raise FileNotFoundError(f"{product_slug.upper()} tile directory not found: {tile_dir}")
-            data_dir = self._resolve_tile_data_dir(tile_dir)
-
-            for key, band_name in band_map.items():
-                pattern = pattern_template.format(band=band_name, date_code=date_code)
-                matches = list(data_dir.glob(pattern))
-                if not matches:
-                    raise FileNotFoundError(
-                        f"Band {band_name} not found in {data_dir} for tile {tile}"
-                    )
-                band_files[key].extend(matches)
-
-        vrt_paths: Dict[str, Path] = {}
-        for key, files in band_files.items():
-            list_path = self._temp_dir / f"{product_slug}_{key}_tiles.txt"
-            list_path.write_text("\n".join(str(path) for path in files), encoding="utf-8")
-            vrt_path = self._temp_dir / f"{product_slug}_{key}_mosaic.vrt"
-            command = [
-                "gdalbuildvrt",
-                "-input_file_list",
-                str(list_path),
-                str(vrt_path),
-            ]
-            self._runner.run(command, description=f"mosaic {product_slug.upper()} {key} band")
-            vrt_paths[key] = vrt_path
-
-        rgb_vrt = self._temp_dir / f"{product_slug}_rgb.vrt"
-        command = [
-            "gdalbuildvrt",
-            "-separate",
-            str(rgb_vrt),
-            str(vrt_paths["red"]),
-            str(vrt_paths["green"]),
-            str(vrt_paths["blue"]),
-        ]
-        self._runner.run(command, description=f"combine {product_slug.upper()} bands into RGB VRT")
-
-        rgb_tif = self._processing_dir / f"{product_slug}_{date_code}_rgb.tif"
-
-        command = [
-            "gdal_translate",
-            "-of",
-            "GTiff",
-            "-co",
-            "TILED=YES",
-            "-co",
-            "COMPRESS=DEFLATE",
-            "-co",
-            "PHOTOMETRIC=RGB",
-            "-ot",
-            "Byte",
-            "-scale",
-            str(scale_min),
-            str(scale_max),
-            "0",
-            "255",
-        ]
-        if gamma and gamma != 1.0:
-            command.extend(["-exponent", str(gamma)])
-        command.extend([
-            "-a_nodata",
-            "0",
-            str(rgb_vrt),
-            str(rgb_tif),
-        ])
-        self._runner.run(command, description=f"convert {product_slug.upper()} RGB mosaic to GeoTIFF")
-
-        cog_path = self.create_cog(rgb_tif)
-        return cog_path
-
-    def _resolve_tile_data_dir(self, tile_dir: Path) -> Path:
-        candidates = sorted(p for p in tile_dir.iterdir() if p.is_dir())
-        if candidates:
-            return candidates[0]
-        return tile_dir
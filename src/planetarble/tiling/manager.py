@@ -2,20 +2,63 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib.util
+import json
+import math
+import os
 import shutil
 import subprocess
 import sys
+from collections import deque
 from pathlib import Path
-from typing import List
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
+from planetarble.core.gdal_env import configure_gdal, gdal_bindings, gdal_env, run_gdal_jobs
 from planetarble.core.models import ProcessingConfig
 from planetarble.logging import get_logger, log_step
 
 from .base import TileGenerator
+from .mbtiles import merge_overview_tiles, union_mbtiles
 
 LOGGER = get_logger(__name__)
 
+_WEBMERCATOR_HALF_EXTENT = 20037508.342789244
+# Metres per pixel of a 256px tile at zoom 0.
+_WEBMERCATOR_BASE_RESOLUTION = 2 * _WEBMERCATOR_HALF_EXTENT / 256
+
+# Lines of command output quoted in a TileCommandError.
+_OUTPUT_TAIL_LINES = 50
+_WARP_OPTIONS = ("NUM_THREADS=ALL_CPUS",)
+_WARP_MEMORY_MB = 1024
+# Bytes gdal_translate reads per swath; large enough that a 512px MBTiles row
+# of a wide raster is fetched in one pass.
+_TRANSLATE_SWATH_BYTES = 500_000_000
+# Pixel size of the MBTiles tiles gdal_translate writes (BLOCKSIZE creation option).
+_MBTILES_BLOCKSIZE = 512
+# Resampling kernels gdaladdo accepts for MBTiles overviews.
+_VALID_RESAMPLING = frozenset({"nearest", "average", "gauss", "cubic", "cubicspline", "lanczos", "mode"})
+# An overview copy holds the base zoom plus up to a third more for the levels it builds.
+_OVERVIEW_COPY_FACTOR = 1.4
+# The warp is materialised once on the tile grid; lossless so alpha/nodata edges stay exact.
+_WARP_COG_OPTIONS = (
+    "TILING_SCHEME=GoogleMapsCompatible",
+    "BLOCKSIZE=512",
+    "COMPRESS=DEFLATE",
+    "PREDICTOR=2",
+    "NUM_THREADS=ALL_CPUS",
+    "BIGTIFF=IF_SAFER",
+    "OVERVIEWS=IGNORE_EXISTING",
+)
+# The same options spliced as gdalwarp arguments, built once.
+_WARP_ARGS = (
+    *(part for option in _WARP_OPTIONS for part in ("-wo", option)),
+    "-wm",
+    str(_WARP_MEMORY_MB),
+)
+_WARP_COG_ARGS = tuple(part for option in _WARP_COG_OPTIONS for part in ("-co", option))
+
 
 class TileCommandError(RuntimeError):
     """Raised when a tiling command exits with a non-zero code."""
@@ -24,26 +67,53 @@ class TileCommandError(RuntimeError):
 class TileRunner:
     """Execute external commands and propagate failures with context."""
 
-    def __init__(self, *, dry_run: bool = False) -> None:
+    def __init__(self, *, dry_run: bool = False, env: Optional[Dict[str, str]] = None) -> None:
         self._dry_run = dry_run
+        self._env = env if env is not None else gdal_env()
 
-    def run(self, command: List[str], *, description: str) -> None:
+    def run(
+        self,
+        command: List[str],
+        *,
+        description: str,
+        env: Optional[Dict[str, str]] = None,
+    ) -> None:
         log_step(LOGGER, phase="tile", step=description, command=command)
         if self._dry_run:
             return
-        try:
-           proc = subprocess.run(command, check=True, text=True, capture_output=True)
-           if proc.stdout:
-               LOGGER.debug(proc.stdout.strip())
-           if proc.stderr:
-               LOGGER.debug(proc.stderr.strip())
-        except subprocess.CalledProcessError as exc:  # pragma: no cover - depends on GDAL runtime
-           msg = f"Command failed: {' '.join(command)}"
-           if exc.stdout:
-               msg += f"\n--- stdout ---\n{exc.stdout}"
-           if exc.stderr:
-               msg += f"\n--- stderr ---\n{exc.stderr}"
-           raise TileCommandError(msg) from exc
+        # Stream output line by line instead of buffering it: GDAL progress output
+        # of long warps can be large. Only the tail is kept for the error message.
+        tail: Deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env={**self._env, **env} if env else self._env,
+        ) as proc:
+            for line in proc.stdout:
+                line = line.rstrip()
+                if line:
+                    LOGGER.debug(line)
+                    tail.append(line)
+            returncode = proc.wait()
+        if returncode != 0:
+            msg = f"Command failed: {' '.join(command)}"
+            if tail:
+                msg += "\n--- output ---\n" + "\n".join(tail)
+            raise TileCommandError(msg)
+
+    def run_many(
+        self,
+        jobs: Sequence[Tuple[List[str], str]],
+        *,
+        max_workers: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Run independent ``(command, description)`` jobs concurrently (see ``run_gdal_jobs``)."""
+
+        run_gdal_jobs(self.run, jobs, sequential=self._dry_run, max_workers=max_workers, env=env)
 
 
 class TilingManager(TileGenerator):
@@ -62,17 +132,37 @@ class TilingManager(TileGenerator):
         self._output_dir = output_dir
         self._tiling_dir = self._output_dir / "tiling"
         self._dry_run = dry_run
-        self._runner = TileRunner(dry_run=dry_run)
+        self._runner = TileRunner(dry_run=dry_run, env=gdal_env(config))
+        configure_gdal(config)
         self._gdal2mbtiles_cmd = self._resolve_gdal2mbtiles()
+        self._overview_resampling = config.resampling.lower()
+        self._overview_factors = _overview_factors(config.min_zoom, config.max_zoom)
+        self._target_res = _webmercator_resolution(config.max_zoom)
+        self._target_res_arg = repr(self._target_res)
         self._temp_dir.mkdir(parents=True, exist_ok=True)
-        self._output_dir.mkdir(parents=True, exist_ok=True)
+        # parents=True also creates the output dir
         self._tiling_dir.mkdir(parents=True, exist_ok=True)
 
     def reproject_to_webmercator(self, input_path: Path) -> Path:
-        output = self._temp_dir / f"{input_path.stem}_3857.vrt"
+        output = self._temp_dir / f"{input_path.stem}_3857.tif"
+        target_res = self._target_res
+        cache_key = _cache_key(
+            input_path,
+            [
+                "gdalwarp",
+                "EPSG:3857",
+                "bilinear",
+                self._target_res_arg,
+                *_WARP_OPTIONS,
+                str(_WARP_MEMORY_MB),
+                *_WARP_COG_OPTIONS,
+            ],
+        )
+        if not self._dry_run and _key_matches(output, cache_key):
+            LOGGER.info("reusing reprojected COG", extra={"path": str(output)})
+            return output
         if output.exists() and not self._dry_run:
             output.unlink()
-        target_res = _webmercator_resolution(self._config.max_zoom)
         LOGGER.info(
             "warp params",
             extra={
@@ -82,24 +172,59 @@ class TilingManager(TileGenerator):
             },
         )
 
+        gdal = None if self._dry_run else _gdal_bindings()
+        if gdal is not None:
+            log_step(LOGGER, phase="tile", step="reproject raster to EPSG:3857", extra={"path": str(output)})
+            options = gdal.WarpOptions(
+                format="COG",
+                creationOptions=list(_WARP_COG_OPTIONS),
+                dstSRS="EPSG:3857",
+                resampleAlg="bilinear",
+                xRes=target_res,
+                yRes=target_res,
+                dstAlpha=True,
+                multithread=True,
+                warpOptions=list(_WARP_OPTIONS),
+                warpMemoryLimit=_WARP_MEMORY_MB,
+            )
+            try:
+                dataset = gdal.Warp(str(output), str(input_path), options=options)
+            except RuntimeError as exc:
+                raise TileCommandError(f"gdal.Warp failed for {input_path}: {exc}") from exc
+            if dataset is None:
+                raise TileCommandError(f"gdal.Warp failed for {input_path}")
+            dataset = None  # closing the dataset finishes the COG
+            _write_key(output, cache_key)
+            return output
+
         command = [
             "gdalwarp",
+            "--config",
+            "GDAL_NUM_THREADS",
+            self._config.gdal_num_threads,
+            "--config",
+            "GDAL_CACHEMAX",
+            self._config.gdal_cachemax,
+            *_WARP_ARGS,
             "-t_srs",
             "EPSG:3857",
             "-r",
             "bilinear",
             "-multi",
             "-tr",
-            f"{target_res}",
-            f"{target_res}",
+            self._target_res_arg,
+            self._target_res_arg,
             "-dstalpha",
             "-overwrite",
             "-of",
-            "VRT",
+            "COG",
+            *_WARP_COG_ARGS,
             str(input_path),
             str(output),
         ]
         self._runner.run(command, description="reproject raster to EPSG:3857")
+        if not self._dry_run:
+            _write_key(output, cache_key)
         return output
 
     def create_mbtiles(
@@ -121,6 +246,21 @@ class TilingManager(TileGenerator):
         if preferred and not self._gdal2mbtiles_cmd:
             raise TileCommandError("gdal2mbtiles requested but not available in environment")
 
+        cache_key = _cache_key(
+            source_path,
+            [
+                tile_format,
+                quality_value,
+                str(self._config.min_zoom),
+                str(self._config.max_zoom),
+                self._config.zoom_level_strategy,
+                self._config.resampling,
+                tiler_preference,
+            ],
+        )
+        if not self._dry_run and _key_matches(mbtiles_path, cache_key):
+            LOGGER.info("reusing MBTiles built from unchanged source", extra={"path": str(mbtiles_path)})
+            return mbtiles_path
         if mbtiles_path.exists() and not self._dry_run:
             mbtiles_path.unlink()
 
@@ -137,6 +277,8 @@ class TilingManager(TileGenerator):
                         "max_zoom": self._config.max_zoom,
                     },
                 )
+                if not self._dry_run:
+                    _write_key(mbtiles_path, cache_key)
                 return mbtiles_path
             except TileCommandError:
                 if preferred:
@@ -150,6 +292,89 @@ class TilingManager(TileGenerator):
             reprojected_path = self.reproject_to_webmercator(source_path)
         self._run_gdal_translate(reprojected_path, mbtiles_path, tile_format, quality_value)
         self.optimize_overviews(mbtiles_path)
+        if not self._dry_run:
+            _write_key(mbtiles_path, cache_key)
+        return mbtiles_path
+
+    def create_mbtiles_parallel(
+        self,
+        source_path: Path,
+        shards: int | None = None,
+        *,
+        format: str | None = None,
+        quality: int | None = None,
+        destination: Path | None = None,
+    ) -> Path:
+        """Tile ``source_path`` as parallel row bands, then union them into one MBTiles.
+
+        Bands follow the boundaries of the 512px tiles gdal_translate writes at
+        the max-zoom resolution, so no tile is split between two parts and the
+        parts are disjoint (``union_mbtiles`` keeps the first copy of a tile,
+        which therefore never matters). Overviews are built once on the merged
+        archive.
+        """
+
+        tile_format = (format or self._config.tile_format).upper()
+        quality_value = str(quality or self._config.tile_quality)
+        mbtiles_path = destination or (
+            self._tiling_dir / f"planet_{self._config.gebco_year}_{self._config.max_zoom}z.mbtiles"
+        )
+        shards = max(1, shards or os.cpu_count() or 1)
+        cache_key = _cache_key(
+            source_path,
+            [
+                "parallel",
+                tile_format,
+                quality_value,
+                str(self._config.min_zoom),
+                str(self._config.max_zoom),
+                self._config.zoom_level_strategy,
+                self._config.resampling,
+            ],
+        )
+        if not self._dry_run and _key_matches(mbtiles_path, cache_key):
+            LOGGER.info("reusing MBTiles built from unchanged source", extra={"path": str(mbtiles_path)})
+            return mbtiles_path
+
+        reprojected_path = self.reproject_to_webmercator(source_path)
+        extent = None if self._dry_run else _raster_extent(reprojected_path)
+        bands = _shard_projwins(extent, self._config.max_zoom, shards, tile_size=_MBTILES_BLOCKSIZE)
+        parts = [self._temp_dir / f"{mbtiles_path.stem}_part{index}.mbtiles" for index in range(len(bands))]
+        if not self._dry_run:
+            for path in (mbtiles_path, *parts):
+                if path.exists():
+                    path.unlink()
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Split the cores between the bands instead of letting every gdal_translate claim all of them.
+        threads = str(max(1, (os.cpu_count() or 1) // len(bands)))
+        cachemax = _cache_share(self._config.gdal_cachemax, len(bands))
+        with ThreadPoolExecutor(max_workers=len(bands)) as pool:
+            futures = [
+                pool.submit(
+                    self._run_gdal_translate,
+                    reprojected_path,
+                    part,
+                    tile_format,
+                    quality_value,
+                    projwin=band,
+                    num_threads=threads,
+                    cachemax=cachemax,
+                )
+                for part, band in zip(parts, bands)
+            ]
+            for future in futures:
+                future.result()
+        if self._dry_run:
+            return mbtiles_path
+
+        metadata = {"bounds": _lonlat_bounds(extent)} if extent is not None else None
+        union_mbtiles([part for part in parts if part.exists()], mbtiles_path, metadata=metadata)
+        for part in parts:
+            part.unlink(missing_ok=True)
+        self.optimize_overviews(mbtiles_path, workers=len(bands))
+        _write_key(mbtiles_path, cache_key)
         return mbtiles_path
 
     def _should_use_gdal2mbtiles(self, tile_format: str, auto_mode: bool, preferred: bool) -> bool:
@@ -165,7 +390,10 @@ class TilingManager(TileGenerator):
             return False
         return tile_format == "JPEG"
 
-    def _libvips_healthy(self) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _libvips_healthy() -> bool:
+        # Importing pyvips initialises libvips; probe once per process.
         try:
             import pyvips  # noqa
             # 最小動作確認（内部シンボルに触れない安全な操作）
@@ -189,13 +417,14 @@ class TilingManager(TileGenerator):
         command.extend([str(input_path), str(destination)])
         self._runner.run(command, description="generate MBTiles pyramid via gdal2mbtiles")
 
-    def _resolve_gdal2mbtiles(self) -> list[str] | None:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _resolve_gdal2mbtiles() -> tuple[str, ...] | None:
         candidate = shutil.which("gdal2mbtiles")
         if candidate:
-            return [candidate]
-        spec = importlib.util.find_spec("gdal2mbtiles.main")
-        if spec is not None:
-            return [sys.executable, "-m", "gdal2mbtiles"]
+            return (candidate,)
+        if importlib.util.find_spec("gdal2mbtiles") is not None and importlib.util.find_spec("gdal2mbtiles.main"):
+            return (sys.executable, "-m", "gdal2mbtiles")
         return None
 
     def _run_gdal_translate(
@@ -204,6 +433,10 @@ class TilingManager(TileGenerator):
         destination: Path,
         tile_format: str,
         quality_value: str,
+        *,
+        projwin: Optional[Tuple[float, float, float, float]] = None,
+        num_threads: str = "ALL_CPUS",
+        cachemax: Optional[str] = None,
     ) -> None:
         strategy = (self._config.zoom_level_strategy or "LOWER").upper()
         if strategy not in {"LOWER", "UPPER", "AUTO"}:
@@ -212,61 +445,278 @@ class TilingManager(TileGenerator):
                 self._config.zoom_level_strategy,
             )
             strategy = "LOWER"
+        creation_options = [
+            f"BLOCKSIZE={_MBTILES_BLOCKSIZE}",
+            "TILING_SCHEME=GoogleMapsCompatible",
+            f"TILE_FORMAT={tile_format}",
+            f"QUALITY={quality_value}",
+            f"MINZOOM={self._config.min_zoom}",
+            f"MAXZOOM={self._config.max_zoom}",
+            f"ZOOM_LEVEL_STRATEGY={strategy}",
+        ]
+
+        gdal = None if self._dry_run else _gdal_bindings()
+        if gdal is not None and _has_thread_local_config(gdal):
+            # In-process run: no fork/exec per call, and the block cache stays warm
+            # across bands. The thread count is set per thread so parallel bands
+            # keep their own share; older bindings take the gdal_translate path.
+            log_step(
+                LOGGER,
+                phase="tile",
+                step="generate MBTiles pyramid via gdal.Translate",
+                extra={"path": str(destination)},
+            )
+            options = gdal.TranslateOptions(
+                format="MBTILES",
+                creationOptions=creation_options,
+                projWin=list(projwin) if projwin is not None else None,
+            )
+            try:
+                with gdal.config_options(
+                    {"GDAL_NUM_THREADS": num_threads, "GDAL_SWATH_SIZE": str(_TRANSLATE_SWATH_BYTES)},
+                    thread_local=True,
+                ):
+                    dataset = gdal.Translate(str(destination), str(pyramid_path), options=options)
+            except RuntimeError as exc:
+                raise TileCommandError(f"gdal.Translate failed for {pyramid_path}: {exc}") from exc
+            if dataset is None:
+                raise TileCommandError(f"gdal.Translate failed for {pyramid_path}")
+            dataset = None  # closing the dataset flushes the MBTiles
+            return
+
         command = [
             "gdal_translate",
             "--config",
             "GDAL_NUM_THREADS",
-            "ALL_CPUS",
+            num_threads,
             "--config",
             "GDAL_CACHEMAX",
-            "2048",
+            cachemax or self._config.gdal_cachemax,
+            "--config",
+            "GDAL_SWATH_SIZE",
+            str(_TRANSLATE_SWATH_BYTES),
             "-of",
             "MBTILES",
-            "-co",
-            "BLOCKSIZE=512",
-            "-co",
-            "TILING_SCHEME=GoogleMapsCompatible",
-            "-co",
-            f"TILE_FORMAT={tile_format}",
-            "-co",
-            f"QUALITY={quality_value}",
-            "-co",
-            f"MINZOOM={self._config.min_zoom}",
-            "-co",
-            f"MAXZOOM={self._config.max_zoom}",
-            "-co",
-            f"ZOOM_LEVEL_STRATEGY={strategy}",
-            str(pyramid_path),
-            str(destination),
+            *(part for option in creation_options for part in ("-co", option)),
         ]
+        if projwin is not None:
+            command.extend(["-projwin", *(repr(value) for value in projwin)])
+        command.extend([str(pyramid_path), str(destination)])
         self._runner.run(command, description="generate MBTiles pyramid via gdal_translate")
 
-    def optimize_overviews(self, mbtiles_path: Path) -> None:
+    def optimize_overviews(self, mbtiles_path: Path, *, workers: int = 1) -> None:
+        """Build the MBTiles overview zooms with ``gdaladdo``.
+
+        With ``workers > 1`` the factors are split round-robin across copies of
+        the archive, built concurrently and their zoom levels merged back. The
+        number of copies is capped by the free space next to the archive, and
+        falls back to a single in-place run when not even one copy fits.
+        """
+
         if self._dry_run:
             return
 
-        resampling = self._config.resampling.lower()
-        if resampling not in ("nearest", "average", "gauss", "cubic", "cubicspline", "lanczos", "mode"):
+        resampling = self._overview_resampling
+        if resampling not in _VALID_RESAMPLING:
             LOGGER.warning(f"unknown resampling method '{resampling}'; defaulting to 'cubic'")
             resampling = "cubic"
 
-        overview_levels = self._compute_overview_factors()
+        overview_levels = self._overview_factors
         if not overview_levels:
             LOGGER.debug("no overview levels requested; skipping gdaladdo")
             return
 
         LOGGER.info(f"building overviews: {', '.join(overview_levels)}")
-        command = ["gdaladdo", "-r", resampling, str(mbtiles_path), *overview_levels]
-        self._runner.run(command, description="build MBTiles overviews")
+        buckets = max(1, min(workers, len(overview_levels)))
+        if buckets > 1:
+            buckets = self._overview_buckets_that_fit(mbtiles_path, buckets)
+        if buckets == 1:
+            # MBTiles overviews share one SQLite writer, so the levels are built by a single
+            # gdaladdo; the runner's GDAL_NUM_THREADS/GDAL_CACHEMAX go to the resampling.
+            command = self._gdaladdo_command(mbtiles_path, overview_levels, resampling)
+            self._runner.run(command, description="build MBTiles overviews")
+            return
+
+        # Each copy gets its own SQLite writer; every bucket still starts from the base zoom.
+        copies = [
+            mbtiles_path.with_name(f"{mbtiles_path.stem}.ovr{index}{mbtiles_path.suffix}")
+            for index in range(buckets)
+        ]
+        for copy in copies:
+            shutil.copy2(mbtiles_path, copy)
+        bucket_env = {
+            "GDAL_NUM_THREADS": str(max(1, (os.cpu_count() or 1) // buckets)),
+            "GDAL_CACHEMAX": _cache_share(gdal_env(self._config)["GDAL_CACHEMAX"], buckets),
+        }
+        try:
+            self._runner.run_many(
+                [
+                    (
+                        self._gdaladdo_command(copy, overview_levels[index::buckets], resampling),
+                        "build MBTiles overviews",
+                    )
+                    for index, copy in enumerate(copies)
+                ],
+                max_workers=buckets,
+                env=bucket_env,
+            )
+            merge_overview_tiles(copies, mbtiles_path)
+        finally:
+            for copy in copies:
+                copy.unlink(missing_ok=True)
+
+    def _overview_buckets_that_fit(self, mbtiles_path: Path, buckets: int) -> int:
+        """Cap ``buckets`` by how many archive copies (plus their new levels) fit on disk."""
+
+        per_copy = mbtiles_path.stat().st_size * _OVERVIEW_COPY_FACTOR
+        free = shutil.disk_usage(mbtiles_path.parent).free
+        fit = int(free // per_copy) if per_copy else buckets
+        if fit < buckets:
+            LOGGER.info(
+                "limiting concurrent overview builds to the free disk space",
+                extra={"requested": buckets, "fits": fit, "free_bytes": free},
+            )
+        return max(1, min(buckets, fit))
+
+    def _gdaladdo_command(self, mbtiles_path: Path, levels: Sequence[str], resampling: str) -> List[str]:
+        # Thread count and cache size come from the runner environment, not --config.
+        return ["gdaladdo", "-r", resampling, str(mbtiles_path), *levels]
+
+
+def _has_thread_local_config(gdal) -> bool:
+    """True when ``gdal.config_options(..., thread_local=True)`` exists (GDAL >= 3.7)."""
 
-    def _compute_overview_factors(self) -> list[str]:
-        # Overviews are powers of two down to zoom level 0.
-        max_zoom = max(0, self._config.max_zoom)
-        min_zoom = max(0, self._config.min_zoom)
-        levels = max(0, max_zoom - min_zoom)
-        return [str(2**level) for level in range(1, levels + 1)]
+    try:
+        return hasattr(gdal, "config_options") and int(gdal.VersionInfo("VERSION_NUM")) >= 3_070_000
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+def _cache_share(cachemax: str, parts: int) -> str:
+    """Split a ``GDAL_CACHEMAX`` value (MB or ``N%``) between ``parts`` processes."""
+
+    value = cachemax.strip()
+    try:
+        if value.endswith("%"):
+            return f"{max(1, int(float(value[:-1]) // parts))}%"
+        return str(max(1, int(value) // parts))
+    except ValueError:
+        return value
+
+
+def _overview_factors(min_zoom: int, max_zoom: int) -> tuple[str, ...]:
+    # Overviews are powers of two down to the minimum zoom level.
+    levels = max(0, max(0, max_zoom) - max(0, min_zoom))
+    return tuple(str(1 << level) for level in range(1, levels + 1))
+
+
+def _gdal_bindings():
+    """Return ``osgeo.gdal`` with exceptions enabled, or ``None`` when it is not installed."""
+
+    return gdal_bindings()
+
+
+def _cache_key(input_path: Path, extra: Sequence[str]) -> str:
+    """Fingerprint ``input_path`` (real path, size, mtime) plus the settings in ``extra``."""
+
+    real = os.path.realpath(input_path)
+    try:
+        stat = os.stat(real)
+    except OSError:
+        fingerprint = [real]
+    else:
+        fingerprint = [real, str(stat.st_size), str(stat.st_mtime_ns)]
+    return hashlib.blake2b("\0".join([*fingerprint, *extra]).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _key_path(output: Path) -> Path:
+    return output.with_name(output.name + ".key")
+
+
+def _key_matches(output: Path, key: str) -> bool:
+    """True when ``output`` exists and was last built for ``key``."""
+
+    if not output.exists():
+        return False
+    try:
+        return _key_path(output).read_text(encoding="utf-8").strip() == key
+    except OSError:
+        return False
+
+
+def _write_key(output: Path, key: str) -> None:
+    try:
+        _key_path(output).write_text(key + "\n", encoding="utf-8")
+    except OSError as exc:  # pragma: no cover - filesystem errors
+        LOGGER.warning("failed to record build key", extra={"path": str(output), "error": str(exc)})
+
+
+def _raster_extent(path: Path) -> Optional[Tuple[float, float, float, float]]:
+    """``(minx, miny, maxx, maxy)`` of a north-up raster, or ``None`` when it cannot be read."""
+
+    gdal = _gdal_bindings()
+    try:
+        if gdal is not None:
+            dataset = gdal.Open(str(path))
+            width, height = dataset.RasterXSize, dataset.RasterYSize
+            origin_x, pixel_x, _, origin_y, _, pixel_y = dataset.GetGeoTransform()
+            dataset = None
+        else:
+            result = subprocess.run(
+                ["gdalinfo", "-json", "-nomd", str(path)], capture_output=True, text=True, check=True
+            )
+            info = json.loads(result.stdout)
+            width, height = info["size"]
+            origin_x, pixel_x, _, origin_y, _, pixel_y = info["geoTransform"]
+    except (OSError, RuntimeError, subprocess.CalledProcessError, ValueError, KeyError, TypeError):
+        return None
+    xs = (origin_x, origin_x + width * pixel_x)
+    ys = (origin_y, origin_y + height * pixel_y)
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _shard_projwins(
+    extent: Optional[Tuple[float, float, float, float]],
+    zoom: int,
+    shards: int,
+    *,
+    tile_size: int = 256,
+) -> List[Tuple[float, float, float, float]]:
+    """Split ``extent`` (the whole world when unknown) into row bands on a tile grid.
+
+    The grid is that of ``tile_size``-pixel tiles at the resolution of 256px
+    tiles at ``zoom``, so with ``tile_size=512`` a band edge never cuts one of
+    gdal_translate's 512px MBTiles tiles. Each band is ``(ulx, uly, lrx, lry)``
+    as taken by ``gdal_translate -projwin``.
+    """
+
+    half = _WEBMERCATOR_HALF_EXTENT
+    tiles = max(1, (2 ** max(0, int(zoom)) * 256) // tile_size)
+    span = 2 * half / tiles
+    minx, miny, maxx, maxy = extent or (-half, -half, half, half)
+    col0 = min(max(math.floor((minx + half) / span), 0), tiles - 1)
+    col1 = max(min(math.ceil((maxx + half) / span), tiles), col0 + 1)
+    row0 = min(max(math.floor((half - maxy) / span), 0), tiles - 1)
+    row1 = max(min(math.ceil((half - miny) / span), tiles), row0 + 1)
+    step = math.ceil((row1 - row0) / max(1, min(shards, row1 - row0)))
+    return [
+        (-half + col0 * span, half - row * span, -half + col1 * span, half - min(row + step, row1) * span)
+        for row in range(row0, row1, step)
+    ]
+
+
+def _lonlat_bounds(extent: Tuple[float, float, float, float]) -> str:
+    """MBTiles ``bounds`` metadata for an EPSG:3857 extent."""
+
+    def to_lonlat(x: float, y: float) -> Tuple[float, float]:
+        lon = x / _WEBMERCATOR_HALF_EXTENT * 180.0
+        lat = math.degrees(2 * math.atan(math.exp(y / _WEBMERCATOR_HALF_EXTENT * math.pi)) - math.pi / 2)
+        return max(-180.0, min(lon, 180.0)), lat
+
+    west, south = to_lonlat(extent[0], extent[1])
+    east, north = to_lonlat(extent[2], extent[3])
+    return f"{west:.6f},{south:.6f},{east:.6f},{north:.6f}"
 
 
 def _webmercator_resolution(zoom: int) -> float:
-    zoom = max(0, int(zoom))
-    return 156543.03392804097 / (2 ** zoom)
+    return _WEBMERCATOR_BASE_RESOLUTION / (1 << max(0, int(zoom)))
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import os
 import shutil
 import subprocess
 import time
@@ -10,13 +13,18 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, Tuple
 
+from planetarble.core.gdal_env import configure_gdal, gdal_bindings, gdal_env
 from planetarble.core.models import ProcessingConfig
 from planetarble.logging import get_logger
 
 from .manager import TileCommandError, TileRunner
+from .mbtiles import walk_xyz_dir
 
 LOGGER = get_logger(__name__)
 
+# Upper bound on the encoded size of a single-colour tile (any format, up to 512px).
+_UNIFORM_TILE_MAX_BYTES = 16 * 1024
+
 
 @dataclass
 class PmtilesMetadata:
@@ -61,7 +69,10 @@ class PmtilesTilingManager:
         self._temp_dir = temp_dir
         self._output_dir = output_dir
         self._dry_run = dry_run
-        self._runner = TileRunner(dry_run=dry_run)
+        self._runner = TileRunner(dry_run=dry_run, env=gdal_env(config))
+        configure_gdal(config)
+        self._bounds_cache: Dict[Tuple[str, int], Tuple[float, float, float, float]] = {}
+        self._header_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
         self._temp_dir.mkdir(parents=True, exist_ok=True)
         self._output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -77,14 +88,21 @@ class PmtilesTilingManager:
         tile_format: str,
         quality: int,
         resampling: str,
+        add_alpha: bool = False,
     ) -> Path:
-        """Materialize a WebMercator XYZ tile pyramid via ``gdal raster tile``."""
+        """Materialize a WebMercator XYZ tile pyramid via ``gdal raster tile``.
+
+        ``source_path`` may be in any CRS: the tiler warps to WebMercatorQuad
+        itself, so no reprojected intermediate is needed. ``add_alpha`` makes
+        nodata transparent without a separate ``gdalwarp -dstalpha`` pass.
+
+        A stamp next to the pyramid records the command and the source's size
+        and mtime; when neither changed the existing tiles are kept untouched,
+        which also lets ``pack_mbtiles`` reuse the archive packed from them.
+        """
 
         zxy_dir = self._temp_dir / f"{source_path.stem}_{min_zoom}-{max_zoom}_zxy"
-        if zxy_dir.exists() and not self._dry_run:
-            shutil.rmtree(zxy_dir)
-        if not self._dry_run:
-            zxy_dir.mkdir(parents=True, exist_ok=True)
+        stamp_path = zxy_dir.with_name(f"{zxy_dir.name}.stamp")
 
         gdal_format = _gdal_tile_format(tile_format)
         command = [
@@ -115,9 +133,26 @@ class PmtilesTilingManager:
             "--config",
             "GDAL_CACHEMAX",
             self._config.gdal_cachemax,
+            # One run for the whole zoom range: the overview zooms are built from the
+            # base tiles just written, with the same worker pool, instead of re-warping.
+            "--num-threads",
+            self._config.gdal_num_threads,
         ]
         if gdal_format in {"JPEG", "WEBP"}:
             command.extend(["--co", f"QUALITY={quality}"])
+        if add_alpha:
+            command.append("--add-alpha")
+
+        stamp = None
+        if not self._dry_run:
+            stamp = _zxy_stamp(source_path, command, canonicalize=self._config.canonicalize_uniform_tiles)
+            if zxy_dir.is_dir() and stamp_path.is_file() and stamp_path.read_text(encoding="utf-8") == stamp:
+                LOGGER.info("reusing XYZ tiles built from an unchanged source", extra={"path": str(zxy_dir)})
+                return zxy_dir
+            stamp_path.unlink(missing_ok=True)
+            if zxy_dir.exists():
+                shutil.rmtree(zxy_dir)
+            zxy_dir.mkdir(parents=True, exist_ok=True)
 
         start = time.perf_counter()
         try:
@@ -133,13 +168,17 @@ class PmtilesTilingManager:
             )
             fallback = command[:]
             _replace_resampling(fallback, "bilinear")
-            fallback.extend(["--num-threads", "1"])
+            fallback[fallback.index("--num-threads") + 1] = "1"
             self._runner.run(
                 fallback,
                 description="build XYZ tiles via gdal raster tile (serial retry)",
             )
         duration = time.perf_counter() - start
         LOGGER.debug("gdal raster tile finished", extra={"duration_s": f"{duration:.2f}"})
+        if not self._dry_run and self._config.canonicalize_uniform_tiles:
+            self._canonicalize_uniform_tiles(zxy_dir)
+        if stamp is not None:
+            stamp_path.write_text(stamp, encoding="utf-8")
         return zxy_dir
 
     # ---------------------------------------------------------------------
@@ -156,8 +195,12 @@ class PmtilesTilingManager:
         name: str,
         attribution: str,
         bounds_mode: str = "auto",
+        scratch_dir: Path | None = None,
     ) -> Path:
-        """Pack a directory of XYZ tiles into an MBTiles archive."""
+        """Pack a directory of XYZ tiles into an MBTiles archive.
+
+        The archive lands in ``scratch_dir`` when given, else in the temp dir.
+        """
 
         metadata = self._build_metadata(
             source_path,
@@ -168,14 +211,24 @@ class PmtilesTilingManager:
             attribution=attribution,
             bounds_mode=bounds_mode,
         )
-        metadata_path = zxy_dir / "metadata.json"
-        if not self._dry_run:
-            metadata_path.write_text(json.dumps(metadata.to_json()), encoding="utf-8")
-
+        metadata_text = json.dumps(metadata.to_json())
         image_format = _metadata_format(tile_format)
-        mbtiles_path = self._temp_dir / f"{source_path.stem}_{min_zoom}-{max_zoom}.mbtiles"
-        if mbtiles_path.exists() and not self._dry_run:
-            mbtiles_path.unlink()
+        mbtiles_path = (scratch_dir or self._temp_dir) / f"{source_path.stem}_{min_zoom}-{max_zoom}.mbtiles"
+        stamp_path = mbtiles_path.with_name(f"{mbtiles_path.name}.stamp")
+        if self._dry_run:
+            stamp = None
+        else:
+            digest = hashlib.blake2b(f"{image_format}\n{metadata_text}".encode("utf-8")).hexdigest()
+            stamp = f"{digest}\n{_tiles_fingerprint(zxy_dir)}\n"
+            if mbtiles_path.exists() and stamp_path.is_file() and stamp_path.read_text(encoding="utf-8") == stamp:
+                LOGGER.info("reusing MBTiles packed from unchanged tiles", extra={"path": str(mbtiles_path)})
+                return mbtiles_path
+            metadata_path = zxy_dir / "metadata.json"
+            if not metadata_path.is_file() or metadata_path.read_text(encoding="utf-8") != metadata_text:
+                metadata_path.write_text(metadata_text, encoding="utf-8")
+            stamp_path.unlink(missing_ok=True)
+            if mbtiles_path.exists():
+                mbtiles_path.unlink()
 
         command = [
             "mb-util",
@@ -185,6 +238,8 @@ class PmtilesTilingManager:
             f"--image_format={image_format}",
         ]
         self._runner.run(command, description="package XYZ tiles into MBTiles")
+        if stamp is not None:
+            stamp_path.write_text(stamp, encoding="utf-8")
         return mbtiles_path
 
     # ---------------------------------------------------------------------
@@ -215,14 +270,167 @@ class PmtilesTilingManager:
 
         return pmtiles_path
 
-    def verify(self, pmtiles_path: Path) -> None:
-        """Run ``pmtiles verify`` on the generated archive."""
+    def pack_and_convert(
+        self,
+        zxy_dir: Path,
+        *,
+        source_path: Path,
+        tile_format: str,
+        min_zoom: int,
+        max_zoom: int,
+        name: str,
+        attribution: str,
+        bounds_mode: str = "auto",
+        destination: Path | None = None,
+        deduplicate: bool = True,
+        cluster: bool = False,
+        scratch_dir: Path | None = None,
+    ) -> Path:
+        """Pack XYZ tiles and convert them to PMTiles without keeping the MBTiles.
+
+        SQLite needs a seekable file, so mb-util cannot stream into a FIFO;
+        instead the intermediate archive is placed on scratch space and
+        removed once ``pmtiles convert`` has consumed it. Without
+        ``scratch_dir`` that is ``/dev/shm`` when it is writable and has room
+        for an archive the size of the tiles, else the temp dir.
+        """
+
+        if scratch_dir is not None:
+            scratch = scratch_dir
+        elif self._dry_run:
+            scratch = self._temp_dir
+        else:
+            scratch = _memory_scratch_dir(_tiles_size(zxy_dir)) or self._temp_dir
+        if not self._dry_run:
+            scratch.mkdir(parents=True, exist_ok=True)
+        mbtiles_path = self.pack_mbtiles(
+            zxy_dir,
+            source_path=source_path,
+            tile_format=tile_format,
+            min_zoom=min_zoom,
+            max_zoom=max_zoom,
+            name=name,
+            attribution=attribution,
+            bounds_mode=bounds_mode,
+            scratch_dir=scratch,
+        )
+        try:
+            return self.convert_pmtiles(
+                mbtiles_path,
+                destination=destination or (self._output_dir / f"{mbtiles_path.stem}.pmtiles"),
+                deduplicate=deduplicate,
+                cluster=cluster,
+            )
+        finally:
+            if not self._dry_run:
+                mbtiles_path.unlink(missing_ok=True)
+                mbtiles_path.with_name(f"{mbtiles_path.name}.stamp").unlink(missing_ok=True)
+
+    def direct_zxy_to_pmtiles(
+        self,
+        zxy_dir: Path,
+        pmtiles_path: Path | None = None,
+        *,
+        source_path: Path,
+        tile_format: str,
+        min_zoom: int,
+        max_zoom: int,
+        name: str,
+        attribution: str,
+        bounds_mode: str = "auto",
+    ) -> Path:
+        """Write an XYZ directory straight into PMTiles with the ``pmtiles`` package.
+
+        Tiles are written in tile-id (Hilbert) order so the archive comes out
+        clustered and needs no ``pmtiles cluster`` pass; identical blobs are
+        stored once by the writer. Tile ids of a zoom level form one
+        contiguous range, so only one level is sorted in memory at a time.
+        """
+
+        pmtiles_module = _pmtiles_module()
+        if pmtiles_module is None:
+            raise TileCommandError("The 'pmtiles' Python package is required for direct XYZ conversion")
+        metadata = self._build_metadata(
+            source_path,
+            tile_format=tile_format,
+            min_zoom=min_zoom,
+            max_zoom=max_zoom,
+            name=name,
+            attribution=attribution,
+            bounds_mode=bounds_mode,
+        )
+        pmtiles_path = pmtiles_path or (
+            self._output_dir / f"{source_path.stem}_{min_zoom}-{max_zoom}.pmtiles"
+        )
+        LOGGER.info(
+            "tiling step",
+            extra={"description": "write XYZ tiles into PMTiles", "output": str(pmtiles_path)},
+        )
+        if self._dry_run:
+            return pmtiles_path
+
+        tile, writer_module, _ = pmtiles_module
+        min_lon, min_lat, max_lon, max_lat = metadata.bounds
+        center_lon, center_lat, center_zoom = metadata.center
+        header = {
+            "tile_type": getattr(tile.TileType, _PMTILES_TILE_TYPES[metadata.format]),
+            "tile_compression": tile.Compression.NONE,
+            "min_zoom": min_zoom,
+            "max_zoom": max_zoom,
+            "min_lon_e7": round(min_lon * 10_000_000),
+            "min_lat_e7": round(min_lat * 10_000_000),
+            "max_lon_e7": round(max_lon * 10_000_000),
+            "max_lat_e7": round(max_lat * 10_000_000),
+            "center_zoom": center_zoom,
+            "center_lon_e7": round(center_lon * 10_000_000),
+            "center_lat_e7": round(center_lat * 10_000_000),
+        }
+        with pmtiles_path.open("wb") as handle:
+            writer = writer_module.Writer(handle)
+            for zoom in range(min_zoom, max_zoom + 1):
+                entries = sorted(
+                    (tile.zxy_to_tileid(z, x, y), entry.path) for z, x, y, entry in walk_xyz_dir(zxy_dir, zoom)
+                )
+                for tile_id, path in entries:
+                    writer.write_tile(tile_id, Path(path).read_bytes())
+            writer.finalize(header, metadata.to_json())
+        return pmtiles_path
 
-        command = ["pmtiles", "verify", str(pmtiles_path)]
-        self._runner.run(command, description="verify PMTiles archive")
+    def verify(self, pmtiles_path: Path) -> None:
+        """Verify the generated archive.
+
+        With the ``pmtiles`` package the header and directories are checked
+        in-process over one mmap, and the header is kept for ``show_header``;
+        otherwise ``pmtiles verify`` is run. The in-process check is weaker
+        than the CLI: it covers the magic, directory ordering, entry offsets
+        and the addressed-tile count, but does not read tile data or metadata.
+        """
+
+        pmtiles_module = None if self._dry_run else _pmtiles_module()
+        if pmtiles_module is None or not pmtiles_path.is_file():
+            command = ["pmtiles", "verify", str(pmtiles_path)]
+            self._runner.run(command, description="verify PMTiles archive")
+            return
+        LOGGER.info("tiling step", extra={"description": "verify PMTiles archive", "path": str(pmtiles_path)})
+        tile, _, reader = pmtiles_module
+        header = _inspect_pmtiles(pmtiles_path, tile, reader, verify=True)
+        self._header_cache[(str(pmtiles_path), pmtiles_path.stat().st_mtime_ns)] = header
 
     def show_header(self, pmtiles_path: Path) -> Dict[str, Any]:
-        """Return PMTiles header information using ``pmtiles show``."""
+        """Return PMTiles header information, in-process when possible, else via ``pmtiles show``.
+
+        Both paths return the ``pmtiles show --header-json`` shape
+        (``tile_type``, ``tile_compression``, ``minzoom``, ``maxzoom``,
+        ``bounds``, ``center``).
+        """
+
+        pmtiles_module = None if self._dry_run else _pmtiles_module()
+        if pmtiles_module is not None and pmtiles_path.is_file():
+            cache_key = (str(pmtiles_path), pmtiles_path.stat().st_mtime_ns)
+            if cache_key not in self._header_cache:
+                tile, _, reader = pmtiles_module
+                self._header_cache[cache_key] = _inspect_pmtiles(pmtiles_path, tile, reader, verify=False)
+            return dict(self._header_cache[cache_key])
 
         command = ["pmtiles", "show", str(pmtiles_path), "--header-json"]
         LOGGER.info("tiling step", extra={"description": "inspect PMTiles header", "command": " ".join(command)})
@@ -262,6 +470,64 @@ class PmtilesTilingManager:
             attribution=attribution,
         )
 
+    def _canonicalize_uniform_tiles(self, zxy_dir: Path) -> int:
+        """Hardlink every single-colour tile to one canonical file per colour.
+
+        Encoders do not always emit byte-identical blobs for identical pixels,
+        which defeats PMTiles deduplication on ocean/nodata tiles. Opt-in via
+        ``ProcessingConfig.canonicalize_uniform_tiles``. Only tiles small enough
+        to be uniform are decoded, on a thread pool (Pillow releases the GIL
+        while decoding). Returns the number of tiles replaced; a no-op when
+        Pillow is unavailable.
+        """
+
+        try:
+            from PIL import Image  # local import; Pillow only needed for this pass
+        except ImportError:  # pragma: no cover - optional dependency
+            return 0
+        from concurrent.futures import ThreadPoolExecutor
+
+        def uniform_key(path: str) -> Tuple[Any, ...] | None:
+            try:
+                with Image.open(path) as image:
+                    extrema = image.getextrema()
+                    mode, size = image.mode, image.size
+                    # Palette tiles hold indices, so the colour lives in the palette and tRNS chunk.
+                    palette = tuple(image.getpalette() or ())
+                    transparency = image.info.get("transparency")
+            except OSError:
+                return None
+            bands = extrema if isinstance(extrema[0], tuple) else (extrema,)
+            if any(low != high for low, high in bands):
+                return None
+            return (os.path.splitext(path)[1], mode, size, bands, palette, transparency)
+
+        # A single-colour tile compresses to a few hundred bytes in every format,
+        # so larger files are skipped without decoding them.
+        candidates = (
+            entry.path
+            for _z, _x, _y, entry in walk_xyz_dir(zxy_dir)
+            if entry.stat().st_size <= _UNIFORM_TILE_MAX_BYTES
+        )
+        canonical: Dict[Tuple[Any, ...], str] = {}
+        replaced = 0
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            for path, key in _map_in_batches(pool, uniform_key, candidates):
+                if key is None:
+                    continue
+                target = canonical.setdefault(key, path)
+                if target == path or os.path.samefile(target, path):
+                    continue
+                staging = f"{path}.canonical"
+                try:
+                    os.link(target, staging)
+                except OSError:
+                    shutil.copyfile(target, staging)
+                os.replace(staging, path)
+                replaced += 1
+        LOGGER.debug("canonicalized uniform tiles", extra={"replaced": replaced})
+        return replaced
+
     def _determine_bounds(self, source_path: Path, *, mode: str) -> Tuple[float, float, float, float]:
         if self._dry_run:
             return (-180.0, -85.0511, 180.0, 85.0511)
@@ -270,40 +536,205 @@ class PmtilesTilingManager:
             return (-180.0, -85.0511, 180.0, 85.0511)
         if mode_normalized != "auto":
             raise ValueError(f"Unsupported bounds mode: {mode}")
-        command = ["gdalinfo", "-json", str(source_path)]
         try:
-            result = subprocess.run(command, check=True, capture_output=True, text=True)
-        except subprocess.CalledProcessError as exc:  # pragma: no cover - external tool errors
-            raise TileCommandError(f"Command failed: {' '.join(command)}") from exc
-        info = json.loads(result.stdout)
-        corners = info.get("cornerCoordinates") or {}
-        coords = []
-        for key in ("upperLeft", "upperRight", "lowerRight", "lowerLeft"):
-            value = corners.get(key)
-            if isinstance(value, dict) and {"lon", "lat"} <= set(value.keys()):
-                coords.append((float(value["lon"]), float(value["lat"])))
-        if not coords:
-            LOGGER.warning("corner coordinates missing; defaulting to global bounds")
-            return (-180.0, -85.0511, 180.0, 85.0511)
-        lons = [lon for lon, _ in coords]
-        lats = [lat for _, lat in coords]
-        return (min(lons), min(lats), max(lons), max(lats))
+            cache_key = (str(source_path), source_path.stat().st_mtime_ns)
+        except OSError:
+            cache_key = None
+        if cache_key in self._bounds_cache:
+            return self._bounds_cache[cache_key]
+        bounds = _bounds_from_info(_raster_info(source_path))
+        if cache_key is not None:
+            self._bounds_cache[cache_key] = bounds
+        return bounds
+
+
+def _gdal_bindings():
+    """Return ``osgeo.gdal`` with exceptions enabled, or ``None`` when it is not installed."""
+
+    return gdal_bindings()
+
+
+def _raster_info(source_path: Path) -> Dict[str, Any]:
+    """``gdalinfo -json`` output, produced in-process when the GDAL bindings are installed."""
+
+    gdal = _gdal_bindings()
+    if gdal is not None:
+        try:
+            return gdal.Info(str(source_path), format="json")
+        except RuntimeError as exc:
+            raise TileCommandError(f"gdal.Info failed for {source_path}: {exc}") from exc
+    command = ["gdalinfo", "-json", str(source_path)]
+    try:
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as exc:  # pragma: no cover - external tool errors
+        raise TileCommandError(f"Command failed: {' '.join(command)}") from exc
+    return json.loads(result.stdout)
+
+
+def _bounds_from_info(info: Dict[str, Any]) -> Tuple[float, float, float, float]:
+    corners = info.get("cornerCoordinates") or {}
+    bounds = None
+    for key in ("upperLeft", "upperRight", "lowerRight", "lowerLeft"):
+        value = corners.get(key)
+        if not (isinstance(value, dict) and "lon" in value and "lat" in value):
+            continue
+        lon, lat = float(value["lon"]), float(value["lat"])
+        if bounds is None:
+            bounds = (lon, lat, lon, lat)
+        else:
+            bounds = (min(bounds[0], lon), min(bounds[1], lat), max(bounds[2], lon), max(bounds[3], lat))
+    if bounds is None:
+        LOGGER.warning("corner coordinates missing; defaulting to global bounds")
+        return (-180.0, -85.0511, 180.0, 85.0511)
+    return bounds
+
+
+@functools.lru_cache(maxsize=1)
+def _pmtiles_module():
+    try:
+        from pmtiles import reader, tile, writer
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return tile, writer, reader
+
+
+def _inspect_pmtiles(pmtiles_path: Path, tile, reader, *, verify: bool) -> Dict[str, Any]:
+    """Read the PMTiles header and, when ``verify``, walk every directory once."""
+
+    with pmtiles_path.open("rb") as handle:
+        get_bytes = reader.MmapSource(handle)
+        if get_bytes(0, 7) != b"PMTiles":
+            raise TileCommandError(f"Not a PMTiles archive: {pmtiles_path}")
+        header = reader.Reader(get_bytes).header()
+        if verify:
+            addressed = 0
+            last_tile_id = -1
+            pending = [(header["root_offset"], header["root_length"])]
+            while pending:
+                offset, length = pending.pop(0)
+                for entry in tile.deserialize_directory(get_bytes(offset, length)):
+                    if entry.run_length == 0:
+                        pending.append((header["leaf_directory_offset"] + entry.offset, entry.length))
+                        continue
+                    if entry.tile_id <= last_tile_id:
+                        raise TileCommandError(f"PMTiles entries out of order in {pmtiles_path}")
+                    if entry.offset + entry.length > header["tile_data_length"]:
+                        raise TileCommandError(f"PMTiles entry outside tile data in {pmtiles_path}")
+                    last_tile_id = entry.tile_id + entry.run_length - 1
+                    addressed += entry.run_length
+            expected = header.get("addressed_tiles_count") or addressed
+            if addressed != expected:
+                raise TileCommandError(
+                    f"PMTiles addresses {addressed} tiles but the header records {expected}: {pmtiles_path}"
+                )
+    return _header_json(header)
+
+
+# Spellings used by ``pmtiles show --header-json``.
+_HEADER_TILE_TYPES = {"MVT": "mvt", "PNG": "png", "JPEG": "jpg", "WEBP": "webp", "AVIF": "avif"}
+_HEADER_COMPRESSIONS = {"NONE": "none", "GZIP": "gzip", "BROTLI": "br", "ZSTD": "zstd"}
+
+
+def _header_json(header: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a ``pmtiles`` reader header onto the ``pmtiles show --header-json`` keys and values."""
+
+    def name(value: Any) -> str:
+        return str(getattr(value, "name", value))
+
+    return {
+        "tile_compression": _HEADER_COMPRESSIONS.get(name(header["tile_compression"]), "unknown"),
+        "tile_type": _HEADER_TILE_TYPES.get(name(header["tile_type"]), "unknown"),
+        "minzoom": header["min_zoom"],
+        "maxzoom": header["max_zoom"],
+        "bounds": [
+            header["min_lon_e7"] / 10_000_000,
+            header["min_lat_e7"] / 10_000_000,
+            header["max_lon_e7"] / 10_000_000,
+            header["max_lat_e7"] / 10_000_000,
+        ],
+        "center": [
+            header["center_lon_e7"] / 10_000_000,
+            header["center_lat_e7"] / 10_000_000,
+            header["center_zoom"],
+        ],
+    }
+
+
+def direct_pmtiles_available() -> bool:
+    """Return True when XYZ tiles can be written to PMTiles without mb-util."""
+
+    return _pmtiles_module() is not None
+
+
+_PMTILES_TILE_TYPES = {"png": "PNG", "jpg": "JPEG", "webp": "WEBP"}
+
+
+def _map_in_batches(pool, func, items: Iterable[str], batch_size: int = 4096):
+    """Yield ``(item, func(item))`` in order without queuing every item at once."""
+
+    batch: list = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield from zip(batch, pool.map(func, batch))
+            batch = []
+    if batch:
+        yield from zip(batch, pool.map(func, batch))
+
+
+def _tiles_fingerprint(zxy_dir: Path) -> str:
+    count = newest = total = 0
+    for _z, _x, _y, entry in walk_xyz_dir(zxy_dir):
+        stat = entry.stat(follow_symlinks=False)
+        count += 1
+        total += stat.st_size
+        newest = max(newest, stat.st_mtime_ns)
+    return f"{count}:{total}:{newest}"
+
+
+def _zxy_stamp(source_path: Path, command: Iterable[str], *, canonicalize: bool) -> str:
+    stat = source_path.stat()
+    digest = hashlib.blake2b("\0".join(command).encode("utf-8")).hexdigest()
+    return f"{digest}\n{stat.st_size}:{stat.st_mtime_ns}:{int(canonicalize)}\n"
+
+
+def _tiles_size(zxy_dir: Path) -> int:
+    return sum(entry.stat(follow_symlinks=False).st_size for _z, _x, _y, entry in walk_xyz_dir(zxy_dir))
+
+
+# Headroom over the raw tile bytes for SQLite pages, indexes and the journal.
+_SCRATCH_OVERHEAD = 1.25
+
+
+def _memory_scratch_dir(required_bytes: int) -> Path | None:
+    """Return ``/dev/shm`` when it is writable and can hold ``required_bytes`` plus overhead."""
+
+    shm = Path("/dev/shm")
+    if not shm.is_dir() or not os.access(shm, os.W_OK):
+        return None
+    free = shutil.disk_usage(shm).free
+    if free < required_bytes * _SCRATCH_OVERHEAD:
+        LOGGER.info(
+            "not enough memory-backed scratch space; packing MBTiles on disk",
+            extra={"required_bytes": required_bytes, "free_bytes": free},
+        )
+        return None
+    return shm
+
+
+_GDAL_TILE_FORMATS = {"JPG": "JPEG", "JPEG": "JPEG", "WEBP": "WEBP", "PNG": "PNG"}
 
 
 def _metadata_format(tile_format: str) -> str:
     fmt = tile_format.lower()
-    return "jpg" if fmt in {"jpeg", "jpg"} else fmt
+    return "jpg" if fmt == "jpeg" else fmt
 
 
 def _gdal_tile_format(tile_format: str) -> str:
-    fmt = tile_format.upper()
-    if fmt in {"JPG", "JPEG"}:
-        return "JPEG"
-    if fmt == "WEBP":
-        return "WEBP"
-    if fmt == "PNG":
-        return "PNG"
-    raise ValueError(f"Unsupported tile format for gdal raster tile: {tile_format}")
+    try:
+        return _GDAL_TILE_FORMATS[tile_format.upper()]
+    except KeyError:
+        raise ValueError(f"Unsupported tile format for gdal raster tile: {tile_format}") from None
 
 
 def _replace_resampling(command: Iterable[str], resampling: str) -> None:
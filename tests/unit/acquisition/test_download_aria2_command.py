@@ -0,0 +1,41 @@
+"""Tests for the aria2c command line built by DownloadManager."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from planetarble.acquisition.catalog import AssetCatalog
+from planetarble.acquisition.download import DownloadManager
+from planetarble.config import load_config
+
+
+def test_aria2_command_splits_connections_and_appends_overrides(tmp_path: Path) -> None:
+    manager = DownloadManager(
+        tmp_path, AssetCatalog.load_default(), use_aria2=False, aria2_extra_flags=("--split=4",)
+    )
+
+    command = manager._aria2_command("https://example.com/a.tif", tmp_path / "a.tif")
+
+    assert "--max-connection-per-server=16" in command
+    assert command.index("--split=16") < command.index("--split=4") < command.index("--dir")
+    assert command[-1] == "https://example.com/a.tif"
+
+
+def test_acquire_section_configures_aria2_extra_flags(tmp_path: Path) -> None:
+    config_path = tmp_path / "pipeline.json"
+    config_path.write_text('{"acquire": {"aria2_extra_flags": ["--max-connection-per-server=4"]}}', encoding="utf-8")
+
+    assert load_config(config_path).acquire.aria2_extra_flags == ("--max-connection-per-server=4",)
+
+
+def test_aria2_probe_waits_for_the_first_fetch(tmp_path: Path, monkeypatch) -> None:
+    from planetarble.acquisition import download
+
+    probes = []
+    monkeypatch.setattr(download.shutil, "which", lambda name: probes.append(name) or "/usr/bin/aria2c")
+
+    manager = DownloadManager(tmp_path, AssetCatalog.load_default(), use_aria2=True)
+    assert probes == []
+
+    assert manager._use_aria2 and manager._use_aria2
+    assert probes == ["aria2c"]
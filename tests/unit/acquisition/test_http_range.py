@@ -0,0 +1,65 @@
+"""Tests for ``RangeHTTPFile`` (no network: a fake session serves the bytes)."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+
+import pytest
+
+from planetarble.acquisition.http_range import RangeHTTPFile
+
+
+class _Response:
+    def __init__(self, *, status_code: int = 200, headers=None, content: bytes = b"", url: str = "") -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content
+        self.url = url
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _RangeSession:
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+        self.ranges: list[str] = []
+
+    def head(self, url, *, allow_redirects, timeout):
+        return _Response(headers={"Content-Length": str(len(self.payload))}, url=url)
+
+    def get(self, url, *, headers, timeout):
+        self.ranges.append(headers["Range"])
+        start, end = (int(part) for part in headers["Range"].removeprefix("bytes=").split("-"))
+        content_range = f"bytes {start}-{end}/{len(self.payload)}"
+        return _Response(
+            status_code=206, headers={"Content-Range": content_range}, content=self.payload[start : end + 1]
+        )
+
+
+def test_zip_members_are_read_through_range_requests() -> None:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr("ne_10m_land.shp", b"shape" * 1000)
+        bundle.writestr("ne_10m_land.dbf", b"table")
+    session = _RangeSession(archive.getvalue())
+
+    remote = RangeHTTPFile("https://example.test/ne_10m_land.zip", session=session)  # type: ignore[arg-type]
+    with io.BufferedReader(remote, buffer_size=64) as handle, zipfile.ZipFile(handle) as bundle:
+        assert bundle.read("ne_10m_land.shp") == b"shape" * 1000
+        assert bundle.read("ne_10m_land.dbf") == b"table"
+
+    assert remote.size == len(session.payload)
+    assert session.ranges and all(value.startswith("bytes=") for value in session.ranges)
+
+
+def test_mismatched_content_range_is_rejected() -> None:
+    class _WrongRange(_RangeSession):
+        def get(self, url, *, headers, timeout):
+            return _Response(status_code=206, headers={"Content-Range": "bytes 0-3/10"}, content=b"0123")
+
+    remote = RangeHTTPFile("https://example.test/a.zip", session=_WrongRange(b"0123456789"))  # type: ignore[arg-type]
+    remote.seek(4)
+    with pytest.raises(OSError, match="bytes 0-3/10"):
+        remote.read(4)
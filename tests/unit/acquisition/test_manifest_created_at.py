@@ -0,0 +1,11 @@
+from datetime import datetime, timezone
+
+from planetarble.acquisition.manifest import manifest_to_dict
+from planetarble.core.models import AssetManifest
+
+
+def test_manifest_created_at_is_serialized_as_utc_iso() -> None:
+    manifest = AssetManifest(created_at_ns=1_700_000_000_123_456_000)
+
+    assert manifest.created_at == datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc)
+    assert manifest_to_dict(manifest)["created_at"] == "2023-11-14T22:13:20.123456+00:00"
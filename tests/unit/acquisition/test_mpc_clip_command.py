@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from planetarble.acquisition.mpc import build_clip_command
+
+
+def test_build_clip_command_adds_num_threads_creation_option() -> None:
+    command = build_clip_command(
+        gdal_translate="gdal_translate",
+        signed_url="https://example.com/visual.tif?sig=x",
+        bbox=(139.0, 35.0, 140.0, 36.0),
+        destination=Path("out.tif"),
+        num_threads="ALL_CPUS",
+    )
+
+    assert command[-2:] == ["https://example.com/visual.tif?sig=x", "out.tif"]
+    assert "NUM_THREADS=ALL_CPUS" in command
+    assert command[command.index("NUM_THREADS=ALL_CPUS") - 1] == "-co"
+
+
+def test_build_clip_command_omits_num_threads_by_default() -> None:
+    command = build_clip_command(
+        gdal_translate="gdal_translate",
+        signed_url="https://example.com/visual.tif",
+        bbox=(139.0, 35.0, 140.0, 36.0),
+        destination=Path("out.tif"),
+    )
+
+    assert not any(part.startswith("NUM_THREADS=") for part in command)
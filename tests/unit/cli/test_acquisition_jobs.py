@@ -0,0 +1,62 @@
+import importlib
+
+import pytest
+
+cli_main = importlib.import_module("planetarble.cli.main")
+
+
+def _fail(message: str):  # type: ignore[no-untyped-def]
+    def _job() -> None:
+        raise RuntimeError(message)
+
+    return _job
+
+
+def test_run_acquisition_jobs_skips_tolerated_failures(caplog: pytest.LogCaptureFixture) -> None:
+    results = cli_main._run_acquisition_jobs(
+        [
+            ("bmng", lambda: "bmng-ok", ()),
+            ("modis acquisition", _fail("offline"), (Exception,)),
+        ]
+    )
+
+    assert results == {"bmng": "bmng-ok"}
+    assert "modis acquisition skipped: offline" in caplog.text
+
+
+def test_run_acquisition_jobs_propagates_required_failures() -> None:
+    finished: list[str] = []
+
+    with pytest.raises(RuntimeError, match="gebco down"):
+        cli_main._run_acquisition_jobs(
+            [
+                ("gebco", _fail("gebco down"), ()),
+                ("natural earth", lambda: finished.append("natural earth"), ()),
+            ]
+        )
+
+    assert finished == ["natural earth"]
+
+
+def test_plan_region_natural_earth_jobs_only_when_regions_need_polygons() -> None:
+    from planetarble.core.models import HLSPlanRegion, NaturalEarthRegion
+
+    calls: list[dict] = []
+
+    class Manager:
+        def download_natural_earth(self, **kwargs):  # type: ignore[no-untyped-def]
+            calls.append(kwargs)
+
+    bbox_only = (HLSPlanRegion(name="box", bbox=(0.0, 0.0, 1.0, 1.0)),)
+    assert cli_main._plan_region_natural_earth_jobs(Manager(), bbox_only, force=False) == []
+
+    land = (HLSPlanRegion(name="land", land_only=True),)
+    [(name, job, tolerated)] = cli_main._plan_region_natural_earth_jobs(Manager(), land, force=True)
+    job()
+    assert name == "natural earth acquisition"
+    assert tolerated == (Exception,)
+    assert calls == [{"force": True, "include_admin": False}]
+
+    admin = (HLSPlanRegion(name="tokyo", natural_earth=NaturalEarthRegion(dataset="admin_1", where="x")),)
+    cli_main._plan_region_natural_earth_jobs(Manager(), admin, force=False)[0][1]()
+    assert calls[-1] == {"force": False, "include_admin": True}
@@ -0,0 +1,21 @@
+import importlib
+import os
+from pathlib import Path
+
+cli_main = importlib.import_module("planetarble.cli.main")
+
+
+def test_load_config_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "pipeline.yaml"
+    config_path.write_text("data_dir: data\noutput_dir: output\n", encoding="utf-8")
+
+    first = cli_main._load_config(config_path)
+    assert cli_main._load_config(config_path) is first
+
+    config_path.write_text("data_dir: other\noutput_dir: output\n", encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = cli_main._load_config(config_path)
+    assert reloaded is not first
+    assert reloaded.data_dir.name == "other"
@@ -0,0 +1,13 @@
+from planetarble.cli.gen_completion import render
+
+
+def test_render_lists_subcommands_and_nested_options() -> None:
+    script = render()
+
+    assert script.startswith("# bash completion for planetarble")
+    assert "complete -o default -F _planetarble planetarble" in script
+    assert '"tiling pmtiles") path="tiling pmtiles" ;;' in script
+    top_level = next(line for line in script.splitlines() if line.strip().startswith('"")'))
+    assert "acquire" in top_level and "copernicus-layers" in top_level and "--log-level" in top_level
+    pmtiles = next(line for line in script.splitlines() if line.strip().startswith('"tiling pmtiles") COMPREPLY'))
+    assert "--input" in pmtiles
@@ -42,7 +42,7 @@ def test_acquire_plan_region_invokes_region_planner(
     called: dict[str, object] = {}
 
     class StubManager:
-        def __init__(self, data_directory, manifest_path, use_aria2):  # type: ignore[no-untyped-def]
+        def __init__(self, data_directory, manifest_path, use_aria2, aria2_extra_flags=()):  # type: ignore[no-untyped-def]
             called["init"] = True
 
         def download_natural_earth(self, *, force, include_admin):  # type: ignore[no-untyped-def]
@@ -57,8 +57,8 @@ def test_acquire_plan_region_invokes_region_planner(
         def generate_manifest(self, generation_params=None, version="1.0"):  # type: ignore[no-untyped-def]
             called["manifest"] = generation_params or {}
 
-    monkeypatch.setattr(cli_main, "AcquisitionManager", StubManager)
-    monkeypatch.setattr(cli_main, "load_config", lambda _: cfg)
+    monkeypatch.setattr("planetarble.acquisition.AcquisitionManager", StubManager)
+    monkeypatch.setattr("planetarble.config.load_config", lambda _: cfg)
 
     exit_code = cli_main.main(["acquire", "--config", str(config_path), "--plan-region", "tokyo_land"])
 
@@ -104,8 +104,8 @@ def test_process_plan_region_uses_region_plan_paths(
             called["build_hls_mosaic"] = True
             return None
 
-    monkeypatch.setattr(cli_main, "ProcessingManager", StubProcessor)
-    monkeypatch.setattr(cli_main, "load_config", lambda _: cfg)
+    monkeypatch.setattr("planetarble.processing.ProcessingManager", StubProcessor)
+    monkeypatch.setattr("planetarble.config.load_config", lambda _: cfg)
 
     exit_code = cli_main.main(["process", "--config", str(config_path), "--plan-region", "tokyo_land"])
 
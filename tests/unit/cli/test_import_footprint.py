@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+
+def test_cli_parser_does_not_import_pipeline_packages() -> None:
+    script = (
+        "import sys\n"
+        "from planetarble.cli.main import build_parser\n"
+        "build_parser()\n"
+        "print(','.join(sorted(m for m in sys.modules if m.startswith('planetarble'))))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
+
+    assert result.stdout.strip().split(",") == ["planetarble", "planetarble.cli", "planetarble.cli.main"]
+
+
+def test_cli_parser_defers_handler_only_stdlib_modules() -> None:
+    script = (
+        "import sys\n"
+        "from planetarble.cli.main import build_parser\n"
+        "build_parser()\n"
+        "print(','.join(m for m in ('http.server', 'sqlite3', 'concurrent.futures') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
+
+    assert result.stdout.strip() == ""
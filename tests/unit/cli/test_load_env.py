@@ -0,0 +1,56 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+cli_main = importlib.import_module("planetarble.cli.main")
+
+
+def test_load_env_parses_dotenv_without_overriding(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / ".env").write_text(
+        "# comment\nPLANETARBLE_A=one\n  PLANETARBLE_B = \"two words\" \nPLANETARBLE_C=kept\nnot an assignment\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    for name in ("PLANETARBLE_A", "PLANETARBLE_B"):
+        # setenv first so monkeypatch restores the variable _load_env creates.
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+    monkeypatch.setenv("PLANETARBLE_C", "existing")
+
+    cli_main._load_env()
+
+    assert cli_main.os.environ["PLANETARBLE_A"] == "one"
+    assert cli_main.os.environ["PLANETARBLE_B"] == "two words"
+    assert cli_main.os.environ["PLANETARBLE_C"] == "existing"
+
+
+def test_main_skips_dotenv_for_commands_without_credentials(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (tmp_path / ".env").write_text("PLANETARBLE_SKIPPED=yes\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PLANETARBLE_SKIPPED", "")
+    monkeypatch.delenv("PLANETARBLE_SKIPPED")
+
+    with pytest.raises(SystemExit):
+        cli_main.main(["serve", "--help"])
+
+    assert "PLANETARBLE_SKIPPED" not in cli_main.os.environ
+    assert "--tiles-port" in capsys.readouterr().out
+
+
+def test_main_loads_dotenv_gdal_overrides_for_gdal_commands(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from planetarble.core.gdal_env import gdal_env
+
+    (tmp_path / ".env").write_text("GDAL_CACHEMAX=2048\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GDAL_CACHEMAX", "")
+    monkeypatch.delenv("GDAL_CACHEMAX")
+
+    with pytest.raises(SystemExit):
+        cli_main.main(["tile", "--help"])
+
+    assert gdal_env()["GDAL_CACHEMAX"] == "2048"
@@ -0,0 +1,54 @@
+import importlib
+
+import pytest
+
+cli_main = importlib.import_module("planetarble.cli.main")
+
+
+def test_sniff_subcommand_skips_top_level_flags() -> None:
+    assert cli_main._sniff_subcommand(["--log-level", "DEBUG", "--log-json", "tile", "--dry-run"]) == "tile"
+    assert cli_main._sniff_subcommand(["--help"]) is None
+    assert cli_main._sniff_subcommand(["unknown"]) is None
+
+
+def test_build_parser_registers_only_chosen_subcommand() -> None:
+    parser = cli_main.build_parser("package")
+    args = parser.parse_args(["package", "--dry-run"])
+    assert args.command == "package"
+
+    subcommands = next(a for a in parser._actions if a.dest == "command")
+    assert list(subcommands.choices) == ["package"]
+
+
+def test_get_parser_reuses_parser_per_subcommand() -> None:
+    parser = cli_main._get_parser("tile")
+    assert cli_main._get_parser("tile") is parser
+    assert cli_main._get_parser("package") is not parser
+
+
+def test_unknown_subcommand_error_lists_every_choice(capsys) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        cli_main.main(["tiel"])
+    assert excinfo.value.code == 2
+    err = capsys.readouterr().err
+    assert "invalid choice: 'tiel'" in err
+    assert all(name in err for name in cli_main._SUBCOMMANDS)
+
+
+def test_reset_parser_cache_rebuilds_parsers() -> None:
+    parser = cli_main._get_parser("tile")
+    cli_main._reset_parser_cache()
+    assert cli_main._get_parser("tile") is not parser
+
+
+def test_version_is_resolved_only_when_requested(monkeypatch: pytest.MonkeyPatch, capsys) -> None:
+    calls = []
+    monkeypatch.setattr(cli_main, "_package_version", lambda: calls.append(1) or "9.9")
+
+    cli_main.build_parser("tile").parse_args(["tile", "--dry-run"])
+    assert calls == []
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli_main.build_parser(None).parse_args(["--log-json", "--version"])
+    assert excinfo.value.code == 0
+    assert capsys.readouterr().out == "planetarble 9.9\n"
@@ -47,7 +47,8 @@ def test_pmtiles_cli_invokes_manager(monkeypatch: pytest.MonkeyPatch, tmp_path:
             called["show_header"] = str(pmtiles_path)
             return {"tile_type": "jpg"}
 
-    monkeypatch.setattr(cli_main, "PmtilesTilingManager", StubManager)
+    monkeypatch.setattr("planetarble.tiling.PmtilesTilingManager", StubManager)
+    monkeypatch.setattr("planetarble.tiling.pmtiles.direct_pmtiles_available", lambda: False)
 
     exit_code = cli_main.main(
         [
@@ -83,3 +84,75 @@ def test_pmtiles_cli_invokes_manager(monkeypatch: pytest.MonkeyPatch, tmp_path:
     assert "verify" in called
     assert "show_header" in called
     assert called["convert_pmtiles"]["deduplicate"] is True
+
+
+def test_pmtiles_cli_scratch_dir_drops_the_mbtiles(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    source = tmp_path / "raster.tif"
+    source.touch()
+    called: dict[str, object] = {}
+
+    class StubManager:
+        def __init__(self, config, temp_dir, output_dir, dry_run):  # type: ignore[no-untyped-def]
+            pass
+
+        def build_zxy(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            return tmp_path / "zxy"
+
+        def pack_and_convert(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            called["pack_and_convert"] = kwargs
+            return tmp_path / "tiles.pmtiles"
+
+        def verify(self, pmtiles_path):  # type: ignore[no-untyped-def]
+            pass
+
+        def show_header(self, pmtiles_path):  # type: ignore[no-untyped-def]
+            return {}
+
+    monkeypatch.setattr("planetarble.tiling.PmtilesTilingManager", StubManager)
+    monkeypatch.setattr("planetarble.tiling.pmtiles.direct_pmtiles_available", lambda: False)
+    scratch = tmp_path / "scratch"
+
+    exit_code = cli_main.main(
+        ["tiling", "pmtiles", "--input", str(source), "--out", str(tmp_path / "out"), "--scratch-dir", str(scratch)]
+    )
+
+    assert exit_code == 0
+    assert called["pack_and_convert"]["scratch_dir"] == scratch.resolve()
+
+
+def test_pmtiles_cli_direct_writer_reports_ignored_no_deduplication(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    source = tmp_path / "raster.tif"
+    source.touch()
+    called: dict[str, object] = {}
+
+    class StubManager:
+        def __init__(self, config, temp_dir, output_dir, dry_run):  # type: ignore[no-untyped-def]
+            pass
+
+        def build_zxy(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            return tmp_path / "zxy"
+
+        def direct_zxy_to_pmtiles(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            called["direct_zxy_to_pmtiles"] = kwargs
+            return tmp_path / "tiles.pmtiles"
+
+        def verify(self, pmtiles_path):  # type: ignore[no-untyped-def]
+            pass
+
+        def show_header(self, pmtiles_path):  # type: ignore[no-untyped-def]
+            return {}
+
+    monkeypatch.setattr("planetarble.tiling.PmtilesTilingManager", StubManager)
+    monkeypatch.setattr("planetarble.tiling.pmtiles.direct_pmtiles_available", lambda: True)
+    monkeypatch.setattr(cli_main.shutil, "which", lambda name: None)
+
+    with caplog.at_level("INFO"):
+        exit_code = cli_main.main(
+            ["tiling", "pmtiles", "--input", str(source), "--out", str(tmp_path / "out"), "--no-deduplication"]
+        )
+
+    assert exit_code == 0
+    assert "direct_zxy_to_pmtiles" in called
+    assert any("ignoring --no-deduplication" in record.getMessage() for record in caplog.records)
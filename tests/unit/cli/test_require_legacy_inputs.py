@@ -0,0 +1,41 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+from planetarble.config import PipelineConfig
+from planetarble.core.models import ProcessingConfig
+
+cli_main = importlib.import_module("planetarble.cli.main")
+
+
+def _cfg() -> PipelineConfig:
+    return PipelineConfig(processing=ProcessingConfig(bmng_resolution="500m", gebco_year=2024))
+
+
+def test_require_legacy_inputs_returns_all_three_paths(tmp_path: Path) -> None:
+    (tmp_path / "bmng" / "500m").mkdir(parents=True)
+    (tmp_path / "gebco").mkdir()
+    (tmp_path / "gebco" / "GEBCO_2024_CF.nc").write_bytes(b"")
+    (tmp_path / "natural_earth").mkdir()
+
+    bmng, gebco, natural_earth = cli_main._require_legacy_inputs(tmp_path, _cfg())
+
+    assert bmng == tmp_path / "bmng" / "500m"
+    assert gebco == tmp_path / "gebco" / "GEBCO_2024_CF.nc"
+    assert natural_earth == tmp_path / "natural_earth"
+
+
+def test_require_legacy_inputs_reports_the_first_missing_input(tmp_path: Path) -> None:
+    (tmp_path / "bmng" / "500m").mkdir(parents=True)
+    (tmp_path / "natural_earth").mkdir()
+
+    with pytest.raises(SystemExit, match="GEBCO file not found: .*GEBCO_2024_CF.nc"):
+        cli_main._require_legacy_inputs(tmp_path, _cfg())
+
+    (tmp_path / "gebco").mkdir()
+    with pytest.raises(SystemExit, match="GEBCO file not found"):
+        cli_main._require_legacy_inputs(tmp_path, _cfg())
+
+    with pytest.raises(SystemExit, match="BMNG directory not found"):
+        cli_main._require_legacy_inputs(tmp_path / "missing", _cfg())
@@ -0,0 +1,27 @@
+import importlib
+from pathlib import Path
+
+from planetarble.core.models import CopernicusLayerConfig
+
+cli_main = importlib.import_module("planetarble.cli.main")
+
+
+def test_resolve_copernicus_cog_prefers_configured_layer_order(tmp_path: Path) -> None:
+    available = [
+        tmp_path / "copernicus_alpha_cog.tif",
+        tmp_path / "copernicus_true_color_cog.tif",
+        tmp_path / "copernicus_zeta_cog.tif",
+    ]
+    layers = [
+        CopernicusLayerConfig(name="zeta"),
+        CopernicusLayerConfig(name="missing"),
+        CopernicusLayerConfig(name="TRUE-COLOR"),
+    ]
+
+    ordered = cli_main._resolve_copernicus_cog(layers, available)
+
+    assert [p.name for p in ordered] == [
+        "copernicus_zeta_cog.tif",
+        "copernicus_true_color_cog.tif",
+        "copernicus_alpha_cog.tif",
+    ]
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from planetarble.config import load_config
+
+
+def test_load_config_coerces_section_fields(tmp_path: Path) -> None:
+    config_path = tmp_path / "pipeline.json"
+    config_path.write_text(
+        '{"modis": {"tiles": null, "gamma": "1.5"},'
+        ' "copernicus": {"max_zoom": "9", "rate_limit_min_interval_seconds": 2},'
+        ' "hls": {"collections": ["HLSL30"], "target_zoom": "10", "backoff_factor": null},'
+        ' "gsi_orthophotos": {"zoom": "17", "lat": "35"}}',
+        encoding="utf-8",
+    )
+
+    cfg = load_config(config_path)
+
+    assert cfg.modis.tiles == ()
+    assert cfg.modis.gamma == 1.5
+    assert cfg.copernicus.max_zoom == 9
+    assert cfg.copernicus.rate_limit_min_interval_seconds == 2.0
+    assert cfg.hls.collections == ("HLSL30",)
+    assert cfg.hls.target_zoom == 10
+    assert cfg.hls.backoff_factor is None
+    assert cfg.gsi_orthophotos.zoom == 17
+    assert cfg.gsi_orthophotos.lat == 35.0
@@ -0,0 +1,18 @@
+import dataclasses
+from pathlib import Path
+
+import planetarble.core as core
+from planetarble.config import PipelineConfig, load_config
+
+
+def test_loader_builds_the_canonical_core_models(tmp_path: Path) -> None:
+    config_path = tmp_path / "pipeline.json"
+    config_path.write_text("{}", encoding="utf-8")
+
+    cfg = load_config(config_path)
+
+    assert isinstance(cfg, PipelineConfig)
+    for field in dataclasses.fields(PipelineConfig):
+        value = getattr(cfg, field.name)
+        if dataclasses.is_dataclass(value):
+            assert getattr(core, type(value).__name__) is type(value)
@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+
+from planetarble.core.models import TileMetadata
+from planetarble.packaging import manager as packaging_manager
+
+
+def test_generate_tilejson_writes_indented_json(tmp_path: Path) -> None:
+    metadata = TileMetadata(
+        name="Planetarble",
+        description="Test",
+        version="1.0",
+        bounds=(-180.0, -85.0511, 180.0, 85.0511),
+        center=(0.0, 0.0, 2),
+        minzoom=0,
+        maxzoom=6,
+        attribution="© NASA",
+        format="WEBP",
+    )
+
+    path = packaging_manager.PackagingManager().generate_tilejson(tmp_path / "planet.pmtiles", metadata)
+
+    text = path.read_text(encoding="utf-8")
+    payload = json.loads(text)
+    assert text.startswith('{\n  "tilejson": "3.0.0"')
+    assert payload["bounds"] == [-180.0, -85.0511, 180.0, 85.0511]
+    assert payload["format"] == "webp"
+    assert payload["tiles"] == ["pmtiles://planet.pmtiles"]
+    assert payload["created_at"].endswith("Z")
+
+
+def test_pmtiles_lookup_warns_once_per_path(tmp_path: Path, monkeypatch, caplog) -> None:
+    packaging_manager._find_pmtiles.cache_clear()
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    with caplog.at_level("WARNING", logger=packaging_manager.LOGGER.name):
+        packaging_manager.PackagingManager(dry_run=True)
+        packaging_manager.PackagingManager(dry_run=True)
+
+    assert [r.message for r in caplog.records].count(
+        "pmtiles CLI not found; packaging command will fail unless installed"
+    ) == 1
+    packaging_manager._find_pmtiles.cache_clear()
+
+
+def test_distribution_package_copies_archive_and_sidecars(tmp_path: Path) -> None:
+    pmtiles = tmp_path / "planet.pmtiles"
+    pmtiles.write_bytes(b"PMTiles" * 100)
+    tilejson = tmp_path / "planet.tilejson.json"
+    tilejson.write_text("{}", encoding="utf-8")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text("{}", encoding="utf-8")
+    manager = packaging_manager.PackagingManager()
+
+    for _ in range(2):  # repackaging over an existing distribution must not truncate the source
+        package_dir = manager.create_distribution_package(
+            pmtiles, tilejson_path=tilejson, manifest_path=manifest, license_text="CC0"
+        )
+
+    assert (package_dir / "planet.pmtiles").read_bytes() == pmtiles.read_bytes() == b"PMTiles" * 100
+    assert (package_dir / "planet.pmtiles").stat().st_ino != pmtiles.stat().st_ino
+    assert (package_dir / "planet.tilejson.json").stat().st_ino != tilejson.stat().st_ino
+    assert (package_dir / "manifest.json").read_text(encoding="utf-8") == "{}"
+    assert (package_dir / "LICENSE_AND_CREDITS.txt").read_text(encoding="utf-8") == "CC0"
+
+
+def test_distribution_package_hardlinks_archive_when_requested(tmp_path: Path) -> None:
+    pmtiles = tmp_path / "planet.pmtiles"
+    pmtiles.write_bytes(b"PMTiles")
+    tilejson = tmp_path / "planet.tilejson.json"
+    tilejson.write_text("{}", encoding="utf-8")
+    manager = packaging_manager.PackagingManager()
+
+    package_dir = manager.create_distribution_package(
+        pmtiles,
+        tilejson_path=tilejson,
+        manifest_path=tmp_path / "missing.json",
+        license_text="CC0",
+        hardlink=True,
+    )
+
+    assert (package_dir / "planet.pmtiles").stat().st_ino == pmtiles.stat().st_ino
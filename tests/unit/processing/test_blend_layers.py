@@ -0,0 +1,167 @@
+"""Tests for the block-wise base/overlay blend."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from planetarble.core.models import ProcessingConfig
+from planetarble.processing import manager as processing_manager
+
+
+def _manager(tmp_path: Path) -> processing_manager.ProcessingManager:
+    return processing_manager.ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+
+
+def test_blend_block_rounds_and_keeps_dtype() -> None:
+    base = np.array([[0, 100, 255]], dtype=np.uint8)
+    overlay = np.array([[255, 200, 255]], dtype=np.uint8)
+
+    blended = processing_manager._blend_block(base, overlay, 0.25)
+
+    assert blended.dtype == np.uint8
+    assert blended.tolist() == [[64, 125, 255]]
+
+
+def test_blend_layers_falls_back_to_gdal_calc(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(processing_manager, "_gdal_bindings", lambda: None)
+    manager = _manager(tmp_path)
+    commands: list[list[str]] = []
+    manager._runner.run = lambda command, *, description: commands.append(list(command))  # type: ignore[method-assign]
+
+    output = manager.blend_layers(tmp_path / "base.tif", tmp_path / "overlay.tif", 1.5)
+
+    assert output.name == "base_blended.tif"
+    assert commands[0][0] == "gdal_calc.py"
+    assert "--allBands=A" in commands[0]
+    assert "A*(1-1.0)+B*(1.0)" in commands[0]
+
+
+def test_blend_layers_gdal_calc_masks_nodata_like_the_in_process_path(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(processing_manager, "_gdal_bindings", lambda: None)
+    nodata = {"base.tif": [0.0, 0.0, 0.0], "overlay.tif": [float("nan")]}
+    monkeypatch.setattr(processing_manager, "_band_nodata", lambda path: nodata[path.name])
+    manager = _manager(tmp_path)
+    commands: list[list[str]] = []
+    manager._runner.run = lambda command, *, description: commands.append(list(command))  # type: ignore[method-assign]
+
+    manager.blend_layers(tmp_path / "base.tif", tmp_path / "overlay.tif", 0.5)
+
+    assert "where((A==0.0) | isnan(B), A, A*(1-0.5)+B*(0.5))" in commands[0]
+    assert "--hideNoData" in commands[0]
+    assert "--NoDataValue=0.0" in commands[0]
+
+
+def _write_nodata_rasters(gdal, tmp_path: Path) -> tuple[Path, Path]:
+    base = gdal.GetDriverByName("GTiff").Create(str(tmp_path / "base.tif"), 4, 1, 3, gdal.GDT_Byte)
+    overlay = gdal.GetDriverByName("GTiff").Create(str(tmp_path / "overlay.tif"), 4, 1, 1, gdal.GDT_Byte)
+    for dataset in (base, overlay):
+        dataset.SetGeoTransform((0.0, 1.0, 0.0, 0.0, 0.0, -1.0))
+    for index in range(1, 4):
+        band = base.GetRasterBand(index)
+        band.SetNoDataValue(0)
+        band.WriteArray(np.array([[0, 100, 100, 100]], dtype=np.uint8))
+    overlay.GetRasterBand(1).SetNoDataValue(255)
+    overlay.GetRasterBand(1).WriteArray(np.array([[200, 255, 200, 200]], dtype=np.uint8))
+    base = overlay = None
+    return tmp_path / "base.tif", tmp_path / "overlay.tif"
+
+
+def test_blend_layers_in_process_keeps_nodata(tmp_path: Path) -> None:
+    gdal = pytest.importorskip("osgeo.gdal")
+    base, overlay = _write_nodata_rasters(gdal, tmp_path)
+
+    result = gdal.Open(str(_manager(tmp_path).blend_layers(base, overlay, 0.5)))
+
+    assert result.RasterCount == 3
+    assert result.GetRasterBand(3).GetNoDataValue() == 0
+    assert result.ReadAsArray()[:, 0].tolist() == [[0, 100, 150, 150]] * 3
+
+
+def test_blend_layers_paths_agree_on_nodata_and_bands(tmp_path: Path, monkeypatch) -> None:
+    gdal = pytest.importorskip("osgeo.gdal")
+    if shutil.which("gdal_calc.py") is None or shutil.which("gdalinfo") is None:
+        pytest.skip("gdal_calc.py and gdalinfo are required")
+    base, overlay = _write_nodata_rasters(gdal, tmp_path)
+    in_process = gdal.Open(str(_manager(tmp_path / "numpy").blend_layers(base, overlay, 0.5)))
+    monkeypatch.setattr(processing_manager, "_gdal_bindings", lambda: None)
+    fallback = gdal.Open(str(_manager(tmp_path / "calc").blend_layers(base, overlay, 0.5)))
+
+    assert fallback.RasterCount == in_process.RasterCount == 3
+    assert fallback.GetRasterBand(1).GetNoDataValue() == in_process.GetRasterBand(1).GetNoDataValue()
+    assert fallback.ReadAsArray().tolist() == in_process.ReadAsArray().tolist()
+
+
+def test_blend_layers_in_process(tmp_path: Path) -> None:
+    gdal = pytest.importorskip("osgeo.gdal")
+
+    def write(path: Path, value: int) -> Path:
+        dataset = gdal.GetDriverByName("GTiff").Create(str(path), 4, 3, 3, gdal.GDT_Byte)
+        dataset.SetGeoTransform((0.0, 1.0, 0.0, 0.0, 0.0, -1.0))
+        for band in range(1, 4):
+            dataset.GetRasterBand(band).Fill(value)
+        dataset = None
+        return path
+
+    output = _manager(tmp_path).blend_layers(write(tmp_path / "base.tif", 100), write(tmp_path / "overlay.tif", 200), 0.5)
+
+    result = gdal.Open(str(output)).ReadAsArray()
+    assert result.shape == (3, 3, 4)
+    assert set(np.unique(result)) == {150}
+
+
+def test_blend_block_uses_numexpr_when_available(monkeypatch) -> None:
+    evaluated: list[str] = []
+
+    class FakeNumexpr:
+        @staticmethod
+        def evaluate(expression, local_dict):
+            evaluated.append(expression)
+            return local_dict["a"] * local_dict["inv"] + local_dict["b"] * local_dict["op"]
+
+    monkeypatch.setattr(processing_manager, "_numexpr", lambda: FakeNumexpr)
+    base = np.array([[0, 100]], dtype=np.uint8)
+    overlay = np.array([[255, 200]], dtype=np.uint8)
+
+    assert processing_manager._blend_block(base, overlay, 0.25).tolist() == [[64, 125]]
+    assert evaluated == ["a * inv + b * op"]
+
+
+def test_blend_block_keeps_masked_pixels() -> None:
+    base = np.array([[0, 100]], dtype=np.uint8)
+    overlay = np.array([[255, 200]], dtype=np.uint8)
+
+    blended = processing_manager._blend_block(base, overlay, 0.5, keep=np.array([[True, False]]))
+
+    assert blended.tolist() == [[0, 150]]
+
+
+def test_blend_layers_in_process_uses_configured_compression(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(processing_manager, "_gdal_bindings", lambda: object())
+    monkeypatch.setattr(processing_manager, "_gdal_version", lambda: (3, 8))
+    options: list[list[str]] = []
+
+    def fake_blend(base, overlay, opacity, output, *, compression):
+        options.append(compression("Float32"))
+        return output
+
+    monkeypatch.setattr(processing_manager, "_blend_numpy", fake_blend)
+    manager = processing_manager.ProcessingManager(
+        ProcessingConfig(cog_compression="LZW", cog_predictor=1),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+
+    manager.blend_layers(tmp_path / "base.tif", tmp_path / "overlay.tif", 0.5)
+
+    assert "COMPRESS=LZW" in options[0]
+    assert "PREDICTOR=1" in options[0]
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from planetarble.processing import manager as processing_manager
 from planetarble.processing.manager import _cog_command
 
 
@@ -28,3 +29,70 @@ def test_cog_command_is_lossless(tmp_path: Path) -> None:
 def test_cog_command_custom_compress(tmp_path: Path) -> None:
     cmd = _cog_command(tmp_path / "in.tif", tmp_path / "out.tif", compress="LZW")
     assert any(str(part) == "COMPRESS=LZW" for part in cmd)
+
+
+def test_compression_opts_prefer_zstd_with_predictor(monkeypatch) -> None:
+    monkeypatch.setattr(processing_manager, "_gdal_version", lambda: (3, 8))
+
+    opts = processing_manager._compression_opts("Byte")
+    assert opts[::2] == ["-co"] * (len(opts) // 2)
+    values = opts[1::2]
+    assert {"COMPRESS=ZSTD", "ZSTD_LEVEL=9", "PREDICTOR=2", "NUM_THREADS=ALL_CPUS", "BLOCKXSIZE=512"} <= set(values)
+    assert {"BIGTIFF=IF_SAFER", "SPARSE_OK=TRUE"} <= set(values)
+
+    cog = processing_manager._compression_opts("Float32", driver="COG")[1::2]
+    assert {"COMPRESS=ZSTD", "LEVEL=9", "PREDICTOR=3", "BLOCKSIZE=512"} <= set(cog)
+    assert "TILED=YES" not in cog
+
+
+def test_compression_opts_fall_back_to_deflate_on_old_gdal(monkeypatch) -> None:
+    monkeypatch.setattr(processing_manager, "_gdal_version", lambda: (2, 4))
+    assert "COMPRESS=DEFLATE" in processing_manager._compression_opts("Byte")
+
+    monkeypatch.setattr(processing_manager, "_gdal_version", lambda: None)
+    assert "COMPRESS=DEFLATE" in processing_manager._compression_opts("Byte")
+
+
+def test_cog_command_accepts_creation_options(tmp_path: Path) -> None:
+    cmd = _cog_command(tmp_path / "in.tif", tmp_path / "out.tif", creation_options=["-co", "COMPRESS=ZSTD"])
+    assert "COMPRESS=ZSTD" in cmd
+    assert "COMPRESS=DEFLATE" not in cmd
+
+
+def test_create_cog_builds_lossless_overviews_in_the_same_pass(tmp_path: Path) -> None:
+    from planetarble.core.models import ProcessingConfig
+
+    manager = processing_manager.ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+        dry_run=True,
+    )
+    commands: list[list[str]] = []
+    manager._runner.run = lambda command, *, description: commands.append(list(command))  # type: ignore[method-assign]
+
+    manager.create_cog(tmp_path / "mosaic.tif")
+
+    (command,) = commands
+    assert {"OVERVIEWS=AUTO", "OVERVIEW_RESAMPLING=AVERAGE", "SPARSE_OK=TRUE"} <= set(command)
+    assert not any("JPEG" in part for part in command)
+
+
+def test_configured_codec_and_predictor_override_the_defaults(tmp_path: Path, monkeypatch) -> None:
+    from planetarble.core.models import ProcessingConfig
+
+    monkeypatch.setattr(processing_manager, "_gdal_version", lambda: (3, 8))
+    manager = processing_manager.ProcessingManager(
+        ProcessingConfig(cog_compression="deflate", cog_compression_level=4, cog_predictor=1),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+
+    values = manager._raster_compression("Byte", driver="COG")[1::2]
+    assert {"COMPRESS=DEFLATE", "LEVEL=4", "PREDICTOR=1"} <= set(values)
+
+    lzw = processing_manager._compression_opts("Float32", codec="LZW")[1::2]
+    assert "COMPRESS=LZW" in lzw and "PREDICTOR=3" in lzw
+    assert not any(value.startswith(("ZLEVEL", "ZSTD_LEVEL", "LEVEL")) for value in lzw)
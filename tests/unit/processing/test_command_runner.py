@@ -0,0 +1,60 @@
+"""Tests for the processing ``CommandRunner``."""
+
+from __future__ import annotations
+
+import subprocess
+
+import pytest
+
+from planetarble.processing import manager as processing_manager
+
+
+def test_commands_get_gdal_defaults_without_overriding_the_caller(monkeypatch) -> None:
+    monkeypatch.setenv("GDAL_CACHEMAX", "1024")
+    monkeypatch.delenv("VSI_CACHE", raising=False)
+    calls: list[dict] = []
+    monkeypatch.setattr(subprocess, "run", lambda command, **kwargs: calls.append(kwargs))
+
+    runner = processing_manager.CommandRunner()
+    runner.run(["gdalinfo", "in.tif"], description="inspect")
+    runner.run(["gdalinfo", "in.tif"], description="inspect", env={"VSI_CACHE": "FALSE"})
+
+    first, second = (call["env"] for call in calls)
+    assert first["GDAL_CACHEMAX"] == "1024"
+    assert first["VSI_CACHE"] == "TRUE"
+    assert first["GDAL_DISABLE_READDIR_ON_OPEN"] == "EMPTY_DIR"
+    assert second["VSI_CACHE"] == "FALSE"
+    assert all(call["check"] for call in calls)
+
+
+def test_dry_run_spawns_nothing(monkeypatch) -> None:
+    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError))
+
+    processing_manager.CommandRunner(dry_run=True).run(["gdalinfo"], description="inspect")
+
+
+def test_run_many_pins_each_command_to_one_gdal_thread(monkeypatch) -> None:
+    calls: list[tuple[list[str], dict]] = []
+    monkeypatch.setattr(subprocess, "run", lambda command, **kwargs: calls.append((list(command), kwargs["env"])))
+
+    processing_manager.CommandRunner().run_many(
+        [(["gdalbuildvrt", f"{band}.vrt"], f"mosaic {band}") for band in ("red", "green", "blue")]
+    )
+
+    assert sorted(command[1] for command, _ in calls) == ["blue.vrt", "green.vrt", "red.vrt"]
+    assert {env["GDAL_NUM_THREADS"] for _, env in calls} == {"1"}
+
+
+def test_run_many_raises_after_all_jobs_finish(monkeypatch) -> None:
+    finished: list[str] = []
+
+    def fake_run(command, **kwargs):
+        if command[1] == "bad":
+            raise subprocess.CalledProcessError(1, command)
+        finished.append(command[1])
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    with pytest.raises(processing_manager.CommandExecutionError):
+        processing_manager.CommandRunner().run_many([(["cmd", "bad"], "bad"), (["cmd", "good"], "good")])
+    assert finished == ["good"]
@@ -0,0 +1,131 @@
+"""Tests for the Copernicus tile-to-COG mosaic builder (no GDAL required)."""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from planetarble.core.models import CopernicusConfig, CopernicusLayerConfig, ProcessingConfig
+from planetarble.processing import manager as processing_manager
+
+
+def _write_tiles(layer_dir: Path, zoom: int, coords: list[tuple[int, int]]) -> None:
+    for x, y in coords:
+        tile = layer_dir / str(zoom) / str(x) / f"{y}.jpg"
+        tile.parent.mkdir(parents=True, exist_ok=True)
+        tile.write_bytes(b"jpg")
+
+
+def test_mosaic_vrt_places_tiles_on_the_xyz_grid(tmp_path: Path) -> None:
+    records = [(tmp_path / f"{x}_{y}.jpg", 2, x, y) for x, y in ((1, 1), (2, 1), (2, 2))]
+
+    root = ET.fromstring(processing_manager._copernicus_mosaic_vrt(records, 256))
+
+    assert (root.get("rasterXSize"), root.get("rasterYSize")) == ("512", "512")
+    geotransform = [float(v) for v in root.findtext("GeoTransform").split(",")]
+    minx, _, _, maxy = processing_manager._tile_bounds(1, 1, 2)
+    assert geotransform == [minx, 2 * processing_manager.ORIGIN_SHIFT / 4 / 256, 0.0, maxy, 0.0, -geotransform[1]]
+    bands = root.findall("VRTRasterBand")
+    assert [band.findtext("ColorInterp") for band in bands] == ["Red", "Green", "Blue"]
+    offsets = [
+        (rect.get("xOff"), rect.get("yOff")) for rect in bands[0].iter("DstRect")
+    ]
+    assert offsets == [("0", "0"), ("256", "0"), ("256", "256")]
+
+
+def test_png_band_count_comes_from_ihdr(tmp_path: Path) -> None:
+    rgba = tmp_path / "rgba.png"
+    rgba.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00\x00\x00\rIHDR" + b"\x00\x00\x01\x00" * 2 + b"\x08\x06")
+
+    assert processing_manager._tile_band_count(rgba) == 4
+    assert processing_manager._tile_band_count(tmp_path / "tile.jpg") == 3
+
+
+def test_build_copernicus_cog_translates_the_written_mosaic(tmp_path: Path) -> None:
+    layer_dir = tmp_path / "tiles" / "true_color"
+    _write_tiles(layer_dir, 14, [(10, 20), (11, 20)])
+    manager = processing_manager.ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+    commands: list[list[str]] = []
+    manager._runner.run = lambda command, *, description: commands.append(list(command))  # type: ignore[method-assign]
+
+    cog = manager._build_copernicus_cog(
+        layer_dir=layer_dir,
+        layer_config=CopernicusLayerConfig(name="TRUE_COLOR"),
+        config=CopernicusConfig(min_zoom=14, max_zoom=14),
+        force=False,
+    )
+
+    mosaic = tmp_path / "tmp" / "copernicus_true_color_mosaic.vrt"
+    assert ET.parse(mosaic).getroot().get("rasterXSize") == "512"
+    assert [command[0] for command in commands] == ["gdal_translate"]
+    assert str(mosaic) in commands[0] and str(cog) in commands[0]
+
+
+def test_prepare_copernicus_layers_keeps_config_order_and_skips_failures(tmp_path: Path) -> None:
+    tiles_root = tmp_path / "data" / "copernicus" / "tiles"
+    for slug in ("true_color", "false_color", "ndvi"):
+        (tiles_root / slug).mkdir(parents=True)
+    layers = tuple(CopernicusLayerConfig(name=name) for name in ("TRUE_COLOR", "FALSE_COLOR", "NDVI", "MISSING"))
+    manager = processing_manager.ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+        copernicus=CopernicusConfig(enabled=True, layers=layers),
+    )
+
+    def fake_build(*, layer_dir: Path, layer_config, config, force):
+        if layer_config.name == "FALSE_COLOR":
+            raise FileNotFoundError("no tiles")
+        return tmp_path / f"{layer_dir.name}_cog.tif"
+
+    manager._build_copernicus_cog = fake_build  # type: ignore[method-assign]
+
+    assert manager.prepare_copernicus_layers() == [
+        tmp_path / "true_color_cog.tif",
+        tmp_path / "ndvi_cog.tif",
+    ]
+
+
+def test_collect_tiles_sorts_numerically_and_skips_foreign_entries(tmp_path: Path) -> None:
+    layer_dir = tmp_path / "true_color"
+    _write_tiles(layer_dir, 3, [(10, 2), (9, 11), (9, 3)])
+    (layer_dir / "3" / "9" / "notes.txt").write_text("x")
+    (layer_dir / "3" / "9" / "4.png").mkdir()
+    (layer_dir / "3" / "tmp").mkdir()
+    (layer_dir / "3" / "8.jpg").write_bytes(b"")
+
+    records = processing_manager._collect_copernicus_tiles(layer_dir, CopernicusConfig(min_zoom=0, max_zoom=3))
+
+    assert [(zoom, x, y) for _, zoom, x, y in records] == [(3, 9, 3), (3, 9, 11), (3, 10, 2)]
+    assert records[0][0] == layer_dir / "3" / "9" / "3.jpg"
+
+
+def test_jpeg_layers_get_jpeg_overviews_and_paths_last(tmp_path: Path) -> None:
+    layer_dir = tmp_path / "tiles" / "true_color"
+    _write_tiles(layer_dir, 14, [(10, 20)])
+    manager = processing_manager.ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+        dry_run=True,
+    )
+    commands: list[list[str]] = []
+    manager._runner.run = lambda command, *, description: commands.append(list(command))  # type: ignore[method-assign]
+
+    cog = manager._build_copernicus_cog(
+        layer_dir=layer_dir,
+        layer_config=CopernicusLayerConfig(name="TRUE_COLOR", format="image/jpeg"),
+        config=CopernicusConfig(min_zoom=14, max_zoom=14),
+        force=False,
+    )
+
+    (command,) = commands
+    assert command[-2:] == [str(tmp_path / "tmp" / "copernicus_true_color_mosaic.vrt"), str(cog)]
+    assert {"QUALITY=90", "OVERVIEW_COMPRESS=JPEG", "OVERVIEW_QUALITY=85"} <= set(command)
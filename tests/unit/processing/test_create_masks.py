@@ -0,0 +1,107 @@
+"""Tests for Natural Earth archive extraction in ``create_masks``."""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from planetarble.core.models import ProcessingConfig
+from planetarble.processing.manager import ProcessingManager
+
+
+def test_create_masks_extracts_every_archive(tmp_path: Path) -> None:
+    source_dir = tmp_path / "natural_earth"
+    source_dir.mkdir()
+    names = [f"ne_10m_layer_{index}" for index in range(5)]
+    for name in names:
+        with zipfile.ZipFile(source_dir / f"{name}.zip", "w") as bundle:
+            bundle.writestr(f"{name}.shp", name)
+    manager = ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+
+    destination = manager.create_masks(source_dir)
+
+    for name in names:
+        assert (destination / name / f"{name}.shp").read_text() == name
+
+
+def test_extract_zip_streams_members_and_keeps_permissions(tmp_path: Path) -> None:
+    archive = tmp_path / "bundle.zip"
+    payload = bytes(range(256)) * 8192
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr("nested/", "")
+        info = zipfile.ZipInfo("nested/layer.shp")
+        info.external_attr = 0o640 << 16
+        bundle.writestr(info, payload)
+    manager = ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+
+    manager._extract_zip(archive, tmp_path / "out")
+
+    extracted = tmp_path / "out" / "nested" / "layer.shp"
+    assert extracted.read_bytes() == payload
+    assert extracted.stat().st_mode & 0o777 == 0o640
+
+
+def test_extract_zip_refuses_members_outside_the_destination(tmp_path: Path) -> None:
+    archive = tmp_path / "evil.zip"
+    with zipfile.ZipFile(archive, "w") as bundle:
+        bundle.writestr("../escape.txt", "x")
+    manager = ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+
+    with pytest.raises(ValueError):
+        manager._extract_zip(archive, tmp_path / "out")
+    assert not (tmp_path / "escape.txt").exists()
+
+
+def test_extract_zip_writes_members_extracted_in_parallel(tmp_path: Path) -> None:
+    archive = tmp_path / "layers.zip"
+    payloads = {f"layer_{index}.dbf": bytes([index]) * (10_000 + index) for index in range(12)}
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        for name, payload in payloads.items():
+            bundle.writestr(name, payload)
+    manager = ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+
+    manager._extract_zip(archive, tmp_path / "out")
+
+    for name, payload in payloads.items():
+        assert (tmp_path / "out" / name).read_bytes() == payload
+
+
+def test_extract_zip_copies_stored_and_deflated_members(tmp_path: Path) -> None:
+    archive = tmp_path / "mixed.zip"
+    stored = bytes(range(256)) * 4096
+    with zipfile.ZipFile(archive, "w") as bundle:
+        bundle.writestr(zipfile.ZipInfo("stored.tif"), stored, compress_type=zipfile.ZIP_STORED)
+        bundle.writestr("deflated.dbf", b"abc" * 1000, compress_type=zipfile.ZIP_DEFLATED)
+    manager = ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+
+    manager._extract_zip(archive, tmp_path / "out")
+
+    assert (tmp_path / "out" / "stored.tif").read_bytes() == stored
+    assert (tmp_path / "out" / "deflated.dbf").read_bytes() == b"abc" * 1000
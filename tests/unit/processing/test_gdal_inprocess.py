@@ -0,0 +1,95 @@
+"""In-process GDAL calls with the subprocess fallback (no GDAL required)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from planetarble.processing import manager as processing_manager
+
+
+class _Recorder:
+    def __init__(self, *, dry_run: bool = False) -> None:
+        self.dry_run = dry_run
+        self.commands: list[list[str]] = []
+        self.file_lists: list[list[str]] = []
+
+    def run(self, command, *, description: str) -> None:
+        self.commands.append(list(command))
+        if "-input_file_list" in command:
+            listed = Path(command[command.index("-input_file_list") + 1])
+            self.file_lists.append(listed.read_text(encoding="utf-8").splitlines())
+
+
+class _FakeGdal:
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    def BuildVRT(self, destination, sources, *, separate=False):
+        self.calls.append(("BuildVRT", destination, list(sources), separate))
+        return object()
+
+    def Translate(self, destination, source, *, options):
+        self.calls.append(("Translate", destination, source, list(options)))
+        return object()
+
+
+@pytest.fixture
+def fake_gdal(monkeypatch) -> _FakeGdal:
+    gdal = _FakeGdal()
+    monkeypatch.setattr(processing_manager, "_gdal_bindings", lambda: gdal)
+    return gdal
+
+
+def test_buildvrt_uses_bindings_without_a_filelist(tmp_path: Path, fake_gdal: _FakeGdal) -> None:
+    runner = _Recorder()
+    list_path = tmp_path / "tiles.txt"
+
+    processing_manager._run_gdalbuildvrt(
+        runner, tmp_path / "out.vrt", [tmp_path / "a.tif"], list_path=list_path, separate=True, description="vrt"
+    )
+
+    assert fake_gdal.calls == [("BuildVRT", str(tmp_path / "out.vrt"), [str(tmp_path / "a.tif")], True)]
+    assert runner.commands == []
+    assert not list_path.exists()
+
+
+def test_buildvrt_falls_back_to_the_cli(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(processing_manager, "_gdal_bindings", lambda: None)
+    runner = _Recorder()
+    list_path = tmp_path / "tiles.txt"
+
+    processing_manager._run_gdalbuildvrt(
+        runner, tmp_path / "out.vrt", [tmp_path / "a.tif", tmp_path / "b.tif"], list_path=list_path, description="vrt"
+    )
+    processing_manager._run_gdalbuildvrt(
+        runner, tmp_path / "rgb.vrt", [tmp_path / "r.vrt"], separate=True, description="rgb"
+    )
+
+    assert runner.commands == [
+        ["gdalbuildvrt", "-input_file_list", str(list_path), str(tmp_path / "out.vrt")],
+        ["gdalbuildvrt", "-separate", str(tmp_path / "rgb.vrt"), str(tmp_path / "r.vrt")],
+    ]
+    assert runner.file_lists == [[str(tmp_path / "a.tif"), str(tmp_path / "b.tif")]]
+    assert not list_path.exists()
+
+
+def test_translate_passes_explicit_source_and_destination(fake_gdal: _FakeGdal) -> None:
+    runner = _Recorder()
+
+    processing_manager._run_gdal_translate(
+        runner, Path("in.tif"), Path("out.tif"), ["-of", "COG", "-co", "QUALITY=90"], description="cog"
+    )
+
+    assert fake_gdal.calls == [("Translate", "out.tif", "in.tif", ["-of", "COG", "-co", "QUALITY=90"])]
+    assert runner.commands == []
+
+
+def test_dry_run_never_touches_the_bindings(fake_gdal: _FakeGdal) -> None:
+    runner = _Recorder(dry_run=True)
+
+    processing_manager._run_gdal_translate(runner, Path("in.tif"), Path("out.tif"), [], description="cog")
+
+    assert fake_gdal.calls == []
+    assert runner.commands == [["gdal_translate", "in.tif", "out.tif"]]
@@ -0,0 +1,99 @@
+"""Tests for the in-process hillshade (mirrors ``gdaldem hillshade``)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from planetarble.core.models import ProcessingConfig
+from planetarble.processing import manager as processing_manager
+
+
+def _shade(window: np.ndarray) -> np.ndarray:
+    return processing_manager._hillshade_block(window, 1.0, -1.0, azimuth=315, altitude=45)
+
+
+def test_flat_terrain_matches_gdaldem() -> None:
+    shade = _shade(np.full((5, 6), 42.0, dtype=np.float32))
+
+    assert shade.shape == (3, 4)
+    assert set(np.unique(shade)) == {181}
+
+
+def test_slopes_facing_the_light_are_brighter() -> None:
+    rows, cols = np.mgrid[0:5, 0:5].astype(np.float32)
+    rising_to_south_east = rows + cols  # faces north-west, towards the 315 degree sun
+
+    lit = _shade(rising_to_south_east)
+    shaded = _shade(-rising_to_south_east)
+
+    assert (lit > 181).all()
+    assert (shaded < 181).all()
+    assert shaded.min() >= 1
+
+
+def test_hillshade_numpy_writes_full_grid(tmp_path: Path) -> None:
+    gdal = pytest.importorskip("osgeo.gdal")
+    source = tmp_path / "gebco.tif"
+    dataset = gdal.GetDriverByName("GTiff").Create(str(source), 7, 5, 1, gdal.GDT_Float32)
+    dataset.SetGeoTransform((0.0, 1.0, 0.0, 0.0, 0.0, -1.0))
+    dataset.GetRasterBand(1).Fill(10.0)
+    dataset = None
+
+    output = processing_manager._hillshade_numpy(
+        source, tmp_path / "hillshade.tif", azimuth=315,
+        altitude=45,
+        block_rows=2,
+        compression=processing_manager._compression_opts,
+    )
+
+    result = gdal.Open(str(output)).ReadAsArray()
+    assert result.shape == (5, 7)
+    assert set(np.unique(result)) == {181}
+
+
+def test_hillshade_numpy_extrapolates_edges_of_a_plane(tmp_path: Path) -> None:
+    gdal = pytest.importorskip("osgeo.gdal")
+    source = tmp_path / "ramp.tif"
+    dataset = gdal.GetDriverByName("GTiff").Create(str(source), 6, 4, 1, gdal.GDT_Float32)
+    dataset.SetGeoTransform((0.0, 1.0, 0.0, 0.0, 0.0, -1.0))
+    rows, cols = np.mgrid[0:4, 0:6].astype(np.float32)
+    dataset.GetRasterBand(1).WriteArray(rows + 2 * cols)
+    dataset = None
+
+    output = processing_manager._hillshade_numpy(
+        source, tmp_path / "hillshade.tif", azimuth=315,
+        altitude=45,
+        block_rows=2,
+        compression=processing_manager._compression_opts,
+    )
+
+    result = gdal.Open(str(output)).ReadAsArray()
+    assert len(np.unique(result)) == 1
+
+
+def test_generate_hillshade_uses_configured_compression(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(processing_manager, "_gdal_bindings", lambda: object())
+    monkeypatch.setattr(processing_manager, "_gdal_version", lambda: (3, 8))
+    options: list[list[str]] = []
+
+    def fake_hillshade(source, output, *, azimuth, altitude, compression):
+        options.append(compression("Byte"))
+        return output
+
+    monkeypatch.setattr(processing_manager, "_hillshade_numpy", fake_hillshade)
+    manager = processing_manager.ProcessingManager(
+        ProcessingConfig(cog_compression="DEFLATE", cog_compression_level=3),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+    gebco = tmp_path / "gebco.tif"
+    gebco.write_bytes(b"dem")
+
+    manager.generate_hillshade(gebco)
+
+    assert "COMPRESS=DEFLATE" in options[0]
+    assert "ZLEVEL=3" in options[0]
@@ -0,0 +1,103 @@
+"""Tests for the MODIS/VIIRS RGB product builder (no GDAL required)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from planetarble.core.models import ModisConfig, ProcessingConfig
+from planetarble.processing import manager as processing_manager
+
+
+def test_modis_rgb_is_scaled_straight_into_a_cog(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(processing_manager, "_gdal_bindings", lambda: None)
+    modis_root = tmp_path / "modis"
+    data_dir = modis_root / "h10v05" / "2024"
+    data_dir.mkdir(parents=True)
+    for band in (1, 3, 4):
+        (data_dir / f"MCD43A4_Nadir_Reflectance_Band{band}_doy2024100.tif").write_bytes(b"")
+    manager = processing_manager.ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+        modis=ModisConfig(gamma=0.8),
+    )
+    commands: list[list[str]] = []
+    manager._runner.run = lambda command, *, description, **_: commands.append(list(command))  # type: ignore[method-assign]
+
+    cog = manager.prepare_modis_rgb(modis_root, tiles=["h10v05"], date_code="2024100")
+
+    assert cog == tmp_path / "output" / "processing" / "modis_2024100_rgb_cog.tif"
+    translates = [command for command in commands if command[0] == "gdal_translate"]
+    assert len(translates) == 1
+    translate = translates[0]
+    assert translate[translate.index("-of") + 1] == "COG"
+    assert translate[translate.index("-exponent") + 1] == "0.8"
+    assert translate[-2:] == [str(tmp_path / "tmp" / "modis_rgb.vrt"), str(cog)]
+    assert not any("JPEG" in part for part in translate)
+    assert not list((tmp_path / "tmp").glob("*.txt"))
+
+
+def test_aliased_tiles_contribute_each_band_file_once(tmp_path: Path) -> None:
+    modis_root = tmp_path / "modis"
+    data_dir = modis_root / "h10v05" / "2024"
+    data_dir.mkdir(parents=True)
+    for band in (1, 3, 4):
+        (data_dir / f"MCD43A4_Nadir_Reflectance_Band{band}_doy2024100.tif").write_bytes(b"")
+    (modis_root / "alias").symlink_to(modis_root / "h10v05")
+    manager = processing_manager.ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+        dry_run=True,
+    )
+
+    manager.prepare_modis_rgb(modis_root, tiles=["h10v05", "alias"], date_code="2024100")
+
+    listed = (tmp_path / "tmp" / "modis_red_tiles.txt").read_text(encoding="utf-8").splitlines()
+    assert listed == [str(data_dir / "MCD43A4_Nadir_Reflectance_Band1_doy2024100.tif")]
+
+
+def test_disk_order_sorts_by_inode(tmp_path) -> None:
+    paths = [tmp_path / name for name in ("b.tif", "a.tif", "c.tif")]
+    for path in paths:
+        path.write_bytes(b"x")
+
+    ordered = processing_manager._disk_order(paths)
+
+    assert sorted(ordered) == sorted(paths)
+    if os.name == "posix":
+        inodes = [path.stat().st_ino for path in ordered]
+        assert inodes == sorted(inodes)
+
+
+def test_unchanged_band_lists_skip_gdalbuildvrt(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(processing_manager, "_gdal_bindings", lambda: None)
+    modis_root = tmp_path / "modis"
+    data_dir = modis_root / "h10v05" / "2024"
+    data_dir.mkdir(parents=True)
+    for band in (1, 3, 4):
+        (data_dir / f"MCD43A4_Nadir_Reflectance_Band{band}_doy2024100.tif").write_bytes(b"")
+    manager = processing_manager.ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+    commands: list[list[str]] = []
+
+    def fake_run(command, *, description, **_):
+        commands.append(list(command))
+        Path(command[-1]).touch()
+
+    manager._runner.run = fake_run  # type: ignore[method-assign]
+
+    manager.prepare_modis_rgb(modis_root, tiles=["h10v05"], date_code="2024100")
+    first = len(commands)
+    manager.prepare_modis_rgb(modis_root, tiles=["h10v05"], date_code="2024100")
+
+    rerun = commands[first:]
+    assert not any("-input_file_list" in command for command in rerun)
+    assert [command[0] for command in rerun] == ["gdalbuildvrt", "gdal_translate"]
@@ -0,0 +1,136 @@
+"""Tests for the source-hash sidecars that gate reuse of processing outputs."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from planetarble.core.models import ProcessingConfig
+from planetarble.processing import manager as processing_manager
+
+
+def _manager(tmp_path: Path) -> processing_manager.ProcessingManager:
+    return processing_manager.ProcessingManager(
+        ProcessingConfig(),
+        temp_dir=tmp_path / "tmp",
+        output_dir=tmp_path / "output",
+        data_dir=tmp_path / "data",
+    )
+
+
+def test_recorded_hash_allows_reuse_until_source_changes(tmp_path: Path) -> None:
+    manager = _manager(tmp_path)
+    source = tmp_path / "panel.tif"
+    source.write_bytes(b"panel-v1")
+    output = tmp_path / "output.tif"
+    output.write_bytes(b"out")
+    meta_path = manager._metadata_path_for_output(output)
+    sources = {"bmng_panel": source}
+
+    manager._record_source_hashes(meta_path, sources)
+
+    entry = json.loads(meta_path.read_text(encoding="utf-8"))["sources"]["bmng_panel"]
+    assert entry[processing_manager._SOURCE_HASH] == manager._hash_file(source)
+    assert manager._can_reuse_output(output, meta_path, sources)
+
+    source.write_bytes(b"panel-v2")
+    assert not manager._can_reuse_output(output, meta_path, sources)
+
+
+def test_entries_from_another_hash_algorithm_miss(tmp_path: Path) -> None:
+    manager = _manager(tmp_path)
+    source = tmp_path / "panel.tif"
+    source.write_bytes(b"panel")
+    output = tmp_path / "output.tif"
+    output.write_bytes(b"out")
+    meta_path = manager._metadata_path_for_output(output)
+    meta_path.write_text(
+        json.dumps({"sources": {"bmng_panel": {"path": str(source), "other_hash": "x"}}}), encoding="utf-8"
+    )
+
+    assert not manager._can_reuse_output(output, meta_path, {"bmng_panel": source})
+
+
+def test_unchanged_stat_skips_rehashing(tmp_path: Path, monkeypatch) -> None:
+    manager = _manager(tmp_path)
+    source = tmp_path / "panel.tif"
+    source.write_bytes(b"panel")
+    output = tmp_path / "output.tif"
+    output.write_bytes(b"out")
+    meta_path = manager._metadata_path_for_output(output)
+    manager._record_source_hashes(meta_path, {"bmng_panel": source})
+
+    processing_manager._cached_file_hash.cache_clear()
+
+    def fail(path: Path) -> str:
+        raise AssertionError(f"rehashed {path}")
+
+    monkeypatch.setattr(processing_manager.ProcessingManager, "_hash_file", staticmethod(fail))
+    assert manager._can_reuse_output(output, meta_path, {"bmng_panel": source})
+
+
+def test_hash_file_matches_a_plain_digest(tmp_path: Path) -> None:
+    source = tmp_path / "panel.tif"
+    source.write_bytes(b"x" * (1024 * 1024 + 17))
+
+    expected = processing_manager._new_source_hasher()
+    expected.update(source.read_bytes())
+
+    assert processing_manager.ProcessingManager._hash_file(source) == expected.hexdigest()
+
+
+def test_format_sources_dedupes_aliases_of_the_same_file(tmp_path: Path) -> None:
+    manager = _manager(tmp_path)
+    first = tmp_path / "b.tif"
+    second = tmp_path / "a.tif"
+    first.write_bytes(b"b")
+    second.write_bytes(b"a")
+    alias = tmp_path / "alias.tif"
+    alias.symlink_to(first)
+
+    sources = manager._format_sources([first, alias, second], default_key="bmng_panel", fallback=first)
+
+    assert sources == {"bmng_panel_01": second.resolve(), "bmng_panel_02": first.resolve()}
+    assert manager._format_sources(None, default_key="bmng_panel", fallback=alias) == {
+        "bmng_panel": first.resolve()
+    }
+
+
+def test_compose_bmng_panels_reuses_an_unchanged_mosaic(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(processing_manager, "_gdal_bindings", lambda: None)
+    manager = _manager(tmp_path)
+    panel_dir = tmp_path / "bmng"
+    panel_dir.mkdir()
+    for name in ("A1.tif", "B1.tif"):
+        (panel_dir / name).write_bytes(name.encode())
+    commands: list[list[str]] = []
+
+    def run(command, *, description):
+        commands.append(list(command))
+        if command[0] == "gdal_translate":
+            Path(command[-1]).write_bytes(b"mosaic")
+
+    manager._runner.run = run  # type: ignore[method-assign]
+
+    mosaic = manager.compose_bmng_panels(panel_dir)
+    assert [command[0] for command in commands] == ["gdalbuildvrt", "gdal_translate"]
+
+    assert manager.compose_bmng_panels(panel_dir) == mosaic
+    assert len(commands) == 2
+
+    (panel_dir / "A1.tif").write_bytes(b"changed")
+    manager.compose_bmng_panels(panel_dir)
+    assert len(commands) == 4
+
+
+def test_sidecar_is_replaced_atomically(tmp_path: Path) -> None:
+    manager = _manager(tmp_path)
+    source = tmp_path / "panel.tif"
+    source.write_bytes(b"panel")
+    meta_path = manager._metadata_path_for_output(tmp_path / "output.tif")
+    meta_path.write_text("{truncated", encoding="utf-8")
+
+    manager._record_source_hashes(meta_path, {"bmng_panel": source})
+
+    assert "bmng_panel" in json.loads(meta_path.read_text(encoding="utf-8"))["sources"]
+    assert [path.name for path in tmp_path.iterdir() if path.name.endswith(".tmp")] == []
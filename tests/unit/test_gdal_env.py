@@ -0,0 +1,76 @@
+"""Tests for the GDAL child-process environment."""
+
+from __future__ import annotations
+
+import sys
+
+from planetarble.core.gdal_env import gdal_env, run_gdal_jobs
+from planetarble.core.models import ProcessingConfig
+from planetarble.tiling.manager import TileRunner
+
+
+def test_defaults_fill_only_unset_knobs() -> None:
+    env = gdal_env(base={"VSI_CACHE": "FALSE", "PATH": "/bin"})
+
+    assert env["VSI_CACHE"] == "FALSE"
+    assert env["GDAL_DISABLE_READDIR_ON_OPEN"] == "EMPTY_DIR"
+    assert env["PATH"] == "/bin"
+
+
+def test_processing_config_beats_defaults_but_not_the_environment() -> None:
+    env = gdal_env(ProcessingConfig(gdal_cachemax="4096", gdal_num_threads="4"), base={"GDAL_CACHEMAX": "5%"})
+
+    assert env["GDAL_CACHEMAX"] == "5%"
+    assert env["GDAL_NUM_THREADS"] == "4"
+
+
+def test_bindings_get_the_configured_tuning(monkeypatch) -> None:
+    from planetarble.core import gdal_env as gdal_env_module
+
+    options: dict[str, str] = {}
+
+    class FakeGdal:
+        def SetConfigOption(self, key, value):
+            options[key] = value
+
+    monkeypatch.setattr(gdal_env_module, "_ACTIVE_TUNING", dict(gdal_env_module.GDAL_ENV_DEFAULTS))
+    monkeypatch.setenv("GDAL_NUM_THREADS", "2")
+    monkeypatch.delenv("GDAL_CACHEMAX", raising=False)
+    gdal_env_module._ACTIVE_TUNING.update(gdal_env_module.gdal_tuning(ProcessingConfig(gdal_cachemax="777")))
+    gdal_env_module._apply_tuning(FakeGdal())
+
+    assert options["GDAL_CACHEMAX"] == "777"
+    assert "GDAL_NUM_THREADS" not in options
+
+
+def test_tile_runner_passes_its_environment(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("GDAL_CACHEMAX", raising=False)
+    marker = tmp_path / "env.txt"
+    runner = TileRunner(env=gdal_env(ProcessingConfig(gdal_cachemax="123")))
+
+    runner.run(
+        [sys.executable, "-c", f"import os; open({str(marker)!r}, 'w').write(os.environ['GDAL_CACHEMAX'])"],
+        description="env",
+    )
+
+    assert marker.read_text() == "123"
+
+
+def test_run_gdal_jobs_pins_threads_unless_an_env_is_given() -> None:
+    seen: list[tuple[str, object]] = []
+
+    def run(command, *, description, env=None):  # type: ignore[no-untyped-def]
+        seen.append((command[0], env))
+
+    run_gdal_jobs(run, [(["a"], "a"), (["b"], "b")])
+    run_gdal_jobs(run, [(["c"], "c"), (["d"], "d")], env={"GDAL_NUM_THREADS": "4"})
+    run_gdal_jobs(run, [(["e"], "e"), (["f"], "f")], sequential=True)
+
+    assert sorted(seen, key=lambda item: item[0]) == [
+        ("a", {"GDAL_NUM_THREADS": "1"}),
+        ("b", {"GDAL_NUM_THREADS": "1"}),
+        ("c", {"GDAL_NUM_THREADS": "4"}),
+        ("d", {"GDAL_NUM_THREADS": "4"}),
+        ("e", None),
+        ("f", None),
+    ]
@@ -0,0 +1,58 @@
+import json
+import logging
+
+import pytest
+
+import planetarble.logging as plogging
+
+
+def test_configure_logging_skips_identical_reconfiguration(monkeypatch) -> None:
+    calls: list[dict] = []
+    monkeypatch.setattr(plogging, "_ACTIVE_CONFIG", None)
+    monkeypatch.setattr(plogging, "dictConfig", lambda config: calls.append(config))
+
+    plogging.configure_logging(level="info")
+    plogging.configure_logging(level="INFO")
+    assert len(calls) == 1
+
+    plogging.configure_logging(level="DEBUG")
+    assert len(calls) == 2
+    assert calls[-1]["root"]["level"] == logging.getLevelName(logging.DEBUG)
+
+
+def test_json_formatter_emits_utc_timestamp_and_message() -> None:
+    formatter = plogging.JSONFormatter(datefmt="%Y-%m-%dT%H:%M:%SZ")
+    record = logging.LogRecord("planetarble.test", logging.INFO, __file__, 1, "tile %s", ("0/0/0",), None)
+    record.created = 1_700_000_000.75
+
+    payload = json.loads(formatter.format(record))
+    record.created = 1_700_000_000.9
+    assert json.loads(formatter.format(record))["timestamp"] == payload["timestamp"]
+
+    assert payload == {
+        "timestamp": "2023-11-14T22:13:20Z",
+        "level": "INFO",
+        "logger": "planetarble.test",
+        "message": "tile 0/0/0",
+    }
+
+
+def test_json_formatter_output_does_not_depend_on_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    formatter = plogging.JSONFormatter()
+    record = logging.LogRecord("planetarble.test", logging.INFO, __file__, 1, "東京 tile", (), None)
+    record.created = 1_700_000_000.0
+
+    monkeypatch.setattr(plogging, "orjson", None)
+    line = formatter.format(record)
+
+    assert "東京" in line
+    assert line.startswith('{"timestamp":"')
+
+
+def test_text_and_json_formatters_share_the_utc_clock() -> None:
+    record = logging.LogRecord("planetarble.test", logging.INFO, __file__, 1, "tile", (), None)
+    record.created = 1_700_000_000.0
+    text = plogging.UTCFormatter("%(asctime)s | %(message)s", datefmt="%Y-%m-%dT%H:%M:%SZ").format(record)
+
+    assert text == "2023-11-14T22:13:20Z | tile"
+    assert json.loads(plogging.JSONFormatter(datefmt="%Y-%m-%dT%H:%M:%SZ").format(record))["timestamp"] in text
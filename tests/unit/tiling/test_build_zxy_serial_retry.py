@@ -43,3 +43,19 @@ def test_build_zxy_retries_serially_on_failure(tmp_path: Path) -> None:
     retry_cmd = calls[1][0]
     assert "--num-threads" in retry_cmd
     assert retry_cmd[retry_cmd.index("--num-threads") + 1] == "1"
+
+
+def test_build_zxy_passes_the_configured_thread_count(tmp_path: Path) -> None:
+    mgr = PmtilesTilingManager(
+        ProcessingConfig(gdal_num_threads="6"), temp_dir=tmp_path / "tmp", output_dir=tmp_path / "out"
+    )
+    calls: list = []
+    mgr._runner.run = lambda command, *, description: calls.append(list(command))  # type: ignore[method-assign]
+    source = tmp_path / "in.tif"
+    source.touch()
+
+    mgr.build_zxy(source, min_zoom=0, max_zoom=5, tile_format="PNG", quality=85, resampling="bilinear")
+
+    (command,) = calls
+    assert command.count("--num-threads") == 1
+    assert command[command.index("--num-threads") + 1] == "6"
@@ -0,0 +1,169 @@
+"""Tests for sharded MBTiles generation in ``TilingManager``."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from planetarble.core.models import ProcessingConfig
+from planetarble.tiling import manager as tiling_manager
+from planetarble.tiling.manager import TilingManager
+
+HALF = 20037508.342789244
+
+
+def test_shard_projwins_split_the_world_on_tile_rows() -> None:
+    bands = tiling_manager._shard_projwins(None, 2, 2)
+
+    assert bands == [
+        (-HALF, HALF, HALF, pytest.approx(0.0)),
+        (-HALF, pytest.approx(0.0), HALF, -HALF),
+    ]
+
+
+def test_shard_projwins_snap_a_partial_extent_outward() -> None:
+    span = 2 * HALF / 4
+    bands = tiling_manager._shard_projwins((-10.0, 10.0, 10.0, span + 10.0), 2, 8)
+
+    assert len(bands) == 2
+    assert bands[0][1] == pytest.approx(HALF)
+    assert bands[-1][3] == pytest.approx(0.0)
+    assert bands[0][0] == pytest.approx(-span) and bands[0][2] == pytest.approx(span)
+
+
+def test_raster_extent_reads_the_geotransform(tmp_path: Path, monkeypatch) -> None:
+    class FakeDataset:
+        RasterXSize, RasterYSize = 100, 50
+
+        def GetGeoTransform(self):
+            return (-1000.0, 10.0, 0.0, 500.0, 0.0, -10.0)
+
+    class FakeGdal:
+        def Open(self, path):
+            if not path.endswith("warped.tif"):
+                raise RuntimeError("not found")
+            return FakeDataset()
+
+    monkeypatch.setattr(tiling_manager, "_gdal_bindings", lambda: FakeGdal())
+
+    assert tiling_manager._raster_extent(tmp_path / "warped.tif") == (-1000.0, 0.0, 0.0, 500.0)
+    assert tiling_manager._raster_extent(tmp_path / "missing.tif") is None
+
+
+def _write_part(path: Path, rows: list[tuple[int, int, int, bytes]]) -> None:
+    with sqlite3.connect(str(path)) as conn:
+        conn.execute("CREATE TABLE metadata (name text, value text)")
+        conn.execute("INSERT INTO metadata VALUES ('format', 'png')")
+        conn.execute("CREATE TABLE tiles (zoom_level integer, tile_column integer, tile_row integer, tile_data blob)")
+        conn.executemany("INSERT INTO tiles VALUES (?, ?, ?, ?)", rows)
+
+
+def test_parallel_mbtiles_merges_every_band(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(tiling_manager, "_raster_extent", lambda path: (-HALF, -HALF, HALF, HALF))
+    # max_zoom 2 gives two rows of the 512px tiles gdal_translate writes, one per band.
+    manager = TilingManager(
+        ProcessingConfig(min_zoom=0, max_zoom=2), temp_dir=tmp_path / "tmp", output_dir=tmp_path / "out"
+    )
+    translates: list[list[str]] = []
+
+    def fake_run(command, *, description, **_):
+        if command[0] == "gdalwarp":
+            Path(command[-1]).touch()
+        elif command[0] == "gdal_translate":
+            translates.append(list(command))
+            row = 1 if float(command[command.index("-projwin") + 2]) > 0 else 0
+            _write_part(Path(command[-1]), [(1, 0, row, b"a"), (1, 1, row, b"b")])
+
+    manager._runner.run = fake_run  # type: ignore[method-assign]
+    source = tmp_path / "planet.tif"
+    source.write_bytes(b"raster")
+
+    output = manager.create_mbtiles_parallel(source, 2, destination=tmp_path / "planet.mbtiles")
+
+    assert len(translates) == 2
+    for command in translates:
+        assert command[command.index("GDAL_CACHEMAX") + 1] == "25%"
+        assert "GDAL_SWATH_SIZE" in command
+    with sqlite3.connect(str(output)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM tiles").fetchone()[0] == 4
+        bounds = dict(conn.execute("SELECT name, value FROM metadata"))["bounds"]
+    assert bounds.startswith("-180.000000,")
+    assert not list((tmp_path / "tmp").glob("*_part*.mbtiles"))
+
+
+def test_gdal_translate_runs_in_process_with_bindings(tmp_path: Path, monkeypatch) -> None:
+    import contextlib
+
+    calls: list[tuple] = []
+
+    class FakeGdal:
+        def VersionInfo(self, request):
+            return "3080000"
+
+        def TranslateOptions(self, **kwargs):
+            return kwargs
+
+        @contextlib.contextmanager
+        def config_options(self, options, thread_local=False):
+            calls.append(("config", options, thread_local))
+            yield
+
+        def Translate(self, destination, source, options):
+            calls.append(("translate", destination, source, options))
+            return object()
+
+    monkeypatch.setattr(tiling_manager, "_gdal_bindings", lambda: FakeGdal())
+    manager = TilingManager(
+        ProcessingConfig(min_zoom=0, max_zoom=1), temp_dir=tmp_path / "tmp", output_dir=tmp_path / "out"
+    )
+    manager._runner.run = lambda command, *, description: pytest.fail("no subprocess expected")  # type: ignore[method-assign]
+
+    manager._run_gdal_translate(
+        tmp_path / "warped.tif", tmp_path / "part.mbtiles", "PNG", "90", projwin=(0.0, 1.0, 1.0, 0.0), num_threads="4"
+    )
+
+    assert calls[0] == ("config", {"GDAL_NUM_THREADS": "4", "GDAL_SWATH_SIZE": "500000000"}, True)
+    _, destination, source, options = calls[1]
+    assert (destination, source) == (str(tmp_path / "part.mbtiles"), str(tmp_path / "warped.tif"))
+    assert options["format"] == "MBTILES"
+    assert "TILE_FORMAT=PNG" in options["creationOptions"]
+    assert options["projWin"] == [0.0, 1.0, 1.0, 0.0]
+
+
+def test_cache_share_splits_percent_and_megabytes() -> None:
+    assert tiling_manager._cache_share("50%", 2) == "25%"
+    assert tiling_manager._cache_share("2048", 4) == "512"
+    assert tiling_manager._cache_share("10%", 32) == "1%"
+
+
+def test_shard_projwins_follow_the_512px_mbtiles_grid() -> None:
+    # max_zoom 3 has 8 rows of 256px tiles but only 4 rows of 512px MBTiles tiles.
+    span = 2 * HALF / 4
+    bands = tiling_manager._shard_projwins(None, 3, 8, tile_size=512)
+
+    assert len(bands) == 4
+    for index, band in enumerate(bands):
+        assert band[1] == pytest.approx(HALF - index * span)
+        assert band[3] == pytest.approx(HALF - (index + 1) * span)
+
+
+def test_gdal_translate_uses_the_cli_before_gdal_3_7(tmp_path: Path, monkeypatch) -> None:
+    class OldGdal:
+        def VersionInfo(self, request):
+            return "3060000"
+
+        def config_options(self, options):  # pragma: no cover - must not be called
+            pytest.fail("thread_local config_options needs GDAL 3.7")
+
+    monkeypatch.setattr(tiling_manager, "_gdal_bindings", lambda: OldGdal())
+    manager = TilingManager(
+        ProcessingConfig(min_zoom=0, max_zoom=1), temp_dir=tmp_path / "tmp", output_dir=tmp_path / "out"
+    )
+    commands: list[list[str]] = []
+    manager._runner.run = lambda command, *, description: commands.append(list(command))  # type: ignore[method-assign]
+
+    manager._run_gdal_translate(tmp_path / "warped.tif", tmp_path / "part.mbtiles", "PNG", "90")
+
+    assert commands[0][0] == "gdal_translate"
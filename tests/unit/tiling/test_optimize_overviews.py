@@ -0,0 +1,87 @@
+"""Tests for ``TilingManager.optimize_overviews``."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from planetarble.core.models import ProcessingConfig
+from planetarble.tiling.manager import TilingManager
+
+
+def test_overviews_take_thread_and_cache_settings_from_the_runner(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("GDAL_NUM_THREADS", raising=False)
+    monkeypatch.delenv("GDAL_CACHEMAX", raising=False)
+    config = ProcessingConfig(min_zoom=0, max_zoom=3, gdal_num_threads="6", gdal_cachemax="2048")
+    manager = TilingManager(config, temp_dir=tmp_path / "tmp", output_dir=tmp_path / "out")
+    commands: list[list[str]] = []
+    manager._runner.run = lambda command, *, description: commands.append(list(command))  # type: ignore[method-assign]
+
+    manager.optimize_overviews(tmp_path / "planet.mbtiles")
+
+    assert commands == [
+        ["gdaladdo", "-r", config.resampling.lower(), str(tmp_path / "planet.mbtiles"), "2", "4", "8"]
+    ]
+    assert manager._runner._env["GDAL_NUM_THREADS"] == "6"  # type: ignore[attr-defined]
+    assert manager._runner._env["GDAL_CACHEMAX"] == "2048"  # type: ignore[attr-defined]
+
+
+def _write_mbtiles(path: Path, rows: list[tuple[int, int, int, bytes]]) -> None:
+    with sqlite3.connect(str(path)) as conn:
+        conn.execute("CREATE TABLE metadata (name text, value text)")
+        conn.execute("INSERT INTO metadata VALUES ('minzoom', '3')")
+        conn.execute("CREATE TABLE tiles (zoom_level integer, tile_column integer, tile_row integer, tile_data blob)")
+        conn.executemany("INSERT INTO tiles VALUES (?, ?, ?, ?)", rows)
+
+
+def test_overviews_split_levels_across_workers_and_merge_back(tmp_path: Path) -> None:
+    config = ProcessingConfig(min_zoom=0, max_zoom=3)
+    manager = TilingManager(config, temp_dir=tmp_path / "tmp", output_dir=tmp_path / "out")
+    mbtiles = tmp_path / "planet.mbtiles"
+    _write_mbtiles(mbtiles, [(3, 0, 0, b"base")])
+    buckets: dict[str, list[str]] = {}
+    envs: list[dict[str, str]] = []
+
+    def fake_run(command, *, description, env=None):  # type: ignore[no-untyped-def]
+        envs.append(env)
+        target = command[command.index("-r") + 2]
+        levels = command[command.index("-r") + 3 :]
+        buckets[Path(target).name] = levels
+        with sqlite3.connect(target) as conn:
+            conn.executemany(
+                "INSERT INTO tiles VALUES (?, 0, 0, ?)",
+                [(3 - int(level).bit_length() + 1, f"z{level}".encode()) for level in levels],
+            )
+
+    manager._runner.run = fake_run  # type: ignore[method-assign]
+
+    manager.optimize_overviews(mbtiles, workers=2)
+
+    assert sorted(buckets.values()) == [["2", "8"], ["4"]]
+    assert all(set(env) == {"GDAL_NUM_THREADS", "GDAL_CACHEMAX"} for env in envs)
+    with sqlite3.connect(str(mbtiles)) as conn:
+        zooms = dict(conn.execute("SELECT zoom_level, tile_data FROM tiles"))
+        minzoom = dict(conn.execute("SELECT name, value FROM metadata"))["minzoom"]
+    assert zooms == {3: b"base", 2: b"z2", 1: b"z4", 0: b"z8"}
+    assert minzoom == "0"
+    assert not list(tmp_path.glob("*.ovr*"))
+
+
+def test_overview_buckets_are_capped_by_free_space(tmp_path: Path, monkeypatch) -> None:
+    import shutil
+
+    from planetarble.tiling import manager as tiling_manager
+
+    config = ProcessingConfig(min_zoom=0, max_zoom=3)
+    manager = TilingManager(config, temp_dir=tmp_path / "tmp", output_dir=tmp_path / "out")
+    mbtiles = tmp_path / "planet.mbtiles"
+    mbtiles.write_bytes(b"x" * 1000)
+    usage = shutil.disk_usage(tmp_path)
+    monkeypatch.setattr(tiling_manager.shutil, "disk_usage", lambda path: usage._replace(free=1000))
+    commands: list[list[str]] = []
+    manager._runner.run = lambda command, *, description, **_: commands.append(list(command))  # type: ignore[method-assign]
+
+    manager.optimize_overviews(mbtiles, workers=3)
+
+    assert commands == [["gdaladdo", "-r", config.resampling.lower(), str(mbtiles), "2", "4", "8"]]
+    assert not list(tmp_path.glob("*.ovr*"))
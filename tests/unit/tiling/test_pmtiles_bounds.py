@@ -0,0 +1,34 @@
+"""Tests for PMTiles metadata bounds lookup."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from planetarble.core.models import ProcessingConfig
+from planetarble.tiling import pmtiles
+from planetarble.tiling.pmtiles import PmtilesTilingManager
+
+
+def test_bounds_come_from_gdal_info_and_are_memoised(tmp_path: Path, monkeypatch) -> None:
+    calls: list[str] = []
+
+    class FakeGdal:
+        def Info(self, path, *, format):
+            calls.append(path)
+            return {
+                "cornerCoordinates": {
+                    "upperLeft": {"lon": 130.0, "lat": 40.0},
+                    "lowerRight": {"lon": 140.0, "lat": 30.0},
+                }
+            }
+
+    monkeypatch.setattr(pmtiles, "_gdal_bindings", lambda: FakeGdal())
+    source = tmp_path / "japan.tif"
+    source.write_bytes(b"raster")
+    mgr = PmtilesTilingManager(ProcessingConfig(), temp_dir=tmp_path / "tmp", output_dir=tmp_path / "out")
+
+    first = mgr._determine_bounds(source, mode="auto")
+    second = mgr._determine_bounds(source, mode="auto")
+
+    assert first == second == (130.0, 30.0, 140.0, 40.0)
+    assert calls == [str(source)]
@@ -1,4 +1,6 @@
 import json
+import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -52,6 +54,19 @@ def test_build_zxy_invokes_gdal_raster_tile(manager: PmtilesTilingManager, tmp_p
     assert zxy_dir.name.endswith("zxy")
 
 
+def test_build_zxy_adds_alpha_in_the_tiler(manager: PmtilesTilingManager, tmp_path: Path) -> None:
+    source = tmp_path / "input.tif"
+    source.touch()
+
+    manager.build_zxy(
+        source, min_zoom=0, max_zoom=1, tile_format="WEBP", quality=80, resampling="cubic", add_alpha=True
+    )
+
+    (cmd, _), = manager._runner.calls  # type: ignore[attr-defined]
+    assert "--add-alpha" in cmd
+    assert cmd[cmd.index("-i") + 1] == str(source)
+
+
 def test_pack_mbtiles_writes_metadata(manager: PmtilesTilingManager, tmp_path: Path) -> None:
     source = tmp_path / "input.tif"
     source.touch()
@@ -84,7 +99,68 @@ def test_pack_mbtiles_writes_metadata(manager: PmtilesTilingManager, tmp_path: P
     assert mbtiles.suffix == ".mbtiles"
 
 
-def test_convert_and_verify(manager: PmtilesTilingManager, tmp_path: Path) -> None:
+def test_pack_mbtiles_skips_mb_util_for_unchanged_tiles(manager: PmtilesTilingManager, tmp_path: Path) -> None:
+    source = tmp_path / "input.tif"
+    source.touch()
+    zxy_dir = tmp_path / "tiles"
+    (zxy_dir / "0" / "0").mkdir(parents=True)
+    (zxy_dir / "0" / "0" / "0.png").write_bytes(b"tile")
+    manager._determine_bounds = lambda *args, **kwargs: (-10.0, -5.0, 10.0, 5.0)  # type: ignore[attr-defined]
+    stub_runner = manager._runner  # type: ignore[attr-defined]
+
+    def run(command, *, description: str) -> None:  # type: ignore[no-untyped-def]
+        stub_runner.calls.append((tuple(command), description))
+        Path(command[2]).write_bytes(b"mbtiles")
+
+    stub_runner.run = run
+    kwargs = dict(source_path=source, tile_format="PNG", min_zoom=0, max_zoom=0, name="Test", attribution="")
+
+    first = manager.pack_mbtiles(zxy_dir, **kwargs)
+    second = manager.pack_mbtiles(zxy_dir, **kwargs)
+    assert first == second
+    assert len(stub_runner.calls) == 1
+
+    manager.pack_mbtiles(zxy_dir, **{**kwargs, "name": "Renamed"})
+    assert len(stub_runner.calls) == 2
+
+    (zxy_dir / "0" / "0" / "1.png").write_bytes(b"tile")
+    manager.pack_mbtiles(zxy_dir, **{**kwargs, "name": "Renamed"})
+    assert len(stub_runner.calls) == 3
+
+
+def test_build_zxy_and_pack_skip_unchanged_sources(manager: PmtilesTilingManager, tmp_path: Path) -> None:
+    source = tmp_path / "input.tif"
+    source.write_bytes(b"raster")
+    manager._determine_bounds = lambda *args, **kwargs: (-10.0, -5.0, 10.0, 5.0)  # type: ignore[attr-defined]
+    stub_runner = manager._runner  # type: ignore[attr-defined]
+
+    def run(command, *, description: str) -> None:  # type: ignore[no-untyped-def]
+        stub_runner.calls.append((tuple(command), description))
+        if command[0] == "gdal":
+            tile = Path(command[command.index("-o") + 1]) / "0" / "0" / "0.png"
+            tile.parent.mkdir(parents=True)
+            tile.write_bytes(b"tile")
+        else:
+            Path(command[2]).write_bytes(b"mbtiles")
+
+    stub_runner.run = run
+    tile_kwargs = dict(min_zoom=0, max_zoom=0, tile_format="PNG", quality=90, resampling="near")
+    pack_kwargs = dict(source_path=source, tile_format="PNG", min_zoom=0, max_zoom=0, name="Test", attribution="")
+
+    for _ in range(2):
+        zxy_dir = manager.build_zxy(source, **tile_kwargs)
+        manager.pack_mbtiles(zxy_dir, **pack_kwargs)
+    assert [call[0][0] for call in stub_runner.calls] == ["gdal", "mb-util"]
+
+    source.write_bytes(b"changed raster")
+    manager.build_zxy(source, **tile_kwargs)
+    assert [call[0][0] for call in stub_runner.calls] == ["gdal", "mb-util", "gdal"]
+
+
+def test_convert_and_verify(
+    monkeypatch: pytest.MonkeyPatch, manager: PmtilesTilingManager, tmp_path: Path
+) -> None:
+    monkeypatch.setattr("planetarble.tiling.pmtiles._pmtiles_module", lambda: None)
     stub_runner = manager._runner  # type: ignore[attr-defined]
     mbtiles = tmp_path / "test.mbtiles"
     mbtiles.touch()
@@ -96,6 +172,54 @@ def test_convert_and_verify(manager: PmtilesTilingManager, tmp_path: Path) -> No
     assert any(call[0][0] == "pmtiles" and call[0][1] == "verify" for call in stub_runner.calls)
 
 
+def test_pack_and_convert_uses_scratch_and_drops_mbtiles(
+    manager: PmtilesTilingManager, tmp_path: Path
+) -> None:
+    source = tmp_path / "input.tif"
+    source.touch()
+    zxy_dir = tmp_path / "tiles"
+    zxy_dir.mkdir()
+    scratch = tmp_path / "shm"
+    manager._determine_bounds = lambda *args, **kwargs: (-10.0, -5.0, 10.0, 5.0)  # type: ignore[attr-defined]
+    stub_runner = manager._runner  # type: ignore[attr-defined]
+
+    def run(command, *, description: str) -> None:  # type: ignore[no-untyped-def]
+        stub_runner.calls.append((tuple(command), description))
+        if command[0] == "mb-util":
+            Path(command[2]).touch()
+
+    stub_runner.run = run
+
+    pmtiles_path = manager.pack_and_convert(
+        zxy_dir,
+        source_path=source,
+        tile_format="PNG",
+        min_zoom=0,
+        max_zoom=2,
+        name="Test",
+        attribution="Test Attribution",
+        scratch_dir=scratch,
+    )
+
+    pack_cmd = stub_runner.calls[0][0]
+    convert_cmd = stub_runner.calls[1][0]
+    assert Path(pack_cmd[2]).parent == scratch
+    assert convert_cmd[:3] == ("pmtiles", "convert", pack_cmd[2])
+    assert pmtiles_path == tmp_path / "out" / "input_0-2.pmtiles"
+    assert not Path(pack_cmd[2]).exists()
+
+
+@pytest.mark.skipif(not os.access("/dev/shm", os.W_OK), reason="needs a writable /dev/shm")
+def test_memory_scratch_dir_requires_room(monkeypatch: pytest.MonkeyPatch) -> None:
+    from planetarble.tiling import pmtiles
+
+    usage = shutil.disk_usage("/dev/shm")
+    monkeypatch.setattr(pmtiles.shutil, "disk_usage", lambda path: usage._replace(free=1000))
+
+    assert pmtiles._memory_scratch_dir(100) == Path("/dev/shm")
+    assert pmtiles._memory_scratch_dir(1000) is None
+
+
 def test_show_header(monkeypatch: pytest.MonkeyPatch, manager: PmtilesTilingManager, tmp_path: Path) -> None:
     header = {"tile_type": "jpg", "min_zoom": 0}
 
@@ -111,3 +235,147 @@ def test_show_header(monkeypatch: pytest.MonkeyPatch, manager: PmtilesTilingMana
     pmtiles = tmp_path / "test.pmtiles"
     data = manager.show_header(pmtiles)
     assert data == header
+
+
+def test_direct_zxy_to_pmtiles_writes_archive(manager: PmtilesTilingManager, tmp_path: Path) -> None:
+    pytest.importorskip("pmtiles")
+    from pmtiles.reader import MmapSource, Reader
+
+    source = tmp_path / "input.tif"
+    source.touch()
+    zxy_dir = tmp_path / "tiles"
+    for z, x, y in [(0, 0, 0), (1, 1, 0), (1, 0, 1)]:
+        (zxy_dir / str(z) / str(x)).mkdir(parents=True, exist_ok=True)
+        (zxy_dir / str(z) / str(x) / f"{y}.png").write_bytes(f"tile-{z}-{x}-{y}".encode())
+    manager._determine_bounds = lambda *args, **kwargs: (-10.0, -5.0, 10.0, 5.0)  # type: ignore[attr-defined]
+
+    pmtiles_path = manager.direct_zxy_to_pmtiles(
+        zxy_dir,
+        source_path=source,
+        tile_format="PNG",
+        min_zoom=0,
+        max_zoom=1,
+        name="Test",
+        attribution="Test Attribution",
+    )
+
+    assert manager._runner.calls == []  # type: ignore[attr-defined]
+    with pmtiles_path.open("rb") as handle:
+        reader = Reader(MmapSource(handle))
+        assert reader.get(1, 0, 1) == b"tile-1-0-1"
+        assert reader.header()["max_zoom"] == 1
+        assert reader.header()["clustered"]
+
+    manager.verify(pmtiles_path)
+    header = manager.show_header(pmtiles_path)
+    assert manager._runner.calls == []  # type: ignore[attr-defined]
+    assert header["maxzoom"] == 1
+    assert header["tile_type"] == "png"
+    assert header["bounds"] == [-10.0, -5.0, 10.0, 5.0]
+
+
+def test_direct_zxy_to_pmtiles_rounds_e7_coordinates(
+    monkeypatch: pytest.MonkeyPatch, manager: PmtilesTilingManager, tmp_path: Path
+) -> None:
+    from types import SimpleNamespace
+
+    written: dict[str, object] = {"tiles": []}
+
+    class FakeWriter:
+        def __init__(self, handle) -> None:  # type: ignore[no-untyped-def]
+            self.handle = handle
+
+        def write_tile(self, tile_id: int, data: bytes) -> None:
+            written["tiles"].append((tile_id, data))  # type: ignore[union-attr]
+
+        def finalize(self, header, metadata) -> None:  # type: ignore[no-untyped-def]
+            written["header"] = header
+
+    fake_tile = SimpleNamespace(
+        TileType=SimpleNamespace(PNG="png"),
+        Compression=SimpleNamespace(NONE="none"),
+        zxy_to_tileid=lambda z, x, y: (4**z - 1) // 3 + x * 2**z + y,
+    )
+    monkeypatch.setattr(
+        "planetarble.tiling.pmtiles._pmtiles_module",
+        lambda: (fake_tile, SimpleNamespace(Writer=FakeWriter), None),
+    )
+    source = tmp_path / "input.tif"
+    source.touch()
+    zxy_dir = tmp_path / "tiles"
+    (zxy_dir / "0" / "0").mkdir(parents=True)
+    (zxy_dir / "0" / "0" / "0.png").write_bytes(b"tile")
+    # 94.958863 * 1e7 is 949588629.9999999 in binary floating point.
+    manager._determine_bounds = lambda *args, **kwargs: (-94.958863, -5.0, 94.958863, 5.0)  # type: ignore[attr-defined]
+
+    manager.direct_zxy_to_pmtiles(
+        zxy_dir, source_path=source, tile_format="PNG", min_zoom=0, max_zoom=0, name="Test", attribution=""
+    )
+
+    header = written["header"]
+    assert header["min_lon_e7"] == -949_588_630  # type: ignore[index]
+    assert header["max_lon_e7"] == 949_588_630  # type: ignore[index]
+    assert header["tile_type"] == "png"  # type: ignore[index]
+    assert written["tiles"] == [(0, b"tile")]
+
+
+def test_canonicalize_uniform_tiles_hardlinks_identical_colours(
+    manager: PmtilesTilingManager, tmp_path: Path
+) -> None:
+    Image = pytest.importorskip("PIL.Image")
+
+    zxy_dir = tmp_path / "tiles"
+    (zxy_dir / "1" / "0").mkdir(parents=True)
+    blue_a = zxy_dir / "1" / "0" / "0.png"
+    blue_b = zxy_dir / "1" / "0" / "1.png"
+    mixed = zxy_dir / "1" / "0" / "2.png"
+    Image.new("RGB", (8, 8), (0, 0, 255)).save(blue_a)
+    Image.new("RGB", (8, 8), (0, 0, 255)).save(blue_b, compress_level=1)
+    gradient = Image.new("RGB", (8, 8), (0, 0, 255))
+    gradient.putpixel((0, 0), (255, 0, 0))
+    gradient.save(mixed)
+
+    replaced = manager._canonicalize_uniform_tiles(zxy_dir)  # type: ignore[attr-defined]
+
+    assert replaced == 1
+    assert blue_a.samefile(blue_b)
+    assert not mixed.samefile(blue_a)
+    assert not list(zxy_dir.rglob("*.canonical"))
+
+
+def test_canonicalize_uniform_tiles_keeps_palette_tiles_with_different_colours(
+    manager: PmtilesTilingManager, tmp_path: Path
+) -> None:
+    Image = pytest.importorskip("PIL.Image")
+
+    zxy_dir = tmp_path / "tiles"
+    (zxy_dir / "1" / "0").mkdir(parents=True)
+    tiles = []
+    for y, colour in enumerate(((0, 0, 255), (255, 0, 0), (0, 0, 255))):
+        tile = Image.new("P", (8, 8), 0)
+        tile.putpalette(colour)
+        tiles.append(zxy_dir / "1" / "0" / f"{y}.png")
+        tile.save(tiles[-1])
+
+    replaced = manager._canonicalize_uniform_tiles(zxy_dir)  # type: ignore[attr-defined]
+
+    assert replaced == 1
+    assert tiles[2].samefile(tiles[0])
+    assert not tiles[1].samefile(tiles[0])
+
+
+def test_build_zxy_canonicalizes_only_when_enabled(tmp_path: Path) -> None:
+    seen: list[Path] = []
+    for enabled in (False, True):
+        mgr = PmtilesTilingManager(
+            ProcessingConfig(canonicalize_uniform_tiles=enabled),
+            temp_dir=tmp_path / f"tmp{enabled}",
+            output_dir=tmp_path / "out",
+        )
+        mgr._runner = StubRunner()  # type: ignore[attr-defined]
+        mgr._canonicalize_uniform_tiles = seen.append  # type: ignore[method-assign]
+        source = tmp_path / "input.tif"
+        source.touch()
+        mgr.build_zxy(source, min_zoom=0, max_zoom=0, tile_format="PNG", quality=90, resampling="near")
+
+    assert len(seen) == 1
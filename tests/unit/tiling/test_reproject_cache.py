@@ -0,0 +1,104 @@
+"""Tests for build-key reuse in ``TilingManager``."""
+
+from __future__ import annotations
+
+import os
+
+from planetarble.core.models import ProcessingConfig
+from planetarble.tiling import manager as tiling_manager
+from planetarble.tiling.manager import TilingManager
+
+
+def _manager(tmp_path, commands):
+    manager = TilingManager(ProcessingConfig(), temp_dir=tmp_path / "tmp", output_dir=tmp_path / "out")
+
+    def fake_run(command, *, description):
+        commands.append(command)
+        open(command[-1], "w").close()
+
+    manager._runner.run = fake_run
+    return manager
+
+
+def test_reproject_reuses_output_for_unchanged_input(tmp_path) -> None:
+    source = tmp_path / "input.tif"
+    source.write_bytes(b"raster")
+    commands: list = []
+    manager = _manager(tmp_path, commands)
+
+    first = manager.reproject_to_webmercator(source)
+    second = manager.reproject_to_webmercator(source)
+
+    assert first == second
+    assert len(commands) == 1
+    assert first.with_name(first.name + ".key").exists()
+
+
+def test_reproject_reruns_when_input_changes(tmp_path) -> None:
+    source = tmp_path / "input.tif"
+    source.write_bytes(b"raster")
+    commands: list = []
+    manager = _manager(tmp_path, commands)
+
+    manager.reproject_to_webmercator(source)
+    source.write_bytes(b"raster, updated")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    manager.reproject_to_webmercator(source)
+
+    assert len(commands) == 2
+
+
+def test_reproject_warps_in_process_when_bindings_exist(tmp_path, monkeypatch) -> None:
+    calls: list = []
+
+    class FakeGdal:
+        def WarpOptions(self, **kwargs):
+            return kwargs
+
+        def Warp(self, destination, source, *, options):
+            calls.append((destination, source, options))
+            open(destination, "w").close()
+            return object()
+
+    monkeypatch.setattr(tiling_manager, "_gdal_bindings", lambda: FakeGdal())
+    source = tmp_path / "input.tif"
+    source.write_bytes(b"raster")
+    commands: list = []
+    manager = _manager(tmp_path, commands)
+
+    output = manager.reproject_to_webmercator(source)
+
+    assert commands == []
+    assert [(destination, src) for destination, src, _ in calls] == [(str(output), str(source))]
+    assert calls[0][2]["format"] == "COG"
+    assert "TILING_SCHEME=GoogleMapsCompatible" in calls[0][2]["creationOptions"]
+    assert calls[0][2]["dstSRS"] == "EPSG:3857"
+    assert output.with_name(output.name + ".key").exists()
+
+
+def test_tool_probes_run_once_per_process(tmp_path, monkeypatch) -> None:
+    probes: list[str] = []
+    TilingManager._resolve_gdal2mbtiles.cache_clear()
+    monkeypatch.setattr(tiling_manager.shutil, "which", lambda name: probes.append(name) or None)
+
+    _manager(tmp_path / "a", [])
+    _manager(tmp_path / "b", [])
+
+    assert probes == ["gdal2mbtiles"]
+    TilingManager._resolve_gdal2mbtiles.cache_clear()
+
+
+def test_reproject_runs_the_warp_kernel_on_all_cores(tmp_path) -> None:
+    source = tmp_path / "input.tif"
+    source.write_bytes(b"raster")
+    commands: list = []
+
+    _manager(tmp_path, commands).reproject_to_webmercator(source)
+
+    command = commands[0]
+    assert command[command.index("-wo") + 1] == "NUM_THREADS=ALL_CPUS"
+    assert command[command.index("-wm") + 1] == "1024"
+    assert "-multi" in command
+    assert command[command.index("-of") + 1] == "COG"
+    assert command[-1].endswith("_3857.tif")
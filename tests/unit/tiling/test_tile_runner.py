@@ -0,0 +1,47 @@
+"""Tests for ``TileRunner`` command execution."""
+
+from __future__ import annotations
+
+import logging
+import sys
+
+import pytest
+
+from planetarble.tiling.manager import TileCommandError, TileRunner
+
+
+def test_output_is_streamed_to_the_debug_log(caplog) -> None:
+    caplog.set_level(logging.DEBUG, logger="planetarble.tiling.manager")
+
+    TileRunner().run(
+        [sys.executable, "-c", "import sys; print('10...20'); print('done', file=sys.stderr)"],
+        description="echo",
+    )
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert "10...20" in messages
+    assert "done" in messages
+
+
+def test_failure_quotes_the_output_tail() -> None:
+    script = "import sys; [print(i) for i in range(200)]; sys.exit(3)"
+
+    with pytest.raises(TileCommandError) as excinfo:
+        TileRunner().run([sys.executable, "-c", script], description="fail")
+
+    message = str(excinfo.value)
+    assert message.rstrip().endswith("199")
+    assert "\n149\n" not in message
+
+
+def test_run_many_runs_jobs_concurrently_and_raises_the_first_failure(tmp_path) -> None:
+    marker = tmp_path / "threads.txt"
+    script = f"import os; open({str(marker)!r}, 'a').write(os.environ['GDAL_NUM_THREADS'] + '\\n')"
+    ok = [sys.executable, "-c", script]
+    fail = [sys.executable, "-c", script + "; raise SystemExit(2)"]
+
+    with pytest.raises(TileCommandError) as excinfo:
+        TileRunner(env={}).run_many([(ok, "ok"), (fail, "fail"), (ok, "ok")], max_workers=3)
+
+    assert "SystemExit(2)" in str(excinfo.value)
+    assert marker.read_text().split() == ["1", "1", "1"]